@@ -0,0 +1,62 @@
+"""
+Delivery backends of appointment reminders, selected by the
+``REMINDER_BACKEND`` setting in the same way as Django's email backends.
+"""
+import sys
+import threading
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+# Reminders delivered by LocMemBackend, for tests.
+outbox = []
+
+
+class BaseReminderBackend:
+
+    def send_messages(self, reminders):
+        """
+        Delivers ``reminders`` and returns the ones that were delivered.
+        The others stay due and are retried by the next dispatch.
+        """
+        raise NotImplementedError
+
+
+class ConsoleBackend(BaseReminderBackend):
+    """Writes the reminders to standard output."""
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+        self._lock = threading.Lock()
+
+    def format(self, reminder):
+        client = reminder.appointment.client
+        return f"[{client.phone or client.email}] {reminder.render()}\n"
+
+    def send_messages(self, reminders):
+        with self._lock:
+            for reminder in reminders:
+                self.stream.write(self.format(reminder))
+            self.stream.flush()
+        return list(reminders)
+
+
+class FileBackend(ConsoleBackend):
+    """Appends the reminders to ``REMINDER_FILE_PATH``."""
+
+    def send_messages(self, reminders):
+        with open(settings.REMINDER_FILE_PATH, "a", encoding="utf-8") as stream:
+            self.stream = stream
+            return super().send_messages(reminders)
+
+
+class LocMemBackend(BaseReminderBackend):
+    """Keeps the reminders in ``appointments.backends.outbox``."""
+
+    def send_messages(self, reminders):
+        outbox.extend(reminders)
+        return list(reminders)
+
+
+def get_backend(path=None):
+    return import_string(path or settings.REMINDER_BACKEND)()
@@ -0,0 +1,38 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from appointments.backends import get_backend
+from appointments.reminders import dispatch_batch
+
+
+class Command(BaseCommand):
+    help = (
+        "Sends the due appointment reminders in batches. Several dispatchers "
+        "can run at once without sending a reminder twice."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=100)
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep running, polling for due reminders every --interval seconds.",
+        )
+        parser.add_argument("--interval", type=float, default=30)
+        parser.add_argument("--backend", help="Overrides the REMINDER_BACKEND setting.")
+
+    def handle(self, *args, **options):
+        backend = get_backend(options["backend"])
+        batch_size = options["batch_size"]
+        total = 0
+        while True:
+            sent = dispatch_batch(backend, batch_size)
+            total += sent
+            if sent:
+                self.stdout.write(f"{sent} reminders sent.")
+            if sent < batch_size:
+                if not options["loop"]:
+                    break
+                time.sleep(options["interval"])
+        self.stdout.write(self.style.SUCCESS(f"{total} reminders sent in total."))
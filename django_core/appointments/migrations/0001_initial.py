@@ -0,0 +1,60 @@
+# Generated by Django 5.1.15 on 2026-10-18 08:47
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+def add_no_overlap_constraint(apps, schema_editor):
+    # Scheduled appointments of a profile must not overlap. PostgreSQL can
+    # enforce it with a GiST exclusion constraint on the time range; other
+    # databases rely on the check in appointments.scheduling.schedule().
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    schema_editor.execute(
+        "ALTER TABLE appointments_appointment ADD CONSTRAINT appointment_no_overlap "
+        "EXCLUDE USING gist (user_id WITH =, tstzrange(starts_at, ends_at, '[)') WITH &&) "
+        "WHERE (status = 'scheduled')"
+    )
+
+
+def remove_no_overlap_constraint(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "ALTER TABLE appointments_appointment DROP CONSTRAINT IF EXISTS appointment_no_overlap"
+    )
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('authentication', '0001_initial'),
+        ('clients', '0003_remove_client_client_user_created_idx_and_more'),
+        ('services', '0004_service_material_cost'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Appointment',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('starts_at', models.DateTimeField()),
+                ('ends_at', models.DateTimeField()),
+                ('status', models.CharField(choices=[('scheduled', 'Scheduled'), ('cancelled', 'Cancelled')], default='scheduled', max_length=20)),
+                ('notes', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('client', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='clients.client')),
+                ('service', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='services.service')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='authentication.profile')),
+            ],
+            options={
+                'indexes': [models.Index(condition=models.Q(('status', 'scheduled')), fields=['user', 'starts_at'], name='appointment_user_busy_idx')],
+            },
+        ),
+        migrations.RunPython(add_no_overlap_constraint, remove_no_overlap_constraint),
+    ]
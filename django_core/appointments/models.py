@@ -0,0 +1,89 @@
+from django.db import models
+from django.utils import timezone
+from uuid import uuid4
+from django.core.exceptions import ValidationError
+
+
+class Appointment(models.Model):
+    """
+    A service booked for a client. Scheduled appointments of a profile never
+    overlap, see ``appointments.scheduling``.
+    """
+
+    STATUS_SCHEDULED = "scheduled"
+    STATUS_CANCELLED = "cancelled"
+    STATUS_CHOICES = [
+        (STATUS_SCHEDULED, "Scheduled"),
+        (STATUS_CANCELLED, "Cancelled"),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
+    user = models.ForeignKey('authentication.Profile', on_delete=models.CASCADE)
+    client = models.ForeignKey('clients.Client', on_delete=models.CASCADE)
+    service = models.ForeignKey('services.Service', on_delete=models.CASCADE)
+    starts_at = models.DateTimeField()
+    ends_at = models.DateTimeField()
+    status = models.CharField(
+        max_length=20, choices=STATUS_CHOICES, default=STATUS_SCHEDULED
+    )
+    notes = models.TextField(blank=True, default="")
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["user", "starts_at"],
+                condition=models.Q(status="scheduled"),
+                name="appointment_user_busy_idx",
+            ),
+        ]
+
+    def clean(self):
+        if self.status not in dict(self.STATUS_CHOICES):
+            raise ValidationError("Invalid status.")
+        if self.starts_at is None or self.ends_at is None:
+            raise ValidationError("Start and end times are required.")
+        if self.ends_at <= self.starts_at:
+            raise ValidationError("End time must be after start time.")
+
+    def __str__(self):
+        return f"{self.starts_at} {self.service_id}"
+
+
+class Reminder(models.Model):
+    """
+    A message to send to the client of an appointment at ``send_at``. It is
+    delivered by the ``dispatch_reminders`` command, see
+    ``appointments.reminders``.
+    """
+
+    user = models.ForeignKey('authentication.Profile', on_delete=models.CASCADE)
+    appointment = models.ForeignKey(
+        Appointment, on_delete=models.CASCADE, related_name="reminders"
+    )
+    send_at = models.DateTimeField()
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["send_at"],
+                condition=models.Q(sent_at__isnull=True),
+                name="reminder_due_idx",
+            ),
+        ]
+
+    def render(self):
+        appointment = self.appointment
+        starts_at = timezone.localtime(appointment.starts_at)
+        return (
+            f"{appointment.client.full_name}, reminder: {appointment.service.name} "
+            f"on {starts_at:%d/%m/%Y} at {starts_at:%H:%M}."
+        )
+
+    def __str__(self):
+        return f"{self.send_at} {self.appointment_id}"
@@ -0,0 +1,69 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from appointments.backends import get_backend
+from appointments.models import Appointment, Reminder
+
+
+def plan(appointment, adding=False):
+    """
+    Replaces the pending reminder of ``appointment`` by one sent
+    ``APPOINTMENT_REMINDER_MINUTES`` before it starts, or right away when
+    that moment is already past. Cancelled and past appointments get none.
+    """
+    if not adding:
+        Reminder.objects.filter(appointment=appointment, sent_at__isnull=True).delete()
+    now = timezone.now()
+    if appointment.status != Appointment.STATUS_SCHEDULED or appointment.starts_at <= now:
+        return None
+    send_at = appointment.starts_at - timedelta(minutes=settings.APPOINTMENT_REMINDER_MINUTES)
+    return Reminder.objects.create(
+        user_id=appointment.user_id,
+        appointment=appointment,
+        send_at=max(send_at, now),
+    )
+
+
+def claim_due(batch_size, now=None):
+    """
+    Locks up to ``batch_size`` due reminders of scheduled appointments.
+
+    Must run in a transaction. Rows locked by another dispatcher are
+    skipped (``SKIP LOCKED``), so several dispatchers can run at once and
+    each reminder is claimed by only one of them.
+    """
+    return list(
+        Reminder.objects.select_for_update(skip_locked=True, of=("self",))
+        .select_related("appointment__client", "appointment__service")
+        .filter(
+            sent_at__isnull=True,
+            send_at__lte=now or timezone.now(),
+            appointment__status=Appointment.STATUS_SCHEDULED,
+        )
+        .order_by("send_at")[:batch_size]
+    )
+
+
+def dispatch_batch(backend=None, batch_size=100):
+    """
+    Claims a batch of due reminders, delivers them through ``backend`` and
+    marks the delivered ones as sent with a single UPDATE, all in one
+    transaction. Returns the number of reminders sent.
+
+    The claimed rows stay locked until they are marked, so no other
+    dispatcher sends them twice. A dispatcher dying mid-batch rolls back
+    and the batch is sent again by the next one.
+    """
+    backend = backend or get_backend()
+    with transaction.atomic():
+        reminders = claim_due(batch_size)
+        if not reminders:
+            return 0
+        sent = backend.send_messages(reminders)
+        Reminder.objects.filter(pk__in=[reminder.pk for reminder in sent]).update(
+            sent_at=timezone.now()
+        )
+    return len(sent)
@@ -0,0 +1,160 @@
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from appointments import reminders
+from appointments.models import Appointment
+from authentication.models import Profile
+
+# Name of the PostgreSQL exclusion constraint created by the initial migration.
+NO_OVERLAP_CONSTRAINT = "appointment_no_overlap"
+
+
+class AppointmentConflict(Exception):
+    """Raised when an appointment would overlap another one of the same profile."""
+
+    def __init__(self, conflict=None):
+        self.conflict = conflict
+        super().__init__("The time slot overlaps another appointment.")
+
+
+def duration_of(service):
+    return timedelta(minutes=service.estimated_time)
+
+
+def busy(profile, exclude=None):
+    """Scheduled appointments of ``profile``, the ones that occupy time."""
+    queryset = Appointment.objects.filter(user=profile, status=Appointment.STATUS_SCHEDULED)
+    if exclude is not None:
+        queryset = queryset.exclude(pk=exclude.pk)
+    return queryset
+
+
+def find_conflict(profile, starts_at, ends_at, exclude=None):
+    """
+    Returns the scheduled appointment of ``profile`` overlapping the
+    ``[starts_at, ends_at)`` interval, or None.
+
+    Scheduled appointments of a profile never overlap, so when sorted by
+    start they are sorted by end as well and only the last one starting
+    before ``ends_at`` can reach into the interval. The check is a single
+    probe of ``appointment_user_busy_idx`` whatever the size of the agenda.
+    """
+    candidate = (
+        busy(profile, exclude)
+        .filter(starts_at__lt=ends_at)
+        .order_by("-starts_at")
+        .first()
+    )
+    if candidate is not None and candidate.ends_at > starts_at:
+        return candidate
+    return None
+
+
+def schedule(appointment):
+    """
+    Saves ``appointment``, raising ``AppointmentConflict`` when it overlaps
+    another scheduled appointment of its profile.
+
+    The profile row is locked while checking, so two bookings of the same
+    profile cannot both pass the check. On PostgreSQL the
+    ``appointment_no_overlap`` exclusion constraint enforces the same rule
+    in the database. The reminder of the appointment is planned in the
+    same transaction.
+    """
+    adding = appointment._state.adding
+    try:
+        with transaction.atomic():
+            list(Profile.objects.select_for_update().filter(pk=appointment.user_id).values_list("pk"))
+            if appointment.status == Appointment.STATUS_SCHEDULED:
+                conflict = find_conflict(
+                    appointment.user_id,
+                    appointment.starts_at,
+                    appointment.ends_at,
+                    exclude=None if adding else appointment,
+                )
+                if conflict is not None:
+                    raise AppointmentConflict(conflict)
+            appointment.save()
+            reminders.plan(appointment, adding=adding)
+    except IntegrityError as exc:
+        if NO_OVERLAP_CONSTRAINT in str(exc):
+            raise AppointmentConflict() from exc
+        raise
+    return appointment
+
+
+def cancel(appointment):
+    """Cancels ``appointment``, freeing its time slot and dropping its pending reminder."""
+    with transaction.atomic():
+        appointment.status = Appointment.STATUS_CANCELLED
+        appointment.save(update_fields=["status", "updated_at"])
+        reminders.plan(appointment)
+    return appointment
+
+
+def _business_hours(day):
+    opening = time.fromisoformat(settings.APPOINTMENT_OPENING_TIME)
+    closing = time.fromisoformat(settings.APPOINTMENT_CLOSING_TIME)
+    return (
+        timezone.make_aware(datetime.combine(day, opening)),
+        timezone.make_aware(datetime.combine(day, closing)),
+    )
+
+
+def _fit_business_hours(moment, duration):
+    """First moment from ``moment`` on at which ``duration`` fits in opening hours."""
+    day = timezone.localtime(moment).date()
+    opening, closing = _business_hours(day)
+    if moment < opening:
+        moment = opening
+    if moment + duration > closing:
+        moment, _ = _business_hours(day + timedelta(days=1))
+    return moment
+
+
+def next_free_slot(profile, duration, after=None, exclude=None):
+    """
+    Returns the start of the first gap of at least ``duration`` in the
+    agenda of ``profile`` from ``after`` (now by default) on, within the
+    opening hours and ``APPOINTMENT_SEARCH_DAYS``, or None.
+
+    Costs two queries on ``appointment_user_busy_idx``: one for the
+    appointment in progress at ``after`` and one walking the following
+    appointments in start order until a gap is found.
+    """
+    after = after or timezone.now()
+    opening, closing = _business_hours(timezone.localdate(after))
+    if duration <= timedelta(0) or duration > closing - opening:
+        return None
+    horizon = after + timedelta(days=settings.APPOINTMENT_SEARCH_DAYS)
+
+    candidate = after.replace(second=0, microsecond=0)
+    if candidate < after:
+        candidate += timedelta(minutes=1)
+
+    appointments = busy(profile, exclude)
+    in_progress = (
+        appointments.filter(starts_at__lt=candidate)
+        .order_by("-starts_at")
+        .values_list("ends_at", flat=True)
+        .first()
+    )
+    if in_progress is not None and in_progress > candidate:
+        candidate = in_progress
+
+    upcoming = (
+        appointments.filter(starts_at__gte=candidate, starts_at__lt=horizon)
+        .order_by("starts_at")
+        .values_list("starts_at", "ends_at")
+    )
+    for starts_at, ends_at in upcoming.iterator():
+        candidate = _fit_business_hours(candidate, duration)
+        if candidate + duration <= starts_at:
+            return candidate
+        candidate = max(candidate, ends_at)
+
+    candidate = _fit_business_hours(candidate, duration)
+    return candidate if candidate < horizon else None
@@ -0,0 +1,108 @@
+from rest_framework import serializers
+from appointments.models import Appointment
+from appointments.scheduling import AppointmentConflict, duration_of, schedule
+from clients.models import Client
+from services.models import Service
+
+
+class AppointmentSerializer(serializers.ModelSerializer):
+
+    class Meta:
+        model = Appointment
+        fields = [
+            "id",
+            "user",
+            "client",
+            "service",
+            "starts_at",
+            "ends_at",
+            "status",
+            "notes",
+            "created_at",
+        ]
+        read_only_fields = ["id", "ends_at", "status", "created_at"]
+        extra_kwargs = {
+            "user": {"read_only": True},
+        }
+
+    def get_fields(self):
+        fields = super().get_fields()
+        request = self.context.get("request")
+        if request is not None:
+            profile = request.user.profile
+            fields["service"].queryset = Service.objects.filter(
+                user=profile, is_deleted=False
+            )
+            fields["client"].queryset = Client.objects.filter(
+                user=profile, is_deleted=False
+            )
+        return fields
+
+    def validate(self, data):
+        instance = self.instance
+        if instance is not None and instance.status != Appointment.STATUS_SCHEDULED:
+            raise serializers.ValidationError(
+                {"message": "Only scheduled appointments can be changed."}
+            )
+
+        service = data.get("service") or instance.service
+        starts_at = data.get("starts_at") or instance.starts_at
+        if service.estimated_time <= 0:
+            raise serializers.ValidationError(
+                {"service": "The service has no estimated time."}
+            )
+        data["ends_at"] = starts_at + duration_of(service)
+        return data
+
+    def _schedule(self, appointment):
+        try:
+            return schedule(appointment)
+        except AppointmentConflict as exc:
+            detail = {"starts_at": ["The time slot overlaps another appointment."]}
+            if exc.conflict is not None:
+                detail["conflict"] = str(exc.conflict.pk)
+            raise serializers.ValidationError(detail)
+
+    def create(self, validated_data):
+        return self._schedule(Appointment(**validated_data))
+
+    def update(self, instance, validated_data):
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        return self._schedule(instance)
+
+
+class NextSlotQuerySerializer(serializers.Serializer):
+    """Validates the query parameters of the next free slot search."""
+
+    service = serializers.PrimaryKeyRelatedField(queryset=Service.objects.none())
+    after = serializers.DateTimeField(required=False)
+
+    def get_fields(self):
+        fields = super().get_fields()
+        request = self.context.get("request")
+        if request is not None:
+            fields["service"].queryset = Service.objects.filter(
+                user=request.user.profile, is_deleted=False
+            )
+        return fields
+
+    def validate_service(self, value):
+        if value.estimated_time <= 0:
+            raise serializers.ValidationError("The service has no estimated time.")
+        return value
+
+
+class NextSlotSerializer(serializers.Serializer):
+    """The free slot found, rendered in the current time zone like the rest of the API."""
+
+    starts_at = serializers.DateTimeField(allow_null=True)
+    ends_at = serializers.DateTimeField(allow_null=True)
+
+
+class AppointmentListQuerySerializer(serializers.Serializer):
+    """Validates the query parameters that filter the agenda."""
+
+    starts_after = serializers.DateTimeField(required=False)
+    starts_before = serializers.DateTimeField(required=False)
+    status = serializers.ChoiceField(choices=Appointment.STATUS_CHOICES, required=False)
@@ -0,0 +1,91 @@
+import pytest
+from rest_framework.test import APIClient
+from django.contrib.auth.models import User
+from authentication.models import Profile
+from services.models import Service
+from clients.models import Client
+from appointments.models import Appointment
+from appointments.scheduling import duration_of
+
+
+@pytest.fixture
+def api_client() -> APIClient:
+    return APIClient()
+
+
+@pytest.fixture
+def create_user(db):
+    """Creates a user."""
+
+    def _create_user(username: str = "john_doe", password: str = "password123"):
+        return User.objects.create_user(username=username, password=password)
+
+    return _create_user
+
+
+@pytest.fixture
+def create_profile(db, create_user):
+    """Creates a profile associated with a user."""
+
+    def _create_profile(user=None):
+        if user is None:
+            user = create_user()
+        return Profile.objects.create(
+            user=user, full_name="John Doe", phone="1234567890"
+        )
+
+    return _create_profile
+
+
+@pytest.fixture
+def create_service(db, create_profile):
+    """Creates a service associated with a profile."""
+
+    def _create_service(profile=None):
+        if profile is None:
+            profile = create_profile()
+        return Service.objects.create(
+            user=profile,
+            name="Interior Cleaning",
+            description="Full interior clean",
+            pricing_type=Service.PRICING_TYPE_FIXED,
+            base_price=150.00,
+            estimated_time=90,
+        )
+
+    return _create_service
+
+
+@pytest.fixture
+def create_client(create_profile):
+    """Creates a client associated with a user."""
+
+    def _create_client(profile=None):
+        if profile is None:
+            profile = create_profile()
+        return Client.objects.create(
+            user=profile,
+            full_name="John Doe",
+            phone="1111111111",
+            email="johndoe@example.com",
+        )
+
+    return _create_client
+
+
+@pytest.fixture
+def create_appointment(db, create_client):
+    """Creates a scheduled appointment of a service, lasting its estimated time."""
+
+    def _create_appointment(service, starts_at, client=None):
+        if client is None:
+            client = create_client(service.user)
+        return Appointment.objects.create(
+            user=service.user,
+            client=client,
+            service=service,
+            starts_at=starts_at,
+            ends_at=starts_at + duration_of(service),
+        )
+
+    return _create_appointment
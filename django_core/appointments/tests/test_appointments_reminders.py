@@ -0,0 +1,156 @@
+import pytest
+from datetime import timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.utils import timezone
+from appointments import backends
+from appointments.models import Appointment, Reminder
+from appointments.reminders import dispatch_batch
+from appointments.scheduling import cancel, schedule
+
+
+@pytest.fixture
+def outbox(settings):
+    settings.REMINDER_BACKEND = "appointments.backends.LocMemBackend"
+    settings.APPOINTMENT_REMINDER_MINUTES = 60
+    backends.outbox.clear()
+    yield backends.outbox
+    backends.outbox.clear()
+
+
+@pytest.fixture
+def book(create_service, create_client):
+    """Schedules appointments of one service, ``hours`` from now."""
+    service = create_service()
+    client = create_client(service.user)
+
+    def _book(hours):
+        starts_at = timezone.now() + timedelta(hours=hours)
+        return schedule(
+            Appointment(
+                user=service.user,
+                client=client,
+                service=service,
+                starts_at=starts_at,
+                ends_at=starts_at + timedelta(minutes=service.estimated_time),
+            )
+        )
+
+    return _book
+
+
+def make_due(*appointments):
+    Reminder.objects.filter(appointment__in=appointments).update(
+        send_at=timezone.now() - timedelta(minutes=1)
+    )
+
+
+@pytest.mark.django_db
+class TestPlanReminders:
+
+    def test_scheduling_plans_a_reminder(self, outbox, book):
+        appointment = book(hours=5)
+
+        reminder = appointment.reminders.get()
+        assert reminder.send_at == appointment.starts_at - timedelta(hours=1)
+        assert reminder.user == appointment.user
+
+    def test_close_appointment_is_reminded_right_away(self, outbox, book):
+        appointment = book(hours=0.5)
+
+        assert appointment.reminders.get().send_at <= timezone.now()
+
+    def test_rescheduling_replaces_pending_reminder(self, outbox, book):
+        appointment = book(hours=5)
+        appointment.starts_at += timedelta(hours=3)
+        appointment.ends_at += timedelta(hours=3)
+
+        schedule(appointment)
+
+        reminder = appointment.reminders.get()
+        assert reminder.send_at == appointment.starts_at - timedelta(hours=1)
+
+    def test_cancel_drops_pending_reminder(self, outbox, book):
+        appointment = book(hours=5)
+
+        cancel(appointment)
+
+        assert not appointment.reminders.exists()
+
+
+@pytest.mark.django_db
+class TestDispatchReminders:
+
+    def test_sends_due_reminders_only_once(self, outbox, book):
+        due = book(hours=2)
+        later = book(hours=6)
+        make_due(due)
+
+        assert dispatch_batch() == 1
+        assert dispatch_batch() == 0
+
+        assert [reminder.appointment_id for reminder in outbox] == [due.pk]
+        assert due.reminders.get().sent_at is not None
+        assert later.reminders.get().sent_at is None
+
+    def test_batches_are_bounded(self, outbox, book):
+        appointments = [book(hours=2 * index + 2) for index in range(5)]
+        make_due(*appointments)
+
+        assert dispatch_batch(batch_size=2) == 2
+        assert dispatch_batch(batch_size=2) == 2
+        assert dispatch_batch(batch_size=2) == 1
+        assert len(outbox) == 5
+
+    def test_batch_costs_fixed_number_of_queries(
+        self, outbox, book, django_assert_max_num_queries
+    ):
+        appointments = [book(hours=2 * index + 2) for index in range(10)]
+        make_due(*appointments)
+
+        with django_assert_max_num_queries(4):
+            assert dispatch_batch(batch_size=50) == 10
+
+    def test_reminders_of_cancelled_appointments_are_not_sent(self, outbox, book):
+        appointment = book(hours=2)
+        make_due(appointment)
+        Appointment.objects.filter(pk=appointment.pk).update(status=Appointment.STATUS_CANCELLED)
+
+        assert dispatch_batch() == 0
+
+    def test_undelivered_reminders_stay_due(self, outbox, book):
+        class FailingBackend(backends.BaseReminderBackend):
+            def send_messages(self, reminders):
+                return []
+
+        appointment = book(hours=2)
+        make_due(appointment)
+
+        assert dispatch_batch(FailingBackend()) == 0
+        assert dispatch_batch() == 1
+
+    def test_console_backend_renders_message(self, book, outbox):
+        appointment = book(hours=2)
+        make_due(appointment)
+        stream = StringIO()
+
+        dispatch_batch(backends.ConsoleBackend(stream=stream))
+
+        assert stream.getvalue().startswith("[1111111111] John Doe, reminder: Interior Cleaning on ")
+
+    def test_file_backend(self, book, outbox, settings, tmp_path):
+        settings.REMINDER_FILE_PATH = str(tmp_path / "reminders.log")
+        make_due(book(hours=2), book(hours=4))
+
+        dispatch_batch(backends.FileBackend())
+
+        assert len((tmp_path / "reminders.log").read_text().splitlines()) == 2
+
+    def test_command(self, outbox, book):
+        make_due(book(hours=2), book(hours=4), book(hours=6))
+        out = StringIO()
+
+        call_command("dispatch_reminders", "--batch-size", "2", stdout=out)
+
+        assert "3 reminders sent in total." in out.getvalue()
+        assert len(outbox) == 3
@@ -0,0 +1,216 @@
+import pytest
+from datetime import datetime, timedelta
+from django.db import connection
+from django.utils import timezone
+from appointments.models import Appointment
+from appointments.scheduling import (
+    AppointmentConflict,
+    busy,
+    find_conflict,
+    next_free_slot,
+    schedule,
+)
+
+HOUR = timedelta(hours=1)
+
+
+def local(*args):
+    return timezone.make_aware(datetime(*args))
+
+
+@pytest.mark.django_db
+class TestFindConflict:
+
+    @pytest.fixture
+    def agenda(self, create_service, create_appointment):
+        """Two appointments of 90 minutes, at 09:00 and 14:00."""
+        service = create_service()
+        morning = create_appointment(service, local(2024, 5, 6, 9))
+        afternoon = create_appointment(service, local(2024, 5, 6, 14))
+        return service.user, morning, afternoon
+
+    @pytest.mark.parametrize(
+        "start, end, expected",
+        [
+            ((2024, 5, 6, 8), (2024, 5, 6, 9), None),
+            ((2024, 5, 6, 8), (2024, 5, 6, 9, 1), "morning"),
+            ((2024, 5, 6, 10), (2024, 5, 6, 10, 30), "morning"),
+            ((2024, 5, 6, 10, 30), (2024, 5, 6, 14), None),
+            ((2024, 5, 6, 8), (2024, 5, 6, 18), "afternoon"),
+            ((2024, 5, 6, 15, 29), (2024, 5, 6, 16), "afternoon"),
+            ((2024, 5, 6, 15, 30), (2024, 5, 6, 16), None),
+        ],
+    )
+    def test_overlaps(self, agenda, start, end, expected):
+        profile, morning, afternoon = agenda
+
+        conflict = find_conflict(profile, local(*start), local(*end))
+
+        assert conflict == {"morning": morning, "afternoon": afternoon, None: None}[expected]
+
+    def test_cancelled_appointments_do_not_conflict(self, agenda):
+        profile, morning, _ = agenda
+        morning.status = Appointment.STATUS_CANCELLED
+        morning.save()
+
+        assert find_conflict(profile, local(2024, 5, 6, 9), local(2024, 5, 6, 10)) is None
+
+    def test_exclude_moved_appointment(self, agenda):
+        profile, morning, _ = agenda
+
+        assert find_conflict(
+            profile, local(2024, 5, 6, 9, 30), local(2024, 5, 6, 11), exclude=morning
+        ) is None
+
+    def test_other_profiles_do_not_conflict(
+        self, agenda, create_user, create_profile
+    ):
+        other = create_profile(user=create_user(username="other"))
+
+        assert find_conflict(other, local(2024, 5, 6, 9), local(2024, 5, 6, 10)) is None
+
+    def test_conflict_check_is_a_single_query(self, agenda, django_assert_num_queries):
+        profile, _, _ = agenda
+
+        with django_assert_num_queries(1):
+            find_conflict(profile, local(2024, 5, 6, 9), local(2024, 5, 6, 10))
+
+
+@pytest.mark.django_db
+class TestSchedule:
+
+    def test_schedule_rejects_overlap(self, create_service, create_client, create_appointment):
+        service = create_service()
+        existing = create_appointment(service, local(2024, 5, 6, 9))
+        appointment = Appointment(
+            user=service.user,
+            client=create_client(service.user),
+            service=service,
+            starts_at=local(2024, 5, 6, 10),
+            ends_at=local(2024, 5, 6, 11, 30),
+        )
+
+        with pytest.raises(AppointmentConflict) as exc:
+            schedule(appointment)
+
+        assert exc.value.conflict == existing
+        assert Appointment.objects.count() == 1
+
+    def test_schedule_allows_moving_within_own_slot(self, create_service, create_appointment):
+        appointment = create_appointment(create_service(), local(2024, 5, 6, 9))
+        appointment.starts_at = local(2024, 5, 6, 9, 30)
+        appointment.ends_at = local(2024, 5, 6, 11)
+
+        schedule(appointment)
+
+        appointment.refresh_from_db()
+        assert appointment.starts_at == local(2024, 5, 6, 9, 30)
+
+
+@pytest.mark.django_db
+class TestNextFreeSlot:
+
+    @pytest.fixture(autouse=True)
+    def business_hours(self, settings):
+        settings.APPOINTMENT_OPENING_TIME = "08:00"
+        settings.APPOINTMENT_CLOSING_TIME = "18:00"
+        settings.APPOINTMENT_SEARCH_DAYS = 14
+        return settings
+
+    def test_empty_agenda_returns_requested_moment(self, create_profile):
+        profile = create_profile()
+
+        assert next_free_slot(profile, HOUR, after=local(2024, 5, 6, 10)) == local(2024, 5, 6, 10)
+
+    def test_before_opening_returns_opening(self, create_profile):
+        profile = create_profile()
+
+        assert next_free_slot(profile, HOUR, after=local(2024, 5, 6, 6)) == local(2024, 5, 6, 8)
+
+    def test_rounds_up_to_the_minute(self, create_profile):
+        profile = create_profile()
+
+        slot = next_free_slot(profile, HOUR, after=local(2024, 5, 6, 10, 0, 30))
+
+        assert slot == local(2024, 5, 6, 10, 1)
+
+    def test_skips_appointment_in_progress(self, create_service, create_appointment):
+        service = create_service()
+        create_appointment(service, local(2024, 5, 6, 9))
+
+        slot = next_free_slot(service.user, HOUR, after=local(2024, 5, 6, 10))
+
+        assert slot == local(2024, 5, 6, 10, 30)
+
+    def test_finds_first_gap_long_enough(self, create_service, create_appointment):
+        service = create_service()
+        create_appointment(service, local(2024, 5, 6, 8))
+        create_appointment(service, local(2024, 5, 6, 10))
+        create_appointment(service, local(2024, 5, 6, 12))
+
+        slot = next_free_slot(service.user, 2 * HOUR, after=local(2024, 5, 6, 8))
+
+        assert slot == local(2024, 5, 6, 13, 30)
+
+    def test_moves_to_next_day_after_closing(self, create_service, create_appointment):
+        service = create_service()
+        create_appointment(service, local(2024, 5, 6, 16))
+
+        slot = next_free_slot(service.user, 2 * HOUR, after=local(2024, 5, 6, 15))
+
+        assert slot == local(2024, 5, 7, 8)
+
+    def test_gap_at_the_next_day_opening_is_checked(self, create_service, create_appointment):
+        service = create_service()
+        create_appointment(service, local(2024, 5, 7, 8))
+
+        slot = next_free_slot(service.user, HOUR, after=local(2024, 5, 6, 17, 30))
+
+        assert slot == local(2024, 5, 7, 9, 30)
+
+    def test_duration_longer_than_a_day_has_no_slot(self, create_profile):
+        profile = create_profile()
+
+        assert next_free_slot(profile, 11 * HOUR, after=local(2024, 5, 6, 8)) is None
+
+    def test_full_agenda_has_no_slot(self, business_hours, create_service, create_appointment):
+        business_hours.APPOINTMENT_SEARCH_DAYS = 1
+        service = create_service()
+        service.estimated_time = 60
+        service.save()
+        for day in (6, 7):
+            for hour in range(8, 18):
+                create_appointment(service, local(2024, 5, day, hour))
+
+        assert next_free_slot(service.user, HOUR, after=local(2024, 5, 6, 8)) is None
+
+    def test_busy_week_costs_two_queries(
+        self, create_service, create_appointment, django_assert_num_queries
+    ):
+        service = create_service()
+        for day in range(6, 11):
+            for hour in (8, 10, 12, 14, 16):
+                create_appointment(service, local(2024, 5, day, hour))
+
+        with django_assert_num_queries(2):
+            slot = next_free_slot(service.user, 2 * HOUR, after=local(2024, 5, 6, 8))
+
+        assert slot == local(2024, 5, 11, 8)
+
+
+@pytest.mark.django_db
+class TestAppointmentIndexes:
+
+    @pytest.fixture(autouse=True)
+    def require_sqlite(self):
+        if connection.vendor != "sqlite":
+            pytest.skip("Query plan assertions are written for SQLite.")
+
+    def test_conflict_probe_uses_partial_index(self, create_profile):
+        profile = create_profile()
+
+        queryset = busy(profile).filter(starts_at__lt=local(2024, 5, 6, 10)).order_by("-starts_at")[:1]
+        plan = queryset.explain()
+
+        assert "appointment_user_busy_idx" in plan
+        assert "TEMP B-TREE" not in plan
@@ -0,0 +1,163 @@
+import pytest
+from datetime import datetime
+from django.utils import timezone
+from rest_framework import status
+from appointments.models import Appointment
+
+LIST_URL = "/api/appointments/"
+RETRIEVE_URL = "/api/appointments/{}/"
+CANCEL_URL = "/api/appointments/{}/cancel/"
+NEXT_SLOT_URL = "/api/appointments/next-slot/"
+
+
+def local(*args):
+    return timezone.make_aware(datetime(*args))
+
+
+@pytest.mark.django_db
+class TestAppointmentView:
+
+    def test_create_appointment_derives_end_time(self, api_client, create_service, create_client):
+        service = create_service()
+        client = create_client(service.user)
+        api_client.force_authenticate(user=service.user.user)
+
+        response = api_client.post(
+            LIST_URL,
+            {
+                "service": str(service.id),
+                "client": str(client.id),
+                "starts_at": local(2024, 5, 6, 9).isoformat(),
+            },
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        appointment = Appointment.objects.get()
+        assert appointment.user == service.user
+        assert appointment.ends_at == local(2024, 5, 6, 10, 30)
+
+    def test_create_overlapping_appointment(
+        self, api_client, create_service, create_client, create_appointment
+    ):
+        service = create_service()
+        existing = create_appointment(service, local(2024, 5, 6, 9))
+        api_client.force_authenticate(user=service.user.user)
+
+        response = api_client.post(
+            LIST_URL,
+            {
+                "service": str(service.id),
+                "client": str(existing.client.id),
+                "starts_at": local(2024, 5, 6, 8).isoformat(),
+            },
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["conflict"] == str(existing.id)
+        assert Appointment.objects.count() == 1
+
+    def test_create_with_client_of_other_user(
+        self, api_client, create_user, create_profile, create_service, create_client
+    ):
+        service = create_service()
+        other_client = create_client(create_profile(user=create_user(username="other")))
+        api_client.force_authenticate(user=service.user.user)
+
+        response = api_client.post(
+            LIST_URL,
+            {
+                "service": str(service.id),
+                "client": str(other_client.id),
+                "starts_at": local(2024, 5, 6, 9).isoformat(),
+            },
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "client" in response.data
+
+    def test_reschedule_recomputes_end_time(self, api_client, create_service, create_appointment):
+        appointment = create_appointment(create_service(), local(2024, 5, 6, 9))
+        api_client.force_authenticate(user=appointment.user.user)
+
+        response = api_client.patch(
+            RETRIEVE_URL.format(appointment.id),
+            {"starts_at": local(2024, 5, 6, 10).isoformat()},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        appointment.refresh_from_db()
+        assert appointment.ends_at == local(2024, 5, 6, 11, 30)
+
+    def test_list_is_ordered_by_start_and_filtered(
+        self, api_client, create_service, create_appointment
+    ):
+        service = create_service()
+        late = create_appointment(service, local(2024, 5, 7, 9))
+        early = create_appointment(service, local(2024, 5, 6, 9))
+        create_appointment(service, local(2024, 5, 9, 9))
+        api_client.force_authenticate(user=service.user.user)
+
+        response = api_client.get(
+            LIST_URL,
+            {
+                "starts_after": local(2024, 5, 6).isoformat(),
+                "starts_before": local(2024, 5, 8).isoformat(),
+            },
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.data["results"]] == [str(early.id), str(late.id)]
+
+    def test_cancel_frees_the_slot(self, api_client, create_service, create_appointment):
+        service = create_service()
+        appointment = create_appointment(service, local(2024, 5, 6, 9))
+        api_client.force_authenticate(user=service.user.user)
+
+        response = api_client.post(CANCEL_URL.format(appointment.id))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["status"] == Appointment.STATUS_CANCELLED
+        response = api_client.get(
+            NEXT_SLOT_URL, {"service": str(service.id), "after": local(2024, 5, 6, 9).isoformat()}
+        )
+        assert response.data["starts_at"] == local(2024, 5, 6, 9).isoformat()
+
+    def test_next_slot(self, api_client, create_service, create_appointment):
+        service = create_service()
+        create_appointment(service, local(2024, 5, 6, 9))
+        api_client.force_authenticate(user=service.user.user)
+
+        response = api_client.get(
+            NEXT_SLOT_URL, {"service": str(service.id), "after": local(2024, 5, 6, 9).isoformat()}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["starts_at"] == "2024-05-06T10:30:00-03:00"
+        assert response.data["ends_at"] == "2024-05-06T12:00:00-03:00"
+
+    def test_next_slot_right_after_an_appointment_uses_local_offset(
+        self, api_client, create_service, create_appointment
+    ):
+        service = create_service()
+        create_appointment(service, local(2024, 5, 6, 8))
+        api_client.force_authenticate(user=service.user.user)
+
+        response = api_client.get(
+            NEXT_SLOT_URL, {"service": str(service.id), "after": local(2024, 5, 6, 8).isoformat()}
+        )
+
+        # starts_at comes from the stored ends_at, ends_at is computed.
+        assert response.data["starts_at"] == "2024-05-06T09:30:00-03:00"
+        assert response.data["ends_at"] == "2024-05-06T11:00:00-03:00"
+
+    def test_next_slot_requires_service(self, api_client, create_profile):
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+
+        response = api_client.get(NEXT_SLOT_URL)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,7 @@
+from rest_framework.routers import DefaultRouter
+from appointments.views import AppointmentViewSet
+
+router = DefaultRouter()
+router.register(r"", AppointmentViewSet, basename="appointment")
+
+urlpatterns = router.urls
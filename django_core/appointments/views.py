@@ -0,0 +1,78 @@
+from rest_framework import mixins, viewsets, status
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from appointments.models import Appointment
+from appointments.scheduling import cancel, duration_of, next_free_slot
+from appointments.serializers import (
+    AppointmentListQuerySerializer,
+    AppointmentSerializer,
+    NextSlotQuerySerializer,
+    NextSlotSerializer,
+)
+from auto_care.pagination import StartsAtCursorPagination
+
+
+class AppointmentViewSet(
+    mixins.CreateModelMixin,
+    mixins.RetrieveModelMixin,
+    mixins.UpdateModelMixin,
+    mixins.ListModelMixin,
+    viewsets.GenericViewSet,
+):
+    """
+    Handles the agenda. Listing accepts ``starts_after``/``starts_before``
+    datetimes and a ``status``, and is ordered by start time.
+    """
+
+    queryset = Appointment.objects.all()
+    serializer_class = AppointmentSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = StartsAtCursorPagination
+
+    def perform_create(self, serializer):
+        serializer.save(user=self.request.user.profile)
+
+    def get_queryset(self):
+        queryset = Appointment.objects.filter(user=self.request.user.profile)
+        if self.action != "list":
+            return queryset
+
+        query = AppointmentListQuerySerializer(data=self.request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+        if "starts_after" in params:
+            queryset = queryset.filter(starts_at__gte=params["starts_after"])
+        if "starts_before" in params:
+            queryset = queryset.filter(starts_at__lt=params["starts_before"])
+        if "status" in params:
+            queryset = queryset.filter(status=params["status"])
+        return queryset
+
+    @action(detail=True, methods=["post"])
+    def cancel(self, request, pk=None):
+        """Cancels the appointment, freeing its time slot."""
+        appointment = self.get_object()
+        if appointment.status != Appointment.STATUS_SCHEDULED:
+            return Response(
+                {"message": "Only scheduled appointments can be cancelled."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        cancel(appointment)
+        return Response(self.get_serializer(appointment).data, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=["get"], url_path="next-slot")
+    def next_slot(self, request):
+        """First free slot long enough for ``service`` from ``after`` (now by default) on."""
+        query = NextSlotQuerySerializer(data=request.query_params, context={"request": request})
+        query.is_valid(raise_exception=True)
+        duration = duration_of(query.validated_data["service"])
+
+        starts_at = next_free_slot(
+            request.user.profile, duration, after=query.validated_data.get("after")
+        )
+        return Response(NextSlotSerializer({
+            "starts_at": starts_at,
+            "ends_at": starts_at + duration if starts_at is not None else None,
+        }).data)
@@ -0,0 +1,33 @@
+from rest_framework import authentication, exceptions
+
+from authentication.tokens import InvalidToken, user_from_access_token
+
+KEYWORD = "Bearer"
+
+
+def get_bearer_token(request):
+    """The token of an ``Authorization: Bearer <token>`` header, or None."""
+    header = request.META.get("HTTP_AUTHORIZATION", "").split()
+    if len(header) != 2 or header[0].lower() != KEYWORD.lower():
+        return None
+    return header[1]
+
+
+class SignedTokenAuthentication(authentication.BaseAuthentication):
+    """
+    Authenticates ``Authorization: Bearer <access token>`` requests, see
+    authentication.tokens. The user is rebuilt from the token, so no query
+    is made.
+    """
+
+    def authenticate(self, request):
+        token = get_bearer_token(request)
+        if token is None:
+            return None
+        try:
+            return user_from_access_token(token), token
+        except InvalidToken as exc:
+            raise exceptions.AuthenticationFailed(str(exc))
+
+    def authenticate_header(self, request):
+        return KEYWORD
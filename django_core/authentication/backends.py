@@ -0,0 +1,21 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+UserModel = get_user_model()
+
+
+class ProfileModelBackend(ModelBackend):
+    """
+    ModelBackend that loads the user's profile in the same query.
+
+    Every API view scopes its data by ``request.user.profile``; resolving the
+    session user with ``select_related("profile")`` makes that attribute
+    available without a second round trip to the database.
+    """
+
+    def get_user(self, user_id):
+        try:
+            user = UserModel._default_manager.select_related("profile").get(pk=user_id)
+        except UserModel.DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
@@ -0,0 +1,71 @@
+import time
+from uuid import uuid4
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.contrib.sessions.backends.db import SessionStore
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test.utils import override_settings
+from rest_framework.test import APIRequestFactory
+
+from authentication.views import LoginView
+
+PASSWORD = "bench-login-Pa55word"
+
+
+def _cpu_ms(func, iterations):
+    """Average CPU time of ``func()`` in milliseconds."""
+    started = time.process_time()
+    for _ in range(iterations):
+        func()
+    return (time.process_time() - started) * 1000 / iterations
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures the CPU time of a login through LoginView for each password "
+        "hasher, next to the cost of a single password check."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--hasher",
+            action="append",
+            dest="hashers",
+            choices=sorted(settings.PASSWORD_HASHER_CHOICES),
+            help="Hasher to measure, may be repeated (default: all).",
+        )
+        parser.add_argument("--iterations", type=int, default=10)
+
+    def handle(self, *args, **options):
+        hashers = options["hashers"] or list(settings.PASSWORD_HASHER_CHOICES)
+        iterations = options["iterations"]
+        self.stdout.write(f"{'hasher':<8} {'check ms':>9} {'login ms':>9} {'checks/login':>13}")
+        for name in hashers:
+            with override_settings(PASSWORD_HASHERS=[settings.PASSWORD_HASHER_CHOICES[name]]):
+                check_ms, login_ms = self.measure(iterations)
+            self.stdout.write(
+                f"{name:<8} {check_ms:>9.1f} {login_ms:>9.1f} {login_ms / check_ms:>13.2f}"
+            )
+
+    def measure(self, iterations):
+        factory = APIRequestFactory()
+        view = LoginView.as_view()
+
+        # Nothing written here is kept: the user and sessions are rolled back.
+        with transaction.atomic():
+            user = User.objects.create_user(username=f"bench-{uuid4().hex[:12]}", password=PASSWORD)
+
+            def login():
+                request = factory.post(
+                    "/api/auth/login", {"username": user.username, "password": PASSWORD}, format="json"
+                )
+                request.session = SessionStore()
+                response = view(request)
+                assert response.status_code == 200, response.data
+
+            check_ms = _cpu_ms(lambda: user.check_password(PASSWORD), iterations)
+            login_ms = _cpu_ms(login, iterations)
+            transaction.set_rollback(True)
+        return check_ms, login_ms
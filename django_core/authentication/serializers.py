@@ -2,6 +2,7 @@ from django.contrib.auth import authenticate
 from django.contrib.auth.models import User
 from rest_framework import serializers
 from authentication.models import Profile
+from authentication.tokens import InvalidToken, user_from_refresh_token
 
 
 class UserRegistrationSerializer(serializers.ModelSerializer):
@@ -29,13 +30,24 @@ class UserLoginSerializer(serializers.Serializer):
 
     def validate(self, data):
         user = authenticate(
-            username=data["username"], password=data["password"])
+            self.context.get("request"), username=data["username"], password=data["password"])
         if not user:
             raise serializers.ValidationError("Usuário ou senha inválidos.")
         data["user"] = user
         return data
 
 
+class TokenRefreshSerializer(serializers.Serializer):
+    refresh = serializers.CharField(write_only=True)
+
+    def validate(self, data):
+        try:
+            data["user"] = user_from_refresh_token(data["refresh"])
+        except InvalidToken as exc:
+            raise serializers.ValidationError({"refresh": [str(exc)]})
+        return data
+
+
 class RegisterSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
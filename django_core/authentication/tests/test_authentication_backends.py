@@ -0,0 +1,45 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from authentication.backends import ProfileModelBackend
+from authentication.models import Profile
+
+
+@pytest.mark.django_db
+class TestProfileModelBackend:
+
+    def test_get_user_loads_profile_in_one_query(self, create_user, django_assert_num_queries):
+        user = create_user()
+        Profile.objects.create(user=user, full_name="John Doe", phone="1234567890")
+
+        with django_assert_num_queries(1):
+            loaded = ProfileModelBackend().get_user(user.pk)
+            assert loaded.profile.full_name == "John Doe"
+
+    def test_get_user_returns_none_for_unknown_id(self, db):
+        assert ProfileModelBackend().get_user(999) is None
+
+    def test_get_user_returns_none_for_inactive_user(self, create_user):
+        user = create_user(is_active=False)
+        assert ProfileModelBackend().get_user(user.pk) is None
+
+    def test_session_write_does_not_query_profile_separately(self, api_client, create_user):
+        user = create_user()
+        Profile.objects.create(user=user, full_name="John Doe", phone="1234567890")
+        api_client.login(username=user.username, password="secret123")
+
+        data = {
+            "full_name": "Jane Roe",
+            "phone": "11999999999",
+            "email": "jane@example.com",
+        }
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.post("/api/clients/", data)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        profile_queries = [
+            query["sql"] for query in context.captured_queries
+            if query["sql"].startswith('SELECT "authentication_profile"')
+        ]
+        assert profile_queries == []
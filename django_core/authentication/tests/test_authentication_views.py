@@ -1,10 +1,21 @@
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import base_user
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from django.contrib.auth.models import User
 import pytest
+from authentication.models import Profile
+from clients.models import Client
 
 LOGIN_URL = "/api/auth/login"
 LOGOUT_URL = "/api/auth/logout"
 REGISTER_URL = "/api/auth/register"
+TOKEN_URL = "/api/auth/token"
+TOKEN_REFRESH_URL = "/api/auth/token/refresh"
 
 
 class RegistrationPayload:
@@ -62,6 +73,46 @@ class TestLoginView:
             LOGIN_URL, {"username": user.username, "password": "secret123"})
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
+    def test_login_checks_password_once(self, api_client, create_user):
+        """Tests that a login hashes the submitted password a single time."""
+        user = create_user()
+        with mock.patch.object(base_user, "check_password", wraps=base_user.check_password) as check:
+            response = api_client.post(
+                LOGIN_URL, {"username": user.username, "password": "secret123"})
+        assert response.status_code == status.HTTP_200_OK
+        assert check.call_count == 1
+
+    def test_login_rehashes_password_with_preferred_hasher(self, api_client, create_user, settings):
+        """Tests that a hash from another hasher is upgraded on login."""
+        user = create_user()
+        assert user.password.startswith("pbkdf2_sha256$")
+        settings.PASSWORD_HASHERS = [
+            "django.contrib.auth.hashers.Argon2PasswordHasher",
+            "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+        ]
+
+        response = api_client.post(
+            LOGIN_URL, {"username": user.username, "password": "secret123"})
+
+        assert response.status_code == status.HTTP_200_OK
+        user.refresh_from_db()
+        assert user.password.startswith("argon2$")
+        assert user.check_password("secret123")
+
+
+@pytest.mark.django_db
+class TestBenchLoginCommand:
+
+    def test_reports_one_check_per_login(self):
+        """Tests the login benchmark output and that it leaves no user behind."""
+        out = StringIO()
+        call_command("bench_login", "--hasher", "argon2", "--iterations", "2", stdout=out)
+
+        header, row = out.getvalue().splitlines()
+        assert header.split()[0] == "hasher"
+        assert row.split()[0] == "argon2"
+        assert not User.objects.filter(username__startswith="bench-").exists()
+
 
 @pytest.mark.django_db
 class TestLogoutView:
@@ -146,3 +197,108 @@ class TestUserAuthFlow:
         login_response = api_client.post(LOGIN_URL, data=login_payload)
         assert login_response.status_code == status.HTTP_200_OK
         assert login_response.data["username"] == payload.username
+
+
+@pytest.mark.django_db
+class TestTokenAuthentication:
+
+    @pytest.fixture
+    def profile_user(self, create_user):
+        user = create_user()
+        Profile.objects.create(user=user, full_name="John Doe", phone="1234567890")
+        return user
+
+    def obtain(self, api_client, username="johndoe", password="secret123"):
+        return api_client.post(TOKEN_URL, {"username": username, "password": password})
+
+    def test_obtain_returns_token_pair(self, api_client, profile_user):
+        """Tests that valid credentials return an access and a refresh token."""
+        response = self.obtain(api_client)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["token_type"] == "Bearer"
+        assert response.data["expires_in"] == 900
+        assert response.data["access"] and response.data["refresh"]
+        assert "sessionid" not in response.cookies
+
+    def test_obtain_rejects_invalid_credentials(self, api_client, profile_user):
+        """Tests that invalid credentials get no token."""
+        response = self.obtain(api_client, password="wrong")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "non_field_errors" in response.data
+
+    def test_access_token_authenticates_without_session_or_user_queries(self, api_client, profile_user):
+        """Tests that a bearer request reads neither the session nor the user."""
+        Client.objects.create(
+            user=profile_user.profile, full_name="Ana Souza", phone="11987654321", email="ana@example.com"
+        )
+        access = self.obtain(api_client).data["access"]
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get("/api/clients/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["full_name"] for item in response.data["results"]] == ["Ana Souza"]
+        tables = ('"django_session"', '"auth_user"', '"authentication_profile"')
+        assert [q["sql"] for q in context.captured_queries if any(t in q["sql"] for t in tables)] == []
+
+    def test_access_token_authenticates_async_views(self, api_client, profile_user):
+        """Tests that the async endpoints accept the bearer token too."""
+        Client.objects.create(
+            user=profile_user.profile, full_name="Ana Souza", phone="11987654321", email="ana@example.com"
+        )
+        access = self.obtain(api_client).data["access"]
+
+        response = api_client.get("/api/async/clients/", HTTP_AUTHORIZATION=f"Bearer {access}")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["full_name"] for item in response.json()["results"]] == ["Ana Souza"]
+
+    def test_invalid_or_expired_access_token_is_rejected(self, api_client, profile_user, settings):
+        """Tests that tampered and expired access tokens are refused."""
+        access = self.obtain(api_client).data["access"]
+
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}x")
+        assert api_client.get("/api/clients/").status_code == status.HTTP_403_FORBIDDEN
+
+        settings.AUTH_ACCESS_TOKEN_SECONDS = -1
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+        response = api_client.get("/api/clients/")
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.data["detail"] == "Token expired."
+
+    def test_refresh_token_is_not_an_access_token(self, api_client, profile_user):
+        """Tests that a refresh token cannot authenticate API requests."""
+        refresh = self.obtain(api_client).data["refresh"]
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {refresh}")
+
+        assert api_client.get("/api/clients/").status_code == status.HTTP_403_FORBIDDEN
+
+    def test_refresh_returns_new_pair(self, api_client, profile_user):
+        """Tests that a refresh token is exchanged for a working access token."""
+        refresh = self.obtain(api_client).data["refresh"]
+
+        response = api_client.post(TOKEN_REFRESH_URL, {"refresh": refresh})
+
+        assert response.status_code == status.HTTP_200_OK
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+        assert api_client.get("/api/clients/").status_code == status.HTTP_200_OK
+
+    def test_password_change_revokes_refresh_tokens(self, api_client, profile_user):
+        """Tests that refresh tokens issued before a password change stop working."""
+        refresh = self.obtain(api_client).data["refresh"]
+        profile_user.set_password("another-secret")
+        profile_user.save()
+
+        response = api_client.post(TOKEN_REFRESH_URL, {"refresh": refresh})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["refresh"] == ["Invalid token."]
+
+    def test_session_login_still_works(self, api_client, profile_user):
+        """Tests that the session mode stays available next to the tokens."""
+        api_client.login(username="johndoe", password="secret123")
+
+        assert api_client.get("/api/clients/").status_code == status.HTTP_200_OK
@@ -0,0 +1,90 @@
+"""
+Signed access and refresh tokens for stateless clients.
+
+Tokens are ``django.core.signing`` payloads, signed with ``SECRET_KEY`` and
+timestamped, so checking one needs no storage. An access token carries the
+user and profile ids, which is all the API views need to scope their data:
+a request authenticated with it reads neither ``django_session`` nor
+``auth_user``. Being short-lived (``AUTH_ACCESS_TOKEN_SECONDS``) makes up
+for not checking whether the user is still active.
+
+A refresh token (``AUTH_REFRESH_TOKEN_SECONDS``) is exchanged for a new
+pair. That does load the user, and the token is bound to the password hash
+through the session auth hash, so deactivating a user or changing the
+password revokes every refresh token issued before.
+"""
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core import signing
+from django.utils.crypto import constant_time_compare
+
+from authentication.models import Profile
+
+TOKEN_SALT = "authentication.token"
+ACCESS = "access"
+REFRESH = "refresh"
+
+UserModel = get_user_model()
+
+
+class InvalidToken(Exception):
+    pass
+
+
+def _lifetime(kind):
+    if kind == ACCESS:
+        return settings.AUTH_ACCESS_TOKEN_SECONDS
+    return settings.AUTH_REFRESH_TOKEN_SECONDS
+
+
+def issue_tokens(user):
+    """Returns a new access/refresh pair for ``user``."""
+    # The profile shares the user's primary key; None when it has none.
+    profile_id = user.pk if Profile.objects.filter(pk=user.pk).exists() else None
+    access = signing.dumps({"typ": ACCESS, "uid": user.pk, "pid": profile_id}, salt=TOKEN_SALT)
+    refresh = signing.dumps(
+        {"typ": REFRESH, "uid": user.pk, "ver": user.get_session_auth_hash()}, salt=TOKEN_SALT
+    )
+    return {
+        "access": access,
+        "refresh": refresh,
+        "token_type": "Bearer",
+        "expires_in": settings.AUTH_ACCESS_TOKEN_SECONDS,
+    }
+
+
+def read_token(token, kind):
+    """Returns the payload of a valid, unexpired token of the given kind."""
+    try:
+        payload = signing.loads(token, salt=TOKEN_SALT, max_age=_lifetime(kind))
+    except signing.SignatureExpired:
+        raise InvalidToken("Token expired.")
+    except signing.BadSignature:
+        raise InvalidToken("Invalid token.")
+    if not isinstance(payload, dict) or payload.get("typ") != kind:
+        raise InvalidToken("Invalid token.")
+    return payload
+
+
+def user_from_access_token(token):
+    """
+    Builds the user of an access token, with its profile attached, without
+    querying the database. Only the primary keys are set.
+    """
+    payload = read_token(token, ACCESS)
+    user = UserModel(pk=payload["uid"], is_active=True)
+    if payload["pid"] is not None:
+        user.profile = Profile(user_id=payload["pid"])
+    return user
+
+
+def user_from_refresh_token(token):
+    """Loads the user of a refresh token, checking it was not revoked since."""
+    payload = read_token(token, REFRESH)
+    try:
+        user = UserModel._default_manager.get(pk=payload["uid"], is_active=True)
+    except UserModel.DoesNotExist:
+        raise InvalidToken("Invalid token.")
+    if not constant_time_compare(payload.get("ver", ""), user.get_session_auth_hash()):
+        raise InvalidToken("Invalid token.")
+    return user
@@ -1,8 +1,10 @@
 from django.urls import path
-from .views import LoginView, LogoutView, RegisterView
+from .views import LoginView, LogoutView, RegisterView, TokenObtainView, TokenRefreshView
 
 urlpatterns = [
     path('login', LoginView.as_view(), name='login'),
     path('logout', LogoutView.as_view(), name='logout'),
     path('register', RegisterView.as_view(), name='register'),
+    path('token', TokenObtainView.as_view(), name='token'),
+    path('token/refresh', TokenRefreshView.as_view(), name='token-refresh'),
 ]
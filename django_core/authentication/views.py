@@ -1,31 +1,52 @@
-from django.contrib.auth import authenticate, login
+from django.contrib.auth import login
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from .serializers import UserLoginSerializer, RegisterSerializer
+from .serializers import UserLoginSerializer, RegisterSerializer, TokenRefreshSerializer
+from .tokens import issue_tokens
 from rest_framework.permissions import IsAuthenticated, AllowAny
 
 
 class LoginView(APIView):
     def post(self, request):
-        serializer = UserLoginSerializer(data=request.data)
+        # The serializer authenticates, so the password is hashed once per
+        # attempt; with an outdated hasher it is upgraded at the same time.
+        serializer = UserLoginSerializer(data=request.data, context={"request": request})
         serializer.is_valid(raise_exception=True)
 
-        user = authenticate(
-            username=serializer.validated_data["username"],
-            password=serializer.validated_data["password"]
-        )
-        if user is not None:
-            login(request, user)
-            return Response({
-                "id": user.id,
-                "username": user.username,
-                "email": user.email
-            }, status=status.HTTP_200_OK)
-        return Response(
-            {"non_field_errors": ["Invalid credentials."]},
-            status=status.HTTP_400_BAD_REQUEST
-        )
+        user = serializer.validated_data["user"]
+        login(request, user)
+        return Response({
+            "id": user.id,
+            "username": user.username,
+            "email": user.email
+        }, status=status.HTTP_200_OK)
+
+
+class TokenObtainView(APIView):
+    """
+    Exchanges a username and password for an access and a refresh token,
+    for clients authenticating with ``Authorization: Bearer <access>``
+    instead of the session cookie.
+    """
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def post(self, request):
+        serializer = UserLoginSerializer(data=request.data, context={"request": request})
+        serializer.is_valid(raise_exception=True)
+        return Response(issue_tokens(serializer.validated_data["user"]), status=status.HTTP_200_OK)
+
+
+class TokenRefreshView(APIView):
+    """Exchanges a refresh token for a new access and refresh token."""
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def post(self, request):
+        serializer = TokenRefreshSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        return Response(issue_tokens(serializer.validated_data["user"]), status=status.HTTP_200_OK)
 
 
 class LogoutView(APIView):
@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "auto_care.settings")
+# Settings default to no persistent connections under ASGI.
+os.environ.setdefault("SERVER_MODE", "asgi")
 
 application = get_asgi_application()
@@ -0,0 +1,18 @@
+"""
+Async read-only endpoints, served under /api/async/. They return the same
+payloads as the list and retrieve actions of the DRF viewsets.
+"""
+from django.urls import path
+
+from clients.views import ClientAsyncView
+from products.views import ProductAsyncView
+from services.views import ServiceAsyncView
+
+urlpatterns = [
+    path("products/", ProductAsyncView.as_view(), name="async-product-list"),
+    path("products/<uuid:pk>/", ProductAsyncView.as_view(), name="async-product-detail"),
+    path("services/", ServiceAsyncView.as_view(), name="async-service-list"),
+    path("services/<uuid:pk>/", ServiceAsyncView.as_view(), name="async-service-detail"),
+    path("clients/", ClientAsyncView.as_view(), name="async-client-list"),
+    path("clients/<uuid:pk>/", ClientAsyncView.as_view(), name="async-client-detail"),
+]
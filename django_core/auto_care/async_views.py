@@ -0,0 +1,121 @@
+"""
+Read-only views running natively under ASGI.
+
+DRF views are synchronous, so under an ASGI server each request to them
+holds a thread for its whole duration. The views below are plain Django
+``async`` views: rows are read with the async ORM (``aiterator``, ``aget``)
+and serialized with the same DRF serializers as the sync endpoints, so a
+worker keeps serving other clients while a slow one is waiting on the
+database or on the network.
+
+Requests are authenticated by session or by bearer access token (see
+authentication.tokens). Lists are paginated like
+``CreatedAtCursorPagination``, by keyset on ``(created_at, id)``, and
+answer ``{"next": <url or null>, "results": [...]}``.
+"""
+from django.conf import settings
+from django.core import signing
+from django.db.models import Q
+from django.http import JsonResponse
+from django.utils.dateparse import parse_datetime
+from django.views import View
+from rest_framework.utils.encoders import JSONEncoder
+
+from authentication.authentication import get_bearer_token
+from authentication.tokens import InvalidToken, user_from_access_token
+
+CURSOR_SALT = "async.cursor"
+
+
+class AsyncReadView(View):
+    """
+    Base of the async list/retrieve views. Subclasses set
+    ``serializer_class`` and implement ``get_queryset(profile)``.
+    """
+
+    http_method_names = ["get", "head", "options"]
+    serializer_class = None
+    ordering = ("created_at", "id")
+    page_size_query_param = "page_size"
+    max_page_size = 500
+
+    def get_queryset(self, profile):
+        raise NotImplementedError
+
+    async def get(self, request, pk=None):
+        token = get_bearer_token(request)
+        if token is not None:
+            try:
+                user = user_from_access_token(token)
+            except InvalidToken as exc:
+                return self.respond({"detail": str(exc)}, status=403)
+        else:
+            user = await request.auser()
+        if not user.is_authenticated:
+            return self.respond({"detail": "Authentication credentials were not provided."}, status=403)
+
+        # ProfileModelBackend loads the profile along with the user, and
+        # token users carry theirs.
+        queryset = self.get_queryset(user.profile)
+        if pk is None:
+            return await self.list(request, queryset)
+        return await self.retrieve(request, queryset, pk)
+
+    async def list(self, request, queryset):
+        try:
+            page_size = self.get_page_size(request)
+        except ValueError:
+            return self.respond({self.page_size_query_param: ["A valid integer is required."]}, status=400)
+
+        cursor = request.GET.get("cursor")
+        if cursor:
+            try:
+                created_at, pk = signing.loads(cursor, salt=CURSOR_SALT)
+            except (signing.BadSignature, TypeError, ValueError):
+                return self.respond({"detail": "Invalid cursor"}, status=404)
+            created_at = parse_datetime(created_at)
+            queryset = queryset.filter(
+                Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk)
+            )
+
+        # One row past the page tells whether there is a next one.
+        rows = [
+            row
+            async for row in queryset.order_by(*self.ordering)[: page_size + 1].aiterator(
+                chunk_size=page_size + 1
+            )
+        ]
+        next_url = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            last = rows[-1]
+            params = request.GET.copy()
+            params["cursor"] = signing.dumps([last.created_at.isoformat(), str(last.pk)], salt=CURSOR_SALT)
+            next_url = request.build_absolute_uri(f"{request.path}?{params.urlencode()}")
+
+        return self.respond({"next": next_url, "results": self.serialize(request, rows, many=True)})
+
+    async def retrieve(self, request, queryset, pk):
+        try:
+            instance = await queryset.aget(pk=pk)
+        except queryset.model.DoesNotExist:
+            message = "No %s matches the given query." % queryset.model._meta.object_name
+            return self.respond({"detail": message}, status=404)
+        return self.respond(self.serialize(request, instance))
+
+    def get_page_size(self, request):
+        value = request.GET.get(self.page_size_query_param)
+        if not value:
+            return settings.REST_FRAMEWORK["PAGE_SIZE"]
+        page_size = int(value)
+        if page_size <= 0:
+            raise ValueError(value)
+        return min(page_size, self.max_page_size)
+
+    def serialize(self, request, data, many=False):
+        # Rows arrive with everything the serializer reads already loaded, so
+        # this runs without touching the database.
+        return self.serializer_class(data, many=many, context={"request": request}).data
+
+    def respond(self, data, status=200):
+        return JsonResponse(data, status=status, safe=False, encoder=JSONEncoder)
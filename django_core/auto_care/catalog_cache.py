@@ -0,0 +1,121 @@
+"""
+Read-through cache of the product and service catalogs.
+
+Cached list pages are keyed per profile and per namespace (``products``,
+``services``) with a version number stored in the cache itself. Writes do
+not delete anything: they bump the version, which makes every page cached
+for that profile and namespace unreachable at once, and the stale entries
+simply expire.
+
+The validators (``ETag``, ``Last-Modified``) of a cached page are cached
+along with it, so conditional requests hitting the cache are answered
+without touching the database either.
+
+The cache alias and timeout come from the ``CATALOG_CACHE_ALIAS`` and
+``CATALOG_CACHE_TIMEOUT`` settings. Pages are only served from the cache
+when ``CATALOG_CACHE_ENABLED`` is set, which needs a cache shared by every
+process as soon as there is more than one: a bump made in one worker is not
+seen by the others with a per-process cache.
+"""
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+from rest_framework.response import Response
+
+PRODUCTS = "products"
+SERVICES = "services"
+
+
+def _cache():
+    return caches[settings.CATALOG_CACHE_ALIAS]
+
+
+def _version_key(profile_id, namespace):
+    return f"catalog:{profile_id}:{namespace}:version"
+
+
+def get_version(profile_id, namespace):
+    cache = _cache()
+    key = _version_key(profile_id, namespace)
+    version = cache.get(key)
+    if version is None:
+        # Starting from the clock rather than 1 keeps a version that was
+        # evicted from being reused while pages cached under it still live.
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def _incr(profile_id, namespaces):
+    cache = _cache()
+    for namespace in namespaces:
+        key = _version_key(profile_id, namespace)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time.time_ns(), timeout=None)
+
+
+def bump(profile_id, *namespaces):
+    """
+    Invalidates the cached catalog pages of ``profile_id`` in ``namespaces``.
+
+    The version is bumped right away, so the writing transaction reads its
+    own changes, and once more on commit, so a page cached by a concurrent
+    request before the commit is not served afterwards.
+    """
+    _incr(profile_id, namespaces)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: _incr(profile_id, namespaces))
+
+
+def page_key(profile_id, namespace, url):
+    digest = hashlib.sha256(url.encode()).hexdigest()
+    return f"catalog:{profile_id}:{namespace}:{get_version(profile_id, namespace)}:{digest}"
+
+
+class CatalogCacheMixin:
+    """
+    Serves ``list`` from the catalog cache. The cached value is the
+    serialized page, so a hit costs neither a query nor serialization.
+    Subclasses set ``catalog_namespace``.
+    """
+
+    catalog_namespace = None
+    cached_headers = ("ETag", "Last-Modified")
+
+    def list(self, request, *args, **kwargs):
+        if not settings.CATALOG_CACHE_ENABLED:
+            return super().list(request, *args, **kwargs)
+        key = page_key(request.user.profile.pk, self.catalog_namespace, request.build_absolute_uri())
+        cache = _cache()
+        entry = cache.get(key)
+        if entry is not None:
+            return self._cached_response(request, entry)
+
+        response = super().list(request, *args, **kwargs)
+        if response.status_code == 200:
+            entry = {
+                "data": response.data,
+                "headers": {name: response[name] for name in self.cached_headers if name in response},
+            }
+            cache.set(key, entry, timeout=settings.CATALOG_CACHE_TIMEOUT)
+        return response
+
+    def _cached_response(self, request, entry):
+        headers = entry["headers"]
+        response = get_conditional_response(
+            request,
+            etag=headers.get("ETag"),
+            last_modified=parse_http_date_safe(headers.get("Last-Modified")),
+        )
+        if response is None:
+            response = Response(entry["data"])
+        for name, value in headers.items():
+            response[name] = value
+        return response
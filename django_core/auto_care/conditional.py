@@ -0,0 +1,104 @@
+"""
+Conditional GET for the resource viewsets.
+
+The validators of a response are derived from ``Max(updated_at)`` and the
+row count of the rows behind it, so checking them costs one aggregate
+query and a client holding a current copy gets a 304 without anything
+being loaded or serialized.
+
+For lists, ``Max(updated_at)`` is taken over all of the tenant's rows,
+soft-deleted ones included: a delete bumps the row's ``updated_at``, so it
+moves ``Last-Modified`` forward even though the row left the list.
+"""
+import hashlib
+
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max, Q
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+
+class ConditionalGetMixin:
+    """
+    Adds ``ETag`` and ``Last-Modified`` to ``list`` and ``retrieve`` and
+    answers ``If-None-Match``/``If-Modified-Since`` with 304.
+
+    Viewsets whose payload embeds other models override
+    ``get_conditional_dependencies`` to return querysets of those models;
+    their latest ``updated_at`` is folded into the validators.
+    """
+
+    def get_conditional_dependencies(self):
+        return []
+
+    def get_conditional_scope(self):
+        """The tenant's rows, soft-deleted ones included."""
+        return self.get_queryset().model._default_manager.filter(user=self.request.user.profile)
+
+    def _validators(self, request, queryset, scope=None):
+        if scope is None:
+            state = queryset.order_by().aggregate(
+                last_modified=Max("updated_at"), count=Count("pk")
+            )
+        else:
+            # Still one query: the count of listed rows is taken over the scope.
+            state = scope.order_by().aggregate(
+                last_modified=Max("updated_at"),
+                count=Count("pk", filter=Q(pk__in=queryset.order_by().values("pk"))),
+            )
+        timestamps = [state["last_modified"]]
+        for dependency in self.get_conditional_dependencies():
+            timestamps.append(
+                dependency.order_by().aggregate(last_modified=Max("updated_at"))["last_modified"]
+            )
+
+        fingerprint = repr((
+            state["count"],
+            [timestamp.isoformat() if timestamp else None for timestamp in timestamps],
+            request.get_full_path(),
+            request.accepted_media_type,
+        ))
+        etag = f'"{hashlib.md5(fingerprint.encode()).hexdigest()}"'
+        last_modified = max((timestamp for timestamp in timestamps if timestamp), default=None)
+        return state["count"], etag, last_modified
+
+    def _conditional_response(self, request, queryset, handler, single=False, scope=None):
+        try:
+            count, etag, last_modified = self._validators(request, queryset, scope)
+        except (TypeError, ValueError, ValidationError):
+            # Malformed lookup value, left to the regular 404 handling.
+            return handler()
+        if single and not count:
+            return handler()
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+
+        response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if response is None:
+            response = handler()
+        if response.status_code == 200 or response.status_code == 304:
+            response["ETag"] = etag
+            if timestamp is not None:
+                response["Last-Modified"] = http_date(timestamp)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        handler = super().list
+        return self._conditional_response(
+            request,
+            self.filter_queryset(self.get_queryset()),
+            lambda: handler(request, *args, **kwargs),
+            scope=self.get_conditional_scope(),
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        handler = super().retrieve
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            queryset = self.get_queryset().filter(
+                **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+            )
+        except (TypeError, ValueError, ValidationError):
+            return handler(request, *args, **kwargs)
+        return self._conditional_response(
+            request, queryset, lambda: handler(request, *args, **kwargs), single=True
+        )
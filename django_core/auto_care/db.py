@@ -0,0 +1,76 @@
+"""
+Report of the database connection settings in effect: persistent
+connections (``CONN_MAX_AGE``, ``CONN_HEALTH_CHECKS``) or the psycopg 3
+pool (``OPTIONS["pool"]``), see the ``DB_*`` variables in settings.py.
+
+Printed by ``python -m auto_care.db`` and logged by gunicorn when the
+master process is ready. Only ``settings.DATABASES`` is read, so neither
+needs ``django.setup()``: the gunicorn master must not import the apps,
+or workers forked after a SIGHUP would inherit the old code.
+"""
+import os
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+
+def describe(alias=DEFAULT_DB_ALIAS, databases=None):
+    """Connection settings of ``alias`` (from ``databases`` or DATABASES) as a flat dict."""
+    if databases is None:
+        databases = settings.DATABASES
+    settings_dict = databases[alias]
+    pool = settings_dict.get("OPTIONS", {}).get("pool")
+    # Missing keys take Django's defaults.
+    info = {
+        "alias": alias,
+        "engine": settings_dict["ENGINE"],
+        "host": settings_dict.get("HOST") or "-",
+        "name": str(settings_dict.get("NAME", "")),
+        "conn_max_age": settings_dict.get("CONN_MAX_AGE", 0),
+        "conn_health_checks": settings_dict.get("CONN_HEALTH_CHECKS", False),
+        "pool": bool(pool),
+    }
+    if pool:
+        if pool is True:
+            pool = {}
+        # Unset keys fall back to the psycopg_pool.ConnectionPool defaults.
+        min_size = pool.get("min_size", 4)
+        info.update(
+            pool_min_size=min_size,
+            pool_max_size=pool.get("max_size") or min_size,
+            pool_timeout=pool.get("timeout", 30.0),
+            pool_max_idle=pool.get("max_idle", 600.0),
+            # Django checks pooled connections when CONN_HEALTH_CHECKS is on.
+            pool_check=info["conn_health_checks"],
+        )
+    return info
+
+
+def report(alias=DEFAULT_DB_ALIAS, databases=None):
+    info = describe(alias, databases)
+    lines = [f"database {info['alias']}: {info['engine']} {info['name']}@{info['host']}"]
+    if info["pool"]:
+        lines.append(
+            f"  pool: min_size={info['pool_min_size']} max_size={info['pool_max_size']} "
+            f"timeout={info['pool_timeout']}s max_idle={info['pool_max_idle']}s "
+            f"check={'on' if info['pool_check'] else 'off'}"
+        )
+    elif info["conn_max_age"] is None:
+        lines.append("  persistent connections: unlimited")
+    elif info["conn_max_age"]:
+        lines.append(f"  persistent connections: {info['conn_max_age']}s")
+    else:
+        lines.append("  persistent connections: off (one connection per request)")
+    if not info["pool"]:
+        lines.append(f"  health checks: {'on' if info['conn_health_checks'] else 'off'}")
+    return "\n".join(lines)
+
+
+def main():
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "auto_care.settings")
+    for alias in settings.DATABASES:
+        print(report(alias))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+from rest_framework.pagination import CursorPagination
+
+
+class CreatedAtCursorPagination(CursorPagination):
+    """
+    Keyset pagination ordered by ``(created_at, id)``.
+
+    Each page is fetched with ``WHERE created_at > <cursor> ORDER BY
+    created_at, id LIMIT n`` so its cost does not depend on how deep the
+    client has paged. The per-tenant ``(user, created_at, id)`` indexes on
+    the paginated models back this query.
+    """
+
+    ordering = ("created_at", "id")
+    page_size_query_param = "page_size"
+    max_page_size = 500
+
+
+class StartsAtCursorPagination(CreatedAtCursorPagination):
+    """Keyset pagination of time slots, ordered by ``(starts_at, id)``."""
+
+    ordering = ("starts_at", "id")
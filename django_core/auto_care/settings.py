@@ -12,6 +12,8 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 import os
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 DATA_DIR = BASE_DIR.parent / 'data' / 'web'
@@ -45,6 +47,10 @@ INSTALLED_APPS = [
     "products",
     "services",
     "clients",
+    "executions",
+    "reports",
+    "appointments",
+    "sync",
 ]
 
 MIDDLEWARE = [
@@ -80,6 +86,9 @@ WSGI_APPLICATION = "auto_care.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# Set by scripts/commands.sh and auto_care/asgi.py (dev, wsgi or asgi).
+SERVER_MODE = os.getenv('SERVER_MODE', 'dev')
+
 DATABASES = {
     "default": {
         'ENGINE': os.getenv('DB_ENGINE', 'django.db.backends.sqlite3'),
@@ -88,9 +97,41 @@ DATABASES = {
         'PASSWORD': os.getenv('POSTGRES_PASSWORD', ''),
         'HOST': os.getenv('POSTGRES_HOST', ''),
         'PORT': os.getenv('POSTGRES_PORT', ''),
+        # Keep connections open between requests (seconds, 0 closes them
+        # after each request) and ping them before reuse. Off by default
+        # under ASGI, where Django opens connections per executor thread and
+        # does not reliably close them; use DB_POOL there instead.
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', '0' if SERVER_MODE == 'asgi' else '60')),
+        'CONN_HEALTH_CHECKS': os.getenv('DB_CONN_HEALTH_CHECKS', 'true').lower() == 'true',
+        'OPTIONS': {},
     }
 }
 
+# Native connection pool of psycopg 3 (PostgreSQL only), one per process.
+# Pooled connections replace persistent ones, so CONN_MAX_AGE must be 0;
+# CONN_HEALTH_CHECKS makes Django check them when taken from the pool.
+# Run "python -m auto_care.db" to print the configuration in effect.
+
+DB_POOL = os.getenv('DB_POOL', 'false').lower() == 'true'
+
+if DB_POOL and DATABASES['default']['ENGINE'] == 'django.db.backends.postgresql':
+    DATABASES['default']['CONN_MAX_AGE'] = 0
+    DATABASES['default']['OPTIONS']['pool'] = {
+        'min_size': int(os.getenv('DB_POOL_MIN_SIZE', '2')),
+        'max_size': int(os.getenv('DB_POOL_MAX_SIZE', '10')),
+        # Seconds a request waits for a free connection before failing.
+        'timeout': float(os.getenv('DB_POOL_TIMEOUT', '10')),
+        'max_idle': float(os.getenv('DB_POOL_MAX_IDLE', '300')),
+    }
+
+
+# Authentication backends
+# https://docs.djangoproject.com/en/5.2/topics/auth/customizing/#authentication-backends
+
+AUTHENTICATION_BACKENDS = [
+    "authentication.backends.ProfileModelBackend",
+]
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -111,6 +152,33 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Password hashing
+# https://docs.djangoproject.com/en/5.1/topics/auth/passwords/
+# PASSWORD_HASHER picks the hasher for new passwords: pbkdf2 (default),
+# argon2 or bcrypt. The others stay listed so existing hashes still verify;
+# they are rehashed with the chosen one on the user's next login.
+# "python manage.py bench_login" compares their cost per login.
+
+PASSWORD_HASHER_CHOICES = {
+    "pbkdf2": "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "argon2": "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "bcrypt": "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+}
+
+PASSWORD_HASHER = os.getenv("PASSWORD_HASHER", "pbkdf2")
+if PASSWORD_HASHER not in PASSWORD_HASHER_CHOICES:
+    raise ImproperlyConfigured(
+        f"PASSWORD_HASHER must be one of {', '.join(PASSWORD_HASHER_CHOICES)}, not {PASSWORD_HASHER!r}."
+    )
+
+PASSWORD_HASHERS = [PASSWORD_HASHER_CHOICES[PASSWORD_HASHER]] + [
+    hasher for name, hasher in PASSWORD_HASHER_CHOICES.items() if name != PASSWORD_HASHER
+] + [
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
 
@@ -134,6 +202,81 @@ MEDIA_URL = '/media/'
 # /data/web/media
 MEDIA_ROOT = DATA_DIR / 'media'
 
+# Django REST framework
+# https://www.django-rest-framework.org/api-guide/settings/
+
+REST_FRAMEWORK = {
+    # Sessions for the admin and the browser; signed bearer tokens
+    # (/api/auth/token) for stateless clients. Session stays first so that
+    # unauthenticated requests keep answering 403.
+    "DEFAULT_AUTHENTICATION_CLASSES": [
+        "rest_framework.authentication.SessionAuthentication",
+        "rest_framework.authentication.BasicAuthentication",
+        "authentication.authentication.SignedTokenAuthentication",
+    ],
+    "DEFAULT_PAGINATION_CLASS": "auto_care.pagination.CreatedAtCursorPagination",
+    "PAGE_SIZE": int(os.getenv("API_PAGE_SIZE", "50")),
+    # ?search= on views declaring search_fields; backed by pg_trgm indexes
+    # on PostgreSQL (see the *_search_trgm_idx migrations).
+    "DEFAULT_FILTER_BACKENDS": ["rest_framework.filters.SearchFilter"],
+}
+
+# Lifetime of the tokens issued by /api/auth/token, in seconds.
+
+AUTH_ACCESS_TOKEN_SECONDS = int(os.getenv("AUTH_ACCESS_TOKEN_SECONDS", "900"))
+AUTH_REFRESH_TOKEN_SECONDS = int(os.getenv("AUTH_REFRESH_TOKEN_SECONDS", str(14 * 24 * 3600)))
+
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# Local memory by default; set CACHE_URL (redis://...) to share the cache
+# between processes.
+
+if os.getenv("CACHE_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.getenv("CACHE_URL"),
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+# The catalog cache (auto_care/catalog_cache.py) is invalidated by bumping a
+# version stored in the cache, which only reaches the other processes if the
+# cache is shared. It is therefore on by default only with CACHE_URL; with
+# the local memory cache, CATALOG_CACHE=true is only correct when a single
+# process serves the API (e.g. runserver or GUNICORN_WORKERS=1).
+
+CATALOG_CACHE_ENABLED = os.getenv("CATALOG_CACHE", "true" if os.getenv("CACHE_URL") else "false").lower() == "true"
+CATALOG_CACHE_ALIAS = "default"
+CATALOG_CACHE_TIMEOUT = int(os.getenv("CATALOG_CACHE_TIMEOUT", "300"))
+
+# Appointments
+# Opening hours (HH:MM, local time) used by the free slot search, and how
+# many days ahead it looks.
+
+APPOINTMENT_OPENING_TIME = os.getenv("APPOINTMENT_OPENING_TIME", "08:00")
+APPOINTMENT_CLOSING_TIME = os.getenv("APPOINTMENT_CLOSING_TIME", "18:00")
+APPOINTMENT_SEARCH_DAYS = int(os.getenv("APPOINTMENT_SEARCH_DAYS", "14"))
+
+# Reminders are sent APPOINTMENT_REMINDER_MINUTES before an appointment by
+# the dispatch_reminders command, through REMINDER_BACKEND
+# (appointments.backends.ConsoleBackend, FileBackend or LocMemBackend).
+
+APPOINTMENT_REMINDER_MINUTES = int(os.getenv("APPOINTMENT_REMINDER_MINUTES", "1440"))
+REMINDER_BACKEND = os.getenv("REMINDER_BACKEND", "appointments.backends.ConsoleBackend")
+REMINDER_FILE_PATH = os.getenv("REMINDER_FILE_PATH", str(DATA_DIR / "reminders.log"))
+
+# Delta sync
+# Rows updated during the last SYNC_SETTLE_SECONDS are left for the next
+# sync, so that transactions still committing are not skipped.
+
+SYNC_SETTLE_SECONDS = int(os.getenv("SYNC_SETTLE_SECONDS", "5"))
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -0,0 +1,88 @@
+import importlib.util
+
+import pytest
+from django.db.utils import ConnectionHandler
+from psycopg_pool import ConnectionPool
+
+from auto_care import settings as project_settings
+from auto_care.db import describe, report
+
+POSTGRES = "django.db.backends.postgresql"
+
+
+@pytest.fixture
+def load_settings(monkeypatch):
+    """Evaluates settings.py afresh with the given environment."""
+
+    def _load_settings(**env):
+        for name in ("DB_ENGINE", "DB_POOL", "DB_CONN_MAX_AGE", "DB_CONN_HEALTH_CHECKS", "SERVER_MODE"):
+            monkeypatch.delenv(name, raising=False)
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        spec = importlib.util.spec_from_file_location("settings_under_test", project_settings.__file__)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    return _load_settings
+
+
+class TestDatabaseSettings:
+
+    def test_persistent_connections_by_default(self, load_settings):
+        databases = load_settings().DATABASES
+
+        info = describe(databases=databases)
+
+        assert info["conn_max_age"] == 60
+        assert info["conn_health_checks"] is True
+        assert info["pool"] is False
+        assert report(databases=databases).splitlines()[1:] == [
+            "  persistent connections: 60s",
+            "  health checks: on",
+        ]
+
+    def test_no_persistent_connections_under_asgi(self, load_settings):
+        databases = load_settings(SERVER_MODE="asgi").DATABASES
+
+        assert describe(databases=databases)["conn_max_age"] == 0
+        assert "  persistent connections: off (one connection per request)" in report(databases=databases)
+
+    def test_explicit_max_age_wins_under_asgi(self, load_settings):
+        databases = load_settings(SERVER_MODE="asgi", DB_CONN_MAX_AGE="30").DATABASES
+
+        assert describe(databases=databases)["conn_max_age"] == 30
+
+    def test_pool_is_ignored_on_sqlite(self, load_settings):
+        databases = load_settings(DB_POOL="true").DATABASES
+
+        assert describe(databases=databases)["pool"] is False
+
+    def test_pool_on_postgresql(self, load_settings):
+        databases = load_settings(DB_ENGINE=POSTGRES, DB_POOL="true").DATABASES
+
+        info = describe(databases=databases)
+
+        assert info["conn_max_age"] == 0
+        assert (info["pool_min_size"], info["pool_max_size"]) == (2, 10)
+        assert (info["pool_timeout"], info["pool_max_idle"]) == (10.0, 300.0)
+        assert info["pool_check"] is True
+        assert report(databases=databases).splitlines()[1] == (
+            "  pool: min_size=2 max_size=10 timeout=10.0s max_idle=300.0s check=on"
+        )
+
+    @pytest.mark.parametrize("health_checks, check", [("true", ConnectionPool.check_connection), ("false", None)])
+    def test_pool_options_are_accepted_by_the_backend(self, load_settings, health_checks, check):
+        databases = load_settings(
+            DB_ENGINE=POSTGRES, POSTGRES_DB="autocare", DB_POOL="true", DB_CONN_HEALTH_CHECKS=health_checks
+        ).DATABASES
+        connection = ConnectionHandler(databases)["default"]
+
+        # Builds the (unopened) pool; no connection is made.
+        pool = connection.pool
+        try:
+            assert (pool.min_size, pool.max_size, pool.timeout) == (2, 10, 10.0)
+            assert pool._check == check
+            assert describe(databases=databases)["pool_check"] is (check is not None)
+        finally:
+            connection.close_pool()
@@ -26,6 +26,11 @@ urlpatterns = [
     path("api/products/", include("products.urls")),
     path("api/services/", include("services.urls")),
     path("api/clients/", include("clients.urls")),
+    path("api/executions/", include("executions.urls")),
+    path("api/reports/", include("reports.urls")),
+    path("api/appointments/", include("appointments.urls")),
+    path("api/sync/", include("sync.urls")),
+    path("api/async/", include("auto_care.async_urls")),
 ]
 
 if settings.DEBUG:
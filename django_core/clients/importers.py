@@ -0,0 +1,113 @@
+import csv
+import json
+
+from django.core.exceptions import ValidationError
+
+from clients.models import Client
+
+FORMAT_CSV = "csv"
+FORMAT_NDJSON = "ndjson"
+FORMATS = (FORMAT_CSV, FORMAT_NDJSON)
+
+DUPLICATE_EMAIL_MESSAGE = "This email address is already registered for one of your clients."
+
+
+def guess_format(filename):
+    """Returns the import format matching the file extension, or None."""
+    extension = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+    if extension in ("ndjson", "jsonl"):
+        return FORMAT_NDJSON
+    if extension == "csv":
+        return FORMAT_CSV
+    return None
+
+
+class ClientImporter:
+    """
+    Imports clients for a profile from a stream of CSV or NDJSON lines.
+
+    Rows are read one at a time and inserted in batches of ``batch_size``,
+    so memory use does not grow with the size of the file. The emails the
+    profile already uses are loaded once up front and every imported email
+    is added to that set, which replaces the per-row ``exists()`` query
+    done by ``ClientSerializer``. Invalid rows are skipped and reported,
+    the valid ones are kept.
+    """
+
+    fields = ("full_name", "phone", "email")
+    max_reported_errors = 100
+
+    def __init__(self, profile, batch_size=1000):
+        self.profile = profile
+        self.batch_size = batch_size
+        self.created = 0
+        self.failed = 0
+        self.errors = []
+
+    def run(self, lines, file_format):
+        if file_format not in FORMATS:
+            raise ValueError(f"Unsupported import format: {file_format}")
+
+        emails = set(
+            Client.objects.filter(user=self.profile, email__isnull=False)
+            .values_list("email", flat=True)
+            .iterator()
+        )
+
+        batch = []
+        for line_number, row in self._read(lines, file_format):
+            try:
+                client = self._build(row, emails)
+            except ValidationError as exc:
+                self._fail(line_number, exc.messages)
+                continue
+
+            emails.add(client.email)
+            batch.append(client)
+            if len(batch) >= self.batch_size:
+                self._flush(batch)
+                batch = []
+        self._flush(batch)
+
+        return {"created": self.created, "failed": self.failed, "errors": self.errors}
+
+    def _read(self, lines, file_format):
+        if file_format == FORMAT_CSV:
+            reader = csv.DictReader(lines)
+            for row in reader:
+                yield reader.line_num, row
+            return
+
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError:
+                row = None
+            if not isinstance(row, dict):
+                self._fail(line_number, ["Line is not a JSON object."])
+                continue
+            yield line_number, row
+
+    def _build(self, row, emails):
+        values = {}
+        for field in self.fields:
+            value = row.get(field)
+            values[field] = str(value).strip() if value is not None else None
+
+        client = Client(user=self.profile, **values)
+        client.full_clean(exclude=["user"], validate_unique=False, validate_constraints=False)
+        if client.email in emails:
+            raise ValidationError(DUPLICATE_EMAIL_MESSAGE)
+        return client
+
+    def _flush(self, batch):
+        if batch:
+            Client.objects.bulk_create(batch)
+            self.created += len(batch)
+
+    def _fail(self, line_number, messages):
+        self.failed += 1
+        if len(self.errors) < self.max_reported_errors:
+            self.errors.append({"line": line_number, "errors": messages})
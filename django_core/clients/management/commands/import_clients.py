@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from authentication.models import Profile
+from clients.importers import FORMATS, ClientImporter, guess_format
+
+
+class Command(BaseCommand):
+    help = "Imports clients for a user from a CSV or NDJSON file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("username", help="Owner of the imported clients.")
+        parser.add_argument("path", help="CSV or NDJSON file to import.")
+        parser.add_argument(
+            "--format",
+            dest="file_format",
+            choices=FORMATS,
+            help="File format. Guessed from the file extension when omitted.",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        try:
+            profile = Profile.objects.get(user__username=options["username"])
+        except Profile.DoesNotExist:
+            raise CommandError(f"No profile found for user '{options['username']}'.")
+
+        file_format = options["file_format"] or guess_format(options["path"])
+        if file_format is None:
+            raise CommandError("Could not guess the file format, use --format.")
+
+        importer = ClientImporter(profile, batch_size=options["batch_size"])
+        try:
+            with open(options["path"], encoding="utf-8-sig", newline="") as lines:
+                result = importer.run(lines, file_format)
+        except OSError as exc:
+            raise CommandError(str(exc))
+
+        for error in result["errors"]:
+            self.stderr.write(f"Line {error['line']}: {' '.join(error['errors'])}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{result['created']} clients imported, {result['failed']} rows rejected."
+            )
+        )
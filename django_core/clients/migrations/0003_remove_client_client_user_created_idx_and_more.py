@@ -0,0 +1,22 @@
+# Generated by Django 5.1.15 on 2026-10-18 08:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0001_initial'),
+        ('clients', '0002_client_client_user_created_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='client',
+            name='client_user_created_idx',
+        ),
+        migrations.AddIndex(
+            model_name='client',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['user', 'created_at', 'id'], name='client_user_live_idx'),
+        ),
+    ]
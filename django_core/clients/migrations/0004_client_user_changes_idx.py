@@ -0,0 +1,29 @@
+# Generated by Django 5.1.15 on 2026-10-18 09:06
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_deleted_at(apps, schema_editor):
+    # Rows soft-deleted before destroy() set deleted_at get their last
+    # update time as the deletion time.
+    Client = apps.get_model("clients", "Client")
+    Client.objects.filter(is_deleted=True, deleted_at__isnull=True).update(
+        deleted_at=F("updated_at")
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0001_initial'),
+        ('clients', '0003_remove_client_client_user_created_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='client',
+            index=models.Index(fields=['user', 'updated_at', 'id'], name='client_user_changes_idx'),
+        ),
+        migrations.RunPython(backfill_deleted_at, migrations.RunPython.noop),
+    ]
@@ -15,6 +15,16 @@ class Client(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     deleted_at = models.DateTimeField(null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["user", "created_at", "id"],
+                condition=models.Q(is_deleted=False),
+                name="client_user_live_idx",
+            ),
+            models.Index(fields=["user", "updated_at", "id"], name="client_user_changes_idx"),
+        ]
+
     def save(self, *args, **kwargs):
         self.full_clean()
         super().save(*args, **kwargs)
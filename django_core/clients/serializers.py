@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from clients.importers import FORMATS, guess_format
 from clients.models import Client
 
 
@@ -40,3 +41,15 @@ class ClientSerializer(serializers.ModelSerializer):
                     }
                 )
         return data
+
+
+class ClientImportSerializer(serializers.Serializer):
+    file = serializers.FileField()
+    file_format = serializers.ChoiceField(choices=FORMATS, required=False)
+
+    def validate(self, data):
+        if not data.get("file_format") and guess_format(data["file"].name) is None:
+            raise serializers.ValidationError(
+                {"file_format": ["Could not guess the file format from the file name."]}
+            )
+        return data
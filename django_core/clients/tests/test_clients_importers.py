@@ -0,0 +1,136 @@
+import io
+import json
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from clients.importers import ClientImporter, FORMAT_CSV, FORMAT_NDJSON, guess_format
+from clients.models import Client
+
+
+def csv_lines(*rows):
+    lines = ["full_name,phone,email\n"]
+    lines += [",".join(row) + "\n" for row in rows]
+    return iter(lines)
+
+
+@pytest.mark.django_db
+class TestClientImporter:
+
+    def test_imports_csv_rows_in_batches(self, create_profile, django_assert_num_queries):
+        profile = create_profile()
+        lines = csv_lines(*[
+            (f"Client {i}", f"4199999999{i}", f"client{i}@example.com") for i in range(5)
+        ])
+
+        # One query for the known emails plus one INSERT per batch of two.
+        with django_assert_num_queries(4):
+            result = ClientImporter(profile, batch_size=2).run(lines, FORMAT_CSV)
+
+        assert result == {"created": 5, "failed": 0, "errors": []}
+        assert Client.objects.filter(user=profile).count() == 5
+
+    def test_rejects_duplicated_and_invalid_rows(self, create_profile, create_client):
+        profile = create_profile()
+        create_client(profile=profile)
+        lines = csv_lines(
+            ("Known Email", "1111111111", "johndoe@example.com"),
+            ("New Client", "2222222222", "new@example.com"),
+            ("Repeated In File", "3333333333", "new@example.com"),
+            ("Bad Phone", "not-a-phone", "phone@example.com"),
+            ("", "4444444444", "noname@example.com"),
+        )
+
+        result = ClientImporter(profile).run(lines, FORMAT_CSV)
+
+        assert result["created"] == 1
+        assert result["failed"] == 4
+        assert [error["line"] for error in result["errors"]] == [2, 4, 5, 6]
+        assert Client.objects.filter(user=profile, email="new@example.com").count() == 1
+
+    def test_emails_of_other_profiles_are_not_duplicates(
+        self, create_profile, create_client
+    ):
+        other = create_profile(username="other")
+        create_client(profile=other)
+        profile = create_profile(username="me")
+
+        result = ClientImporter(profile).run(
+            csv_lines(("John Doe", "1111111111", "johndoe@example.com")), FORMAT_CSV
+        )
+
+        assert result["created"] == 1
+
+    def test_imports_ndjson_rows(self, create_profile):
+        profile = create_profile()
+        lines = iter([
+            json.dumps({"full_name": "Ana", "phone": 41999999999, "email": "ana@example.com"}) + "\n",
+            "\n",
+            "not json\n",
+            json.dumps(["a", "list"]) + "\n",
+        ])
+
+        result = ClientImporter(profile).run(lines, FORMAT_NDJSON)
+
+        assert result["created"] == 1
+        assert [error["line"] for error in result["errors"]] == [3, 4]
+        assert Client.objects.get(user=profile).phone == "41999999999"
+
+    def test_reported_errors_are_capped(self, create_profile):
+        profile = create_profile()
+        importer = ClientImporter(profile)
+        importer.max_reported_errors = 2
+
+        result = importer.run(csv_lines(*[("", "1", "a@example.com")] * 5), FORMAT_CSV)
+
+        assert result["failed"] == 5
+        assert len(result["errors"]) == 2
+
+    def test_unknown_format_is_rejected(self, create_profile):
+        with pytest.raises(ValueError):
+            ClientImporter(create_profile()).run(iter([]), "xlsx")
+
+    @pytest.mark.parametrize(
+        "filename, expected",
+        [
+            ("clients.csv", FORMAT_CSV),
+            ("clients.CSV", FORMAT_CSV),
+            ("clients.ndjson", FORMAT_NDJSON),
+            ("clients.jsonl", FORMAT_NDJSON),
+            ("clients.xlsx", None),
+            ("clients", None),
+        ],
+    )
+    def test_guess_format(self, filename, expected):
+        assert guess_format(filename) == expected
+
+
+@pytest.mark.django_db
+class TestImportClientsCommand:
+
+    def test_imports_file(self, create_profile, tmp_path):
+        profile = create_profile()
+        path = tmp_path / "clients.csv"
+        path.write_text(
+            "full_name,phone,email\nAna,41999999999,ana@example.com\n", encoding="utf-8"
+        )
+        out = io.StringIO()
+
+        call_command("import_clients", "john_doe", str(path), stdout=out)
+
+        assert "1 clients imported, 0 rows rejected." in out.getvalue()
+        assert Client.objects.filter(user=profile).count() == 1
+
+    def test_unknown_user_fails(self, db, tmp_path):
+        path = tmp_path / "clients.csv"
+        path.write_text("full_name,phone,email\n", encoding="utf-8")
+
+        with pytest.raises(CommandError):
+            call_command("import_clients", "nobody", str(path))
+
+    def test_unknown_format_fails(self, create_profile, tmp_path):
+        create_profile()
+        path = tmp_path / "clients.txt"
+        path.write_text("", encoding="utf-8")
+
+        with pytest.raises(CommandError):
+            call_command("import_clients", "john_doe", str(path))
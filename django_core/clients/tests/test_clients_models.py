@@ -1,4 +1,5 @@
 import pytest
+from django.db import connection
 from django.core.exceptions import ValidationError
 from clients.models import Client
 
@@ -64,3 +65,38 @@ class TestClientModel:
                 phone="invalid_phone",
                 email="test@teste",
             ).full_clean()
+
+
+@pytest.mark.django_db
+class TestClientIndexes:
+
+    @pytest.fixture(autouse=True)
+    def require_sqlite(self):
+        if connection.vendor != "sqlite":
+            pytest.skip("Query plan assertions are written for SQLite.")
+
+    def test_live_clients_listing_uses_partial_index(self, create_profile, create_client):
+        profile = create_profile()
+        live = create_client(profile)
+        deleted = create_client(profile)
+        deleted.is_deleted = True
+        deleted.save()
+
+        queryset = Client.objects.filter(is_deleted=False, user=profile).order_by(
+            "created_at", "id"
+        )
+        plan = queryset.explain()
+
+        assert "client_user_live_idx" in plan
+        assert "TEMP B-TREE" not in plan
+        assert list(queryset) == [live]
+
+    def test_client_cursor_page_uses_partial_index(self, create_profile, create_client):
+        profile = create_profile()
+        client = create_client(profile)
+
+        queryset = Client.objects.filter(
+            is_deleted=False, user=profile, created_at__gt=client.created_at
+        ).order_by("created_at", "id")
+
+        assert "client_user_live_idx" in queryset.explain()
@@ -1,11 +1,19 @@
+import json
 import pytest
+from uuid import uuid4
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.utils.http import http_date
 from rest_framework import status
+from clients.models import Client
 
 CREATE_URL = "/api/clients/"
 LIST_URL = "/api/clients/"
 RETRIEVE_URL = "/api/clients/{}/"
 UPDATE_URL = "/api/clients/{}/"
 DELETE_URL = "/api/clients/{}/"
+IMPORT_URL = "/api/clients/import/"
+ASYNC_LIST_URL = "/api/async/clients/"
+ASYNC_RETRIEVE_URL = "/api/async/clients/{}/"
 
 
 @pytest.mark.django_db
@@ -39,7 +47,29 @@ class TestClientView:
         api_client.force_authenticate(user=profile.user)
         response = api_client.get(LIST_URL)
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) > 0
+        assert len(response.data["results"]) > 0
+
+    def test_list_clients_is_cursor_paginated(
+        self, api_client, create_profile, create_client
+    ):
+        """Tests that the listing is paginated by cursor in creation order."""
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+
+        created = [create_client(profile=profile) for _ in range(3)]
+
+        response = api_client.get(LIST_URL, {"page_size": 2})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["previous"] is None
+        assert response.data["next"] is not None
+        first_page = [item["id"] for item in response.data["results"]]
+
+        response = api_client.get(response.data["next"])
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["next"] is None
+        second_page = [item["id"] for item in response.data["results"]]
+
+        assert first_page + second_page == [str(obj.id) for obj in created]
 
     def test_retrieve_client(self, api_client, create_profile, create_client):
         """Tests the retrieval of a specific client."""
@@ -91,6 +121,9 @@ class TestClientView:
         response = api_client.get(RETRIEVE_URL.format(client.id))
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
+        client.refresh_from_db()
+        assert client.is_deleted
+        assert client.deleted_at is not None
 
     def test_create_client_invalid_data(self, api_client, create_profile):
         """Tests the failure to create a client with invalid data."""
@@ -150,3 +183,249 @@ class TestClientView:
         data = {"full_name": "Should Not Work"}
         response = api_client.patch(UPDATE_URL.format(client.id), data)
         assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestClientImportView:
+    def test_import_csv_file(self, api_client, create_profile):
+        """Tests importing clients from an uploaded CSV file."""
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+        upload = SimpleUploadedFile(
+            "clients.csv",
+            "\ufefffull_name,phone,email\n"
+            "José Silva,41999999999,jose@example.com\n"
+            "Invalid,abc,invalid@example.com\n".encode("utf-8"),
+        )
+
+        response = api_client.post(IMPORT_URL, {"file": upload}, format="multipart")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["created"] == 1
+        assert response.data["failed"] == 1
+        assert Client.objects.get(user=profile).full_name == "José Silva"
+
+    def test_import_ndjson_with_explicit_format(self, api_client, create_profile):
+        """Tests importing an NDJSON file whose name has no known extension."""
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+        upload = SimpleUploadedFile(
+            "export.txt",
+            b'{"full_name": "Ana", "phone": "41999999999", "email": "ana@example.com"}\n',
+        )
+
+        response = api_client.post(
+            IMPORT_URL, {"file": upload, "file_format": "ndjson"}, format="multipart"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["created"] == 1
+
+    def test_import_requires_known_format(self, api_client, create_profile):
+        """Tests that files with an unknown format are rejected."""
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+        upload = SimpleUploadedFile("clients.xlsx", b"full_name,phone,email\n")
+
+        response = api_client.post(IMPORT_URL, {"file": upload}, format="multipart")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "file_format" in response.data
+
+    def test_import_rejects_non_utf8_files(self, api_client, create_profile):
+        """Tests that files that are not UTF-8 encoded are rejected."""
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+        upload = SimpleUploadedFile(
+            "clients.csv", "full_name,phone,email\nJosé,1,a@b.com\n".encode("latin-1")
+        )
+
+        response = api_client.post(IMPORT_URL, {"file": upload}, format="multipart")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "file" in response.data
+
+
+@pytest.mark.django_db
+class TestClientExportView:
+    def test_export_csv(self, api_client, create_user, create_profile, create_client):
+        """Tests that the clients are streamed as CSV, oldest first."""
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+        first = create_client(profile=profile)
+        second = create_client(profile=profile)
+        create_client(profile=create_profile(user=create_user(username="other")))
+
+        response = api_client.get("/api/clients/export/csv/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        assert response["Content-Disposition"] == 'attachment; filename="clients.csv"'
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        assert lines[0].split(",")[0] == "id"
+        assert [line.split(",")[0] for line in lines[1:]] == [str(first.id), str(second.id)]
+
+    def test_export_ndjson(self, api_client, create_profile, create_client):
+        """Tests that the clients are streamed as one JSON object per line."""
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+        obj = create_client(profile=profile)
+
+        response = api_client.get("/api/clients/export/ndjson/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/x-ndjson"
+        rows = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+        assert len(rows) == 1
+        assert rows[0]["id"] == str(obj.id)
+        assert rows[0]["full_name"] == "John Doe"
+
+    def test_export_requires_authentication(self, api_client):
+        """Tests that anonymous users cannot export."""
+        response = api_client.get("/api/clients/export/csv/")
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+class TestClientConditionalGet:
+
+    def test_list_sends_validators(self, api_client, create_profile, create_client):
+        profile = create_profile()
+        client = create_client(profile)
+        api_client.force_authenticate(user=profile.user)
+
+        response = api_client.get(LIST_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"].startswith('"')
+        client.refresh_from_db()
+        assert response["Last-Modified"] == http_date(int(client.updated_at.timestamp()))
+
+    def test_unchanged_list_is_not_modified(
+        self, api_client, create_profile, create_client, django_assert_num_queries
+    ):
+        profile = create_profile()
+        create_client(profile)
+        api_client.force_authenticate(user=profile.user)
+        etag = api_client.get(LIST_URL)["ETag"]
+
+        with django_assert_num_queries(1):
+            response = api_client.get(LIST_URL, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b""
+        assert response["ETag"] == etag
+
+    def test_changes_produce_a_new_etag(self, api_client, create_profile, create_client):
+        profile = create_profile()
+        client = create_client(profile)
+        api_client.force_authenticate(user=profile.user)
+        etag = api_client.get(LIST_URL)["ETag"]
+
+        api_client.patch(UPDATE_URL.format(client.id), {"full_name": "Jane Doe"}, format="json")
+        response = api_client.get(LIST_URL, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] != etag
+
+        api_client.delete(DELETE_URL.format(client.id))
+        assert api_client.get(LIST_URL, HTTP_IF_NONE_MATCH=response["ETag"]).status_code == 200
+
+    def test_pages_have_their_own_etag(self, api_client, create_profile, create_client):
+        profile = create_profile()
+        create_client(profile)
+        api_client.force_authenticate(user=profile.user)
+
+        assert api_client.get(LIST_URL)["ETag"] != api_client.get(LIST_URL, {"page_size": 1})["ETag"]
+
+    def test_retrieve_if_modified_since(self, api_client, create_profile, create_client):
+        profile = create_profile()
+        client = create_client(profile)
+        api_client.force_authenticate(user=profile.user)
+        last_modified = api_client.get(RETRIEVE_URL.format(client.id))["Last-Modified"]
+
+        response = api_client.get(
+            RETRIEVE_URL.format(client.id), HTTP_IF_MODIFIED_SINCE=last_modified
+        )
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_retrieve_missing_or_malformed_id(self, api_client, create_profile):
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+
+        assert api_client.get(RETRIEVE_URL.format(uuid4())).status_code == 404
+        assert api_client.get(RETRIEVE_URL.format("not-a-uuid")).status_code == 404
+
+
+@pytest.mark.django_db
+class TestClientSearch:
+
+    @pytest.fixture
+    def clients(self, create_profile):
+        profile = create_profile()
+        ana = Client.objects.create(
+            user=profile, full_name="Ana Souza", phone="11987654321", email="ana@example.com"
+        )
+        bruno = Client.objects.create(
+            user=profile, full_name="Bruno Lima", phone="21912345678", email="bruno@garage.com"
+        )
+        return profile, ana, bruno
+
+    def search(self, api_client, term):
+        response = api_client.get(LIST_URL, {"search": term})
+        assert response.status_code == status.HTTP_200_OK
+        return [item["id"] for item in response.data["results"]]
+
+    def test_search_by_partial_name_ignoring_case(self, api_client, clients):
+        profile, ana, _ = clients
+        api_client.force_authenticate(user=profile.user)
+
+        assert self.search(api_client, "souz") == [str(ana.id)]
+
+    def test_search_by_phone_and_email(self, api_client, clients):
+        profile, ana, bruno = clients
+        api_client.force_authenticate(user=profile.user)
+
+        assert self.search(api_client, "98765") == [str(ana.id)]
+        assert self.search(api_client, "garage") == [str(bruno.id)]
+
+    def test_every_term_must_match(self, api_client, clients):
+        profile, _, bruno = clients
+        api_client.force_authenticate(user=profile.user)
+
+        assert self.search(api_client, "bruno 219") == [str(bruno.id)]
+        assert self.search(api_client, "bruno 119") == []
+
+    def test_search_is_scoped_to_profile(self, api_client, clients, create_user, create_profile):
+        other = create_profile(user=create_user(username="other"))
+        api_client.force_authenticate(user=other.user)
+
+        assert self.search(api_client, "ana") == []
+
+    def test_search_applies_to_export(self, api_client, clients):
+        profile, ana, _ = clients
+        api_client.force_authenticate(user=profile.user)
+
+        response = api_client.get("/api/clients/export/ndjson/", {"search": "ana"})
+
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        assert [json.loads(line)["id"] for line in lines] == [str(ana.id)]
+
+
+@pytest.mark.django_db
+class TestClientAsyncView:
+
+    def test_list_and_retrieve(self, api_client, create_client):
+        client = create_client()
+        api_client.force_login(client.user.user)
+
+        response = api_client.get(ASYNC_LIST_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.json()["results"]] == [str(client.id)]
+        assert api_client.get(ASYNC_RETRIEVE_URL.format(client.id)).json()["email"] == "johndoe@example.com"
+        assert api_client.get(ASYNC_RETRIEVE_URL.format(uuid4())).status_code == status.HTTP_404_NOT_FOUND
+
+    def test_requires_authentication(self, api_client):
+        assert api_client.get(ASYNC_LIST_URL).status_code == status.HTTP_403_FORBIDDEN
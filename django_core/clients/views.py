@@ -1,31 +1,80 @@
+import codecs
+
+from django.utils import timezone
 from rest_framework import viewsets, status
+from rest_framework.decorators import action
+from rest_framework.parsers import MultiPartParser
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from auto_care.async_views import AsyncReadView
+from auto_care.conditional import ConditionalGetMixin
+from auto_care.exports import ExportMixin
+from clients.importers import ClientImporter, guess_format
 from clients.models import Client
-from clients.serializers import ClientSerializer
-from authentication.models import Profile
+from clients.serializers import ClientImportSerializer, ClientSerializer
 
 
-class ClientViewSet(viewsets.ModelViewSet):
+class ClientViewSet(ConditionalGetMixin, ExportMixin, viewsets.ModelViewSet):
     """Handles CRUD operations for Clients."""
 
     queryset = Client.objects.all()
     serializer_class = ClientSerializer
     permission_classes = [IsAuthenticated]
+    search_fields = ("full_name", "phone", "email")
+    export_filename = "clients"
+    export_fields = (
+        "id",
+        "full_name",
+        "phone",
+        "email",
+        "created_at",
+        "updated_at",
+    )
 
     def perform_create(self, serializer):
-        profile = Profile.objects.get(user=self.request.user)
-        serializer.save(user=profile)
+        serializer.save(user=self.request.user.profile)
 
     def get_queryset(self):
         return Client.objects.filter(is_deleted=False, user=self.request.user.profile)
 
     def perform_update(self, serializer):
-        profile = Profile.objects.get(user=self.request.user)
-        serializer.save(user=profile)
+        serializer.save(user=self.request.user.profile)
 
     def destroy(self, request, *args, **kwargs):
         client = self.get_object()
         client.is_deleted = True
+        client.deleted_at = timezone.now()
         client.save()
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="import",
+        parser_classes=[MultiPartParser],
+    )
+    def import_clients(self, request):
+        """Imports clients from an uploaded CSV or NDJSON file."""
+        serializer = ClientImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        upload = serializer.validated_data["file"]
+        file_format = serializer.validated_data.get("file_format") or guess_format(upload.name)
+
+        importer = ClientImporter(request.user.profile)
+        try:
+            result = importer.run(codecs.iterdecode(upload, "utf-8-sig"), file_format)
+        except UnicodeDecodeError:
+            return Response(
+                {"file": ["File must be UTF-8 encoded."], "created": importer.created},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response(result, status=status.HTTP_200_OK)
+
+
+class ClientAsyncView(AsyncReadView):
+    """Async list and retrieve of the profile's clients."""
+
+    serializer_class = ClientSerializer
+
+    def get_queryset(self, profile):
+        return Client.objects.filter(is_deleted=False, user=profile)
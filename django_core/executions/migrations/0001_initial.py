@@ -0,0 +1,38 @@
+# Generated by Django 5.1.15 on 2026-10-18 08:37
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('authentication', '0001_initial'),
+        ('clients', '0003_remove_client_client_user_created_idx_and_more'),
+        ('services', '0004_service_material_cost'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ServiceExecution',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('completed', 'Completed'), ('cancelled', 'Cancelled')], default='pending', max_length=20)),
+                ('price', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('material_cost', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('notes', models.TextField(blank=True, default='')),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('client', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='clients.client')),
+                ('service', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='services.service')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='authentication.profile')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', 'created_at', 'id'], name='execution_user_created_idx'), models.Index(condition=models.Q(('status', 'completed')), fields=['user', 'completed_at'], name='execution_user_completed_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,101 @@
+from django.db import models, transaction
+from django.utils import timezone
+from uuid import uuid4
+from django.core.exceptions import ValidationError
+
+from products.models import StockMovement
+from products.stock import apply_movements
+from services.models import ServiceProduct
+
+
+class ServiceExecution(models.Model):
+    """A service performed for a client, which consumes stock once completed."""
+
+    STATUS_PENDING = "pending"
+    STATUS_COMPLETED = "completed"
+    STATUS_CANCELLED = "cancelled"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "Pending"),
+        (STATUS_COMPLETED, "Completed"),
+        (STATUS_CANCELLED, "Cancelled"),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
+    user = models.ForeignKey('authentication.Profile', on_delete=models.CASCADE)
+    service = models.ForeignKey('services.Service', on_delete=models.CASCADE)
+    client = models.ForeignKey(
+        'clients.Client', on_delete=models.SET_NULL, null=True, blank=True
+    )
+    status = models.CharField(
+        max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING
+    )
+    price = models.DecimalField(max_digits=12, decimal_places=2)
+    material_cost = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    notes = models.TextField(blank=True, default="")
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "created_at", "id"], name="execution_user_created_idx"),
+            models.Index(
+                fields=["user", "completed_at"],
+                condition=models.Q(status="completed"),
+                name="execution_user_completed_idx",
+            ),
+        ]
+
+    def clean(self):
+        if self.status not in dict(self.STATUS_CHOICES):
+            raise ValidationError("Invalid status.")
+        if self.price is None or self.price < 0:
+            raise ValidationError("Price cannot be null or negative.")
+
+    def complete(self):
+        """
+        Marks the execution as completed and takes the quantities of every
+        product used by the service off the stock.
+
+        The whole operation runs in one transaction and costs a fixed number
+        of queries whatever the number of products: the stock of all of them
+        is decremented by a single UPDATE, and nothing is written if any
+        product would end up with a negative stock
+        (``products.stock.InsufficientStock``). The daily revenue rollup is
+        updated in the same transaction.
+        """
+        from reports import rollup
+
+        with transaction.atomic():
+            locked = (
+                ServiceExecution.objects.select_for_update(of=("self",))
+                .select_related("service", "user")
+                .get(pk=self.pk)
+            )
+            if locked.status != self.STATUS_PENDING:
+                raise ValidationError("Only pending executions can be completed.")
+
+            usages = ServiceProduct.objects.filter(service_id=locked.service_id).values_list(
+                "product_id", "quantity"
+            )
+            apply_movements(
+                locked.user,
+                StockMovement.KIND_CONSUMPTION,
+                {product_id: -quantity for product_id, quantity in usages},
+                note=f"Service execution {self.pk}",
+            )
+
+            self.status = self.STATUS_COMPLETED
+            self.completed_at = timezone.now()
+            self.material_cost = locked.service.material_cost
+            self.save(update_fields=["status", "completed_at", "material_cost", "updated_at"])
+            rollup.record_execution(self)
+        return self
+
+    def cancel(self):
+        if self.status != self.STATUS_PENDING:
+            raise ValidationError("Only pending executions can be cancelled.")
+        self.status = self.STATUS_CANCELLED
+        self.save(update_fields=["status", "updated_at"])
+        return self
@@ -0,0 +1,64 @@
+from rest_framework import serializers
+from clients.models import Client
+from executions.models import ServiceExecution
+from services.costs import calculate_costs
+from services.models import Service
+
+
+class ServiceExecutionSerializer(serializers.ModelSerializer):
+
+    class Meta:
+        model = ServiceExecution
+        fields = [
+            "id",
+            "user",
+            "service",
+            "client",
+            "status",
+            "price",
+            "material_cost",
+            "notes",
+            "completed_at",
+            "created_at",
+        ]
+        read_only_fields = [
+            "id",
+            "status",
+            "material_cost",
+            "completed_at",
+            "created_at",
+        ]
+        extra_kwargs = {
+            "user": {"read_only": True},
+            "price": {"required": False},
+        }
+
+    def get_fields(self):
+        fields = super().get_fields()
+        request = self.context.get("request")
+        if request is not None:
+            profile = request.user.profile
+            fields["service"].queryset = Service.objects.filter(
+                user=profile, is_deleted=False
+            )
+            fields["client"].queryset = Client.objects.filter(
+                user=profile, is_deleted=False
+            )
+        return fields
+
+    def validate_price(self, value):
+        if value < 0:
+            raise serializers.ValidationError("Price cannot be negative.")
+        return value
+
+    def validate(self, data):
+        if self.instance is not None and self.instance.status != ServiceExecution.STATUS_PENDING:
+            raise serializers.ValidationError(
+                {"message": "Only pending executions can be changed."}
+            )
+        return data
+
+    def create(self, validated_data):
+        if "price" not in validated_data:
+            validated_data["price"] = calculate_costs(validated_data["service"]).estimated_price
+        return super().create(validated_data)
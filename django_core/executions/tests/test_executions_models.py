@@ -0,0 +1,114 @@
+import pytest
+from decimal import Decimal
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from executions.models import ServiceExecution
+from products.models import Product, StockMovement
+from products.stock import InsufficientStock
+
+
+@pytest.mark.django_db
+class TestServiceExecutionComplete:
+
+    def test_complete_decrements_stock_of_every_product(
+        self, create_service, create_product, add_product_to_service, create_execution
+    ):
+        service = create_service()
+        shampoo = create_product(profile=service.user, name="Shampoo")
+        wax = create_product(profile=service.user, name="Wax")
+        add_product_to_service(service, shampoo, quantity=Decimal("30"))
+        add_product_to_service(service, wax, quantity=Decimal("12.5"))
+        service.refresh_from_db()
+        execution = create_execution(service)
+
+        execution.complete()
+
+        execution.refresh_from_db()
+        assert execution.status == ServiceExecution.STATUS_COMPLETED
+        assert execution.completed_at is not None
+        assert execution.material_cost == service.material_cost
+        assert Product.objects.get(pk=shampoo.pk).stock_quantity == Decimal("70.00")
+        assert Product.objects.get(pk=wax.pk).stock_quantity == Decimal("87.50")
+        assert StockMovement.objects.filter(
+            kind=StockMovement.KIND_CONSUMPTION
+        ).count() == 2
+
+    def test_complete_with_insufficient_stock_writes_nothing(
+        self, create_service, create_product, add_product_to_service, create_execution
+    ):
+        service = create_service()
+        shampoo = create_product(profile=service.user, name="Shampoo")
+        wax = create_product(profile=service.user, name="Wax")
+        add_product_to_service(service, shampoo, quantity=Decimal("30"))
+        add_product_to_service(service, wax, quantity=Decimal("150"))
+        execution = create_execution(service)
+
+        with pytest.raises(InsufficientStock) as exc:
+            execution.complete()
+
+        assert list(exc.value.shortages) == [wax.pk]
+        assert Product.objects.get(pk=shampoo.pk).stock_quantity == Decimal("100.00")
+        assert Product.objects.get(pk=wax.pk).stock_quantity == Decimal("100.00")
+        assert not StockMovement.objects.exists()
+        execution.refresh_from_db()
+        assert execution.status == ServiceExecution.STATUS_PENDING
+
+    def test_products_without_stock_control_are_ignored(
+        self, create_service, create_product, add_product_to_service, create_execution
+    ):
+        service = create_service()
+        product = create_product(profile=service.user)
+        Product.objects.filter(pk=product.pk).update(stock_control_enabled=False)
+        add_product_to_service(service, product, quantity=Decimal("500"))
+        execution = create_execution(service)
+
+        execution.complete()
+
+        assert Product.objects.get(pk=product.pk).stock_quantity == Decimal("100.00")
+        assert execution.status == ServiceExecution.STATUS_COMPLETED
+
+    def _count_complete_queries(self, service, create_execution):
+        execution = create_execution(service)
+        with CaptureQueriesContext(connection) as ctx:
+            execution.complete()
+        return len(ctx.captured_queries)
+
+    def test_query_count_does_not_depend_on_number_of_products(
+        self, create_profile, create_service, create_product,
+        add_product_to_service, create_execution
+    ):
+        profile = create_profile()
+        small = create_service(profile=profile)
+        large = create_service(profile=profile)
+        add_product_to_service(small, create_product(profile=profile))
+        for index in range(10):
+            add_product_to_service(large, create_product(profile=profile, name=f"P{index}"))
+
+        assert self._count_complete_queries(
+            small, create_execution
+        ) == self._count_complete_queries(large, create_execution)
+
+    def test_only_pending_executions_can_be_completed(
+        self, create_service, create_product, add_product_to_service, create_execution
+    ):
+        service = create_service()
+        product = create_product(profile=service.user)
+        add_product_to_service(service, product, quantity=Decimal("10"))
+        execution = create_execution(service)
+        execution.complete()
+
+        with pytest.raises(ValidationError):
+            ServiceExecution.objects.get(pk=execution.pk).complete()
+
+        assert Product.objects.get(pk=product.pk).stock_quantity == Decimal("90.00")
+
+    def test_cancel(self, create_service, create_execution):
+        execution = create_execution(create_service())
+
+        execution.cancel()
+
+        execution.refresh_from_db()
+        assert execution.status == ServiceExecution.STATUS_CANCELLED
+        with pytest.raises(ValidationError):
+            execution.complete()
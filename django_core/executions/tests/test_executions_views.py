@@ -0,0 +1,117 @@
+import pytest
+from decimal import Decimal
+from rest_framework import status
+from executions.models import ServiceExecution
+from products.models import Product
+
+LIST_URL = "/api/executions/"
+RETRIEVE_URL = "/api/executions/{}/"
+COMPLETE_URL = "/api/executions/{}/complete/"
+CANCEL_URL = "/api/executions/{}/cancel/"
+
+
+@pytest.mark.django_db
+class TestServiceExecutionView:
+
+    def test_create_execution_defaults_price_to_estimate(
+        self, api_client, create_service
+    ):
+        service = create_service()
+        api_client.force_authenticate(user=service.user.user)
+
+        response = api_client.post(LIST_URL, {"service": str(service.id)}, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["status"] == ServiceExecution.STATUS_PENDING
+        assert response.data["price"] == "150.00"
+        assert ServiceExecution.objects.get().user == service.user
+
+    def test_create_execution_rejects_service_of_other_user(
+        self, api_client, create_user, create_profile, create_service
+    ):
+        service = create_service()
+        other = create_profile(user=create_user(username="other"))
+        api_client.force_authenticate(user=other.user)
+
+        response = api_client.post(LIST_URL, {"service": str(service.id)}, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "service" in response.data
+
+    def test_list_only_own_executions(
+        self, api_client, create_user, create_profile, create_service, create_execution
+    ):
+        execution = create_execution(create_service())
+        other = create_profile(user=create_user(username="other"))
+        create_execution(create_service(profile=other))
+        api_client.force_authenticate(user=execution.user.user)
+
+        response = api_client.get(LIST_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.data["results"]] == [str(execution.id)]
+
+    def test_complete_execution(
+        self, api_client, create_service, create_product, add_product_to_service, create_execution
+    ):
+        service = create_service()
+        product = create_product(profile=service.user)
+        add_product_to_service(service, product, quantity=Decimal("40"))
+        execution = create_execution(service)
+        api_client.force_authenticate(user=service.user.user)
+
+        response = api_client.post(COMPLETE_URL.format(execution.id))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["status"] == ServiceExecution.STATUS_COMPLETED
+        assert response.data["material_cost"] == "2000.00"
+        assert Product.objects.get(pk=product.pk).stock_quantity == Decimal("60.00")
+
+    def test_complete_execution_with_insufficient_stock(
+        self, api_client, create_service, create_product, add_product_to_service, create_execution
+    ):
+        service = create_service()
+        product = create_product(profile=service.user)
+        add_product_to_service(service, product, quantity=Decimal("140"))
+        execution = create_execution(service)
+        api_client.force_authenticate(user=service.user.user)
+
+        response = api_client.post(COMPLETE_URL.format(execution.id))
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["available"] == {str(product.id): "100.00"}
+        assert Product.objects.get(pk=product.pk).stock_quantity == Decimal("100.00")
+
+    def test_complete_twice_is_rejected(
+        self, api_client, create_service, create_execution
+    ):
+        execution = create_execution(create_service())
+        api_client.force_authenticate(user=execution.user.user)
+
+        api_client.post(COMPLETE_URL.format(execution.id))
+        response = api_client.post(COMPLETE_URL.format(execution.id))
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "message" in response.data
+
+    def test_update_completed_execution_is_rejected(
+        self, api_client, create_service, create_execution
+    ):
+        execution = create_execution(create_service())
+        execution.complete()
+        api_client.force_authenticate(user=execution.user.user)
+
+        response = api_client.patch(
+            RETRIEVE_URL.format(execution.id), {"price": "10.00"}, format="json"
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_cancel_execution(self, api_client, create_service, create_execution):
+        execution = create_execution(create_service())
+        api_client.force_authenticate(user=execution.user.user)
+
+        response = api_client.post(CANCEL_URL.format(execution.id))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["status"] == ServiceExecution.STATUS_CANCELLED
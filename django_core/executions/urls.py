@@ -0,0 +1,7 @@
+from rest_framework.routers import DefaultRouter
+from executions.views import ServiceExecutionViewSet
+
+router = DefaultRouter()
+router.register(r"", ServiceExecutionViewSet, basename="execution")
+
+urlpatterns = router.urls
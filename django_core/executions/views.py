@@ -0,0 +1,63 @@
+from django.core.exceptions import ValidationError
+from rest_framework import mixins, viewsets, status
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from executions.models import ServiceExecution
+from executions.serializers import ServiceExecutionSerializer
+from products.stock import InsufficientStock
+
+
+class ServiceExecutionViewSet(
+    mixins.CreateModelMixin,
+    mixins.RetrieveModelMixin,
+    mixins.UpdateModelMixin,
+    mixins.ListModelMixin,
+    viewsets.GenericViewSet,
+):
+    """Handles service executions and their completion."""
+
+    queryset = ServiceExecution.objects.all()
+    serializer_class = ServiceExecutionSerializer
+    permission_classes = [IsAuthenticated]
+
+    def perform_create(self, serializer):
+        serializer.save(user=self.request.user.profile)
+
+    def perform_update(self, serializer):
+        serializer.save(user=self.request.user.profile)
+
+    def get_queryset(self):
+        return ServiceExecution.objects.filter(user=self.request.user.profile)
+
+    @action(detail=True, methods=["post"])
+    def complete(self, request, pk=None):
+        """Completes the execution, taking the used products off the stock."""
+        execution = self.get_object()
+        try:
+            execution.complete()
+        except ValidationError as exc:
+            return Response({"message": exc.messages[0]}, status=status.HTTP_400_BAD_REQUEST)
+        except InsufficientStock as exc:
+            return Response(
+                {
+                    "message": str(exc),
+                    "available": {
+                        str(product_id): str(available)
+                        for product_id, available in exc.shortages.items()
+                    },
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response(self.get_serializer(execution).data, status=status.HTTP_200_OK)
+
+    @action(detail=True, methods=["post"])
+    def cancel(self, request, pk=None):
+        """Cancels a pending execution."""
+        execution = self.get_object()
+        try:
+            execution.cancel()
+        except ValidationError as exc:
+            return Response({"message": exc.messages[0]}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(self.get_serializer(execution).data, status=status.HTTP_200_OK)
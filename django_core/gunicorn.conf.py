@@ -0,0 +1,63 @@
+"""
+Gunicorn settings, read from the environment by scripts/commands.sh when
+SERVER_MODE is ``wsgi`` or ``asgi``.
+
+Send SIGHUP to the master process for a graceful reload: new workers are
+started with the new code and the old ones finish their requests first.
+This needs the application not to be preloaded (the default); with
+GUNICORN_PRELOAD=true the master keeps the code it started with and a
+deploy needs a full restart.
+"""
+import multiprocessing
+import os
+
+WORKER_CLASSES = {
+    "sync": "sync",
+    "gthread": "gthread",
+    "uvicorn": "uvicorn_worker.UvicornWorker",
+}
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+
+# (2 x CPUs) + 1 keeps every core busy while some workers wait on I/O.
+workers = int(os.getenv("GUNICORN_WORKERS") or multiprocessing.cpu_count() * 2 + 1)
+worker_class_name = os.getenv("GUNICORN_WORKER_CLASS", "gthread")
+if worker_class_name not in WORKER_CLASSES:
+    raise RuntimeError(
+        f"GUNICORN_WORKER_CLASS must be one of {', '.join(WORKER_CLASSES)}, not {worker_class_name!r}."
+    )
+worker_class = WORKER_CLASSES[worker_class_name]
+# Gunicorn turns a sync worker with threads > 1 into gthread, so threads
+# only apply to gthread.
+threads = int(os.getenv("GUNICORN_THREADS", "4")) if worker_class_name == "gthread" else 1
+
+# Keep client connections open between requests; a little longer than the
+# idle timeout of the load balancer in front avoids resets on reuse.
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "30"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+
+# Recycle workers now and then to bound memory growth, staggered so they
+# do not all restart at once.
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "2000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "200"))
+
+# Loading the application before forking lets workers share its memory,
+# at the cost of code reloads on SIGHUP (see above).
+preload_app = os.getenv("GUNICORN_PRELOAD", "false").lower() == "true"
+
+accesslog = os.getenv("GUNICORN_ACCESS_LOG", "-")
+errorlog = "-"
+loglevel = os.getenv("GUNICORN_LOG_LEVEL", "info")
+
+
+def when_ready(server):
+    """Log the database connection settings once the master is up."""
+    # Settings only: django.setup() here would import the apps into the
+    # master, and workers forked after a SIGHUP would keep the old code.
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "auto_care.settings")
+
+    from auto_care.db import report
+
+    for line in report().splitlines():
+        server.log.info(line)
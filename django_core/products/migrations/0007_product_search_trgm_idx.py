@@ -0,0 +1,37 @@
+# Generated by Django 5.1.15 on 2026-10-18 09:11
+
+from django.db import migrations
+
+SEARCH_COLUMNS = ("name", "description")
+
+
+def add_trigram_indexes(apps, schema_editor):
+    # The search filter runs icontains lookups, which PostgreSQL compiles to
+    # UPPER(column::text) LIKE UPPER('%term%'). A pg_trgm GIN index on that
+    # expression serves them; other databases scan the tenant's rows.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in SEARCH_COLUMNS:
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS product_{column}_trgm_idx ON products_product "
+            f"USING gin ((UPPER({column}::text)) gin_trgm_ops)"
+        )
+
+
+def remove_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for column in SEARCH_COLUMNS:
+        schema_editor.execute(f"DROP INDEX IF EXISTS product_{column}_trgm_idx")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0006_product_user_changes_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_trigram_indexes, remove_trigram_indexes),
+    ]
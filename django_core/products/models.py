@@ -1,8 +1,9 @@
 import uuid
-from django.db import models
+from django.db import models, transaction
 from django.core.exceptions import ValidationError
 
 from authentication.models import Profile
+from auto_care import catalog_cache
 
 
 class Product(models.Model):
@@ -32,6 +33,16 @@ class Product(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     deleted_at = models.DateTimeField(null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["user", "created_at", "id"],
+                condition=models.Q(is_deleted=False),
+                name="product_user_live_idx",
+            ),
+            models.Index(fields=["user", "updated_at", "id"], name="product_user_changes_idx"),
+        ]
+
     def clean(self):
         if self.unit_type not in dict(self.UNIT_TYPE_CHOICES):
             raise ValidationError(f"Invalid unit type: {self.unit_type}")
@@ -48,9 +59,65 @@ class Product(models.Model):
         if self.stock_quantity is not None and self.stock_quantity < 0:
             raise ValidationError("Stock quantity cannot be negative.")
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_last_purchase_price = instance.__dict__.get("last_purchase_price")
+        return instance
+
     def save(self, *args, **kwargs):
         self.full_clean()
-        super().save(*args, **kwargs)
+        loaded_price = getattr(self, "_loaded_last_purchase_price", None)
+        price_changed = not self._state.adding and loaded_price != self.last_purchase_price
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if price_changed:
+                from services.costs import refresh_material_costs_for_products
+
+                refresh_material_costs_for_products([self.pk])
+            catalog_cache.bump(self.user_id, catalog_cache.PRODUCTS, catalog_cache.SERVICES)
+        self._loaded_last_purchase_price = self.last_purchase_price
 
     def __str__(self):
         return self.name
+
+
+class StockMovement(models.Model):
+    """
+    One entry of a product's stock ledger.
+
+    ``quantity`` is signed: purchases add stock, consumption removes it and
+    adjustments may do either. ``balance_after`` is the product's stock once
+    the movement is applied, so the balance at any point in time is read
+    from a single ledger row.
+    """
+
+    KIND_PURCHASE = "purchase"
+    KIND_CONSUMPTION = "consumption"
+    KIND_ADJUSTMENT = "adjustment"
+    KIND_CHOICES = [
+        (KIND_PURCHASE, "Purchase"),
+        (KIND_CONSUMPTION, "Consumption"),
+        (KIND_ADJUSTMENT, "Adjustment"),
+    ]
+
+    user = models.ForeignKey(Profile, on_delete=models.CASCADE)
+    product = models.ForeignKey(
+        Product, on_delete=models.CASCADE, related_name="stock_movements"
+    )
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    quantity = models.DecimalField(max_digits=12, decimal_places=2)
+    balance_after = models.DecimalField(max_digits=12, decimal_places=2)
+    note = models.CharField(max_length=255, blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["product", "created_at", "id"],
+                name="stock_movement_product_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.quantity} {self.product_id}"
@@ -1,5 +1,72 @@
+from uuid import UUID
+
+from django.db import transaction
+from django.utils import timezone
 from rest_framework import serializers
-from products.models import Product
+from auto_care import catalog_cache
+from products.models import Product, StockMovement
+from services.costs import refresh_material_costs_for_products
+
+BULK_MAX_ITEMS = 5000
+
+
+class ProductListSerializer(serializers.ListSerializer):
+    """
+    Writes a batch of products with bulk statements inside one transaction.
+
+    For updates, ``instance`` is a mapping of product id to product and each
+    item of the payload must carry the ``id`` of the product it changes.
+    """
+
+    batch_size = 1000
+
+    def run_child_validation(self, data):
+        if self.instance is None:
+            return super().run_child_validation(data)
+
+        try:
+            product = self.instance[UUID(str(data["id"]))]
+        except (KeyError, TypeError, ValueError):
+            raise serializers.ValidationError({"id": ["Product not found."]})
+
+        self.child.instance = product
+        self.child.initial_data = data
+        attrs = super().run_child_validation(data)
+        attrs["id"] = product.id
+        return attrs
+
+    def create(self, validated_data):
+        products = [Product(**attrs) for attrs in validated_data]
+        with transaction.atomic():
+            created = Product.objects.bulk_create(products, batch_size=self.batch_size)
+            self._bump_catalog(products)
+        return created
+
+    def update(self, instance, validated_data):
+        now = timezone.now()
+        fields = {"updated_at"}
+        products = []
+        repriced = []
+        for attrs in validated_data:
+            product = instance[attrs.pop("id")]
+            if attrs.get("last_purchase_price", product.last_purchase_price) != product.last_purchase_price:
+                repriced.append(product.pk)
+            for attr, value in attrs.items():
+                setattr(product, attr, value)
+                fields.add(attr)
+            product.updated_at = now
+            products.append(product)
+
+        with transaction.atomic():
+            Product.objects.bulk_update(products, sorted(fields), batch_size=self.batch_size)
+            if repriced:
+                refresh_material_costs_for_products(repriced)
+            self._bump_catalog(products)
+        return products
+
+    def _bump_catalog(self, products):
+        for user_id in {product.user_id for product in products}:
+            catalog_cache.bump(user_id, catalog_cache.PRODUCTS, catalog_cache.SERVICES)
 
 
 class ProductSerializer(serializers.ModelSerializer):
@@ -22,6 +89,14 @@ class ProductSerializer(serializers.ModelSerializer):
         extra_kwargs = {
             "user": {"read_only": True},
         }
+        list_serializer_class = ProductListSerializer
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if self.instance is not None:
+            # After creation, stock only changes through the stock ledger.
+            fields["stock_quantity"].read_only = True
+        return fields
 
     def validate_last_purchase_price(self, value):
         if value < 0:
@@ -49,3 +124,33 @@ class ProductSerializer(serializers.ModelSerializer):
         if value not in allowed_types:
             raise serializers.ValidationError("Invalid product type.")
         return value
+
+
+class ProductBulkDeleteSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.UUIDField(), allow_empty=False, max_length=BULK_MAX_ITEMS
+    )
+
+
+class StockMovementSerializer(serializers.ModelSerializer):
+    """
+    Records a stock movement. ``quantity`` is always positive for purchases
+    and consumption; adjustments take a signed quantity.
+    """
+
+    class Meta:
+        model = StockMovement
+        fields = ["id", "product", "kind", "quantity", "balance_after", "note", "created_at"]
+        read_only_fields = ["id", "product", "balance_after", "created_at"]
+
+    def validate(self, data):
+        quantity = data["quantity"]
+        if quantity == 0:
+            raise serializers.ValidationError({"quantity": ["Quantity cannot be zero."]})
+        if data["kind"] != StockMovement.KIND_ADJUSTMENT and quantity < 0:
+            raise serializers.ValidationError(
+                {"quantity": ["Quantity must be greater than 0."]}
+            )
+        if data["kind"] == StockMovement.KIND_CONSUMPTION:
+            data["quantity"] = -quantity
+        return data
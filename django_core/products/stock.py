@@ -0,0 +1,111 @@
+"""
+Stock ledger operations.
+
+Every change to ``Product.stock_quantity`` goes through ``apply_movements``,
+which locks the product rows, refuses to take any of them below zero,
+applies the change with one ``F()`` expression UPDATE and writes the ledger
+rows with one INSERT. ``Product.stock_quantity`` stays the current balance,
+so reading it is O(1); ``StockMovement.balance_after`` gives the balance at
+any earlier point just as cheaply. Products with ``stock_control_enabled``
+turned off are left out of the ledger entirely.
+"""
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Case, DecimalField, F, Value, When
+from django.utils import timezone
+
+from auto_care import catalog_cache
+from products.models import Product, StockMovement
+
+QUANTITY = DecimalField(max_digits=12, decimal_places=2)
+
+
+class InsufficientStock(Exception):
+    """Raised when a movement would take a product's stock below zero."""
+
+    def __init__(self, shortages):
+        self.shortages = shortages
+        super().__init__("Insufficient stock for one or more products.")
+
+
+def apply_movements(profile, kind, quantities, note=""):
+    """
+    Applies signed ``quantities`` (``{product_id: Decimal}``) to the stock of
+    ``profile``'s products as ``kind`` movements, atomically.
+
+    Rows are locked in primary key order so that concurrent callers touching
+    the same products queue up instead of deadlocking or losing updates.
+    Raises ``InsufficientStock`` with ``{product_id: available}`` when any
+    balance would become negative, in which case nothing is written.
+    Returns the created movements.
+    """
+    quantities = {pk: Decimal(quantity) for pk, quantity in quantities.items() if quantity}
+    if not quantities:
+        return []
+
+    with transaction.atomic():
+        products = list(
+            Product.objects.select_for_update()
+            .filter(pk__in=quantities, user=profile, stock_control_enabled=True)
+            .order_by("pk")
+            .only("pk", "stock_quantity")
+        )
+        if not products:
+            return []
+
+        shortages = {
+            product.pk: product.stock_quantity
+            for product in products
+            if product.stock_quantity + quantities[product.pk] < 0
+        }
+        if shortages:
+            raise InsufficientStock(shortages)
+
+        Product.objects.filter(pk__in=[product.pk for product in products]).update(
+            stock_quantity=Case(
+                *[
+                    When(
+                        pk=product.pk,
+                        then=F("stock_quantity") + Value(quantities[product.pk], QUANTITY),
+                    )
+                    for product in products
+                ],
+                output_field=QUANTITY,
+            ),
+            updated_at=timezone.now(),
+        )
+        catalog_cache.bump(profile.pk, catalog_cache.PRODUCTS)
+        return StockMovement.objects.bulk_create(
+            StockMovement(
+                user=profile,
+                product_id=product.pk,
+                kind=kind,
+                quantity=quantities[product.pk],
+                balance_after=product.stock_quantity + quantities[product.pk],
+                note=note,
+            )
+            for product in products
+        )
+
+
+def balance_at(product, moment):
+    """Stock of ``product`` at ``moment``, read from a single ledger row."""
+    last = (
+        product.stock_movements.filter(created_at__lte=moment)
+        .order_by("-created_at", "-id")
+        .values_list("balance_after", flat=True)
+        .first()
+    )
+    if last is not None:
+        return last
+
+    first = (
+        product.stock_movements.order_by("created_at", "id")
+        .values_list("balance_after", "quantity")
+        .first()
+    )
+    if first is None:
+        return product.stock_quantity
+    balance_after, quantity = first
+    return balance_after - quantity
@@ -1,4 +1,5 @@
 import pytest
+from django.core.cache import cache
 from rest_framework.test import APIClient
 from django.contrib.auth.models import User
 from products.models import Product
@@ -10,6 +11,18 @@ def api_client() -> APIClient:
     return APIClient()
 
 
+@pytest.fixture(autouse=True)
+def clear_cache(settings):
+    """
+    Turns the catalog cache on and keeps pages cached by one test from
+    leaking into the next.
+    """
+    settings.CATALOG_CACHE_ENABLED = True
+    cache.clear()
+    yield
+    cache.clear()
+
+
 @pytest.fixture
 def create_user(db):
     """Creates a user."""
@@ -1,4 +1,5 @@
 import pytest
+from django.db import connection
 from django.core.exceptions import ValidationError
 from django.contrib.auth.models import User
 from products.models import Product
@@ -164,3 +165,38 @@ class TestProductModel:
                 stock_quantity=100,
                 stock_control_enabled=True,
             ).full_clean()
+
+
+@pytest.mark.django_db
+class TestProductIndexes:
+
+    @pytest.fixture(autouse=True)
+    def require_sqlite(self):
+        if connection.vendor != "sqlite":
+            pytest.skip("Query plan assertions are written for SQLite.")
+
+    def test_live_products_listing_uses_partial_index(self, create_profile, product_supply):
+        profile = create_profile()
+        live = product_supply(profile)
+        deleted = product_supply(profile)
+        deleted.is_deleted = True
+        deleted.save()
+
+        queryset = Product.objects.filter(is_deleted=False, user=profile).order_by(
+            "created_at", "id"
+        )
+        plan = queryset.explain()
+
+        assert "product_user_live_idx" in plan
+        assert "TEMP B-TREE" not in plan
+        assert list(queryset) == [live]
+
+    def test_product_cursor_page_uses_partial_index(self, create_profile, product_supply):
+        profile = create_profile()
+        product = product_supply(profile)
+
+        queryset = Product.objects.filter(
+            is_deleted=False, user=profile, created_at__gt=product.created_at
+        ).order_by("created_at", "id")
+
+        assert "product_user_live_idx" in queryset.explain()
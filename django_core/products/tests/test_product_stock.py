@@ -0,0 +1,205 @@
+import pytest
+from decimal import Decimal
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework import status
+from products.models import Product, StockMovement
+from products.stock import InsufficientStock, apply_movements, balance_at
+
+MOVEMENTS_URL = "/api/products/{}/movements/"
+
+
+@pytest.mark.django_db
+class TestApplyMovements:
+
+    def test_consumption_decrements_stock_and_records_ledger(
+        self, create_profile, product_supply
+    ):
+        profile = create_profile()
+        product = product_supply(profile)
+
+        (movement,) = apply_movements(
+            profile, StockMovement.KIND_CONSUMPTION, {product.pk: Decimal("-30")}
+        )
+
+        product.refresh_from_db()
+        assert product.stock_quantity == Decimal("70.00")
+        assert movement.quantity == Decimal("-30")
+        assert movement.balance_after == Decimal("70")
+
+    def test_stale_instances_do_not_lose_updates(self, create_profile, product_supply):
+        profile = create_profile()
+        product = product_supply(profile)
+        stale = Product.objects.get(pk=product.pk)
+
+        apply_movements(profile, StockMovement.KIND_CONSUMPTION, {product.pk: -10})
+        apply_movements(profile, StockMovement.KIND_CONSUMPTION, {stale.pk: -15})
+
+        product.refresh_from_db()
+        assert product.stock_quantity == Decimal("75.00")
+        balances = list(
+            product.stock_movements.order_by("id").values_list("balance_after", flat=True)
+        )
+        assert balances == [Decimal("90.00"), Decimal("75.00")]
+
+    def test_batch_is_applied_with_fixed_number_of_writes(
+        self, create_profile, product_supply
+    ):
+        profile = create_profile()
+        products = [product_supply(profile) for _ in range(5)]
+
+        with CaptureQueriesContext(connection) as context:
+            apply_movements(
+                profile,
+                StockMovement.KIND_CONSUMPTION,
+                {product.pk: -1 for product in products},
+            )
+
+        writes = [
+            q["sql"].split(" ")[0] for q in context.captured_queries
+            if q["sql"].startswith(("UPDATE", "INSERT"))
+        ]
+        assert writes == ["UPDATE", "INSERT"]
+        assert set(Product.objects.values_list("stock_quantity", flat=True)) == {Decimal("99")}
+
+    def test_insufficient_stock_writes_nothing(self, create_profile, product_supply):
+        profile = create_profile()
+        enough = product_supply(profile)
+        short = product_supply(profile)
+
+        with pytest.raises(InsufficientStock) as error:
+            apply_movements(
+                profile,
+                StockMovement.KIND_CONSUMPTION,
+                {enough.pk: -10, short.pk: -150},
+            )
+
+        assert error.value.shortages == {short.pk: Decimal("100.00")}
+        assert set(Product.objects.values_list("stock_quantity", flat=True)) == {Decimal("100")}
+        assert not StockMovement.objects.exists()
+
+    def test_products_without_stock_control_are_skipped(
+        self, create_profile, product_supply
+    ):
+        profile = create_profile()
+        product = product_supply(profile)
+        product.stock_control_enabled = False
+        product.save()
+
+        assert apply_movements(profile, StockMovement.KIND_CONSUMPTION, {product.pk: -500}) == []
+
+        product.refresh_from_db()
+        assert product.stock_quantity == Decimal("100.00")
+        assert not StockMovement.objects.exists()
+
+    def test_other_profiles_products_are_ignored(
+        self, create_user, create_profile, product_supply
+    ):
+        owner = create_profile(create_user(username="owner"))
+        intruder = create_profile(create_user(username="intruder"))
+        product = product_supply(owner)
+
+        assert apply_movements(intruder, StockMovement.KIND_CONSUMPTION, {product.pk: -1}) == []
+
+    def test_balance_at(self, create_profile, product_supply):
+        profile = create_profile()
+        product = product_supply(profile)
+        before = timezone.now()
+        apply_movements(profile, StockMovement.KIND_PURCHASE, {product.pk: 20})
+        middle = timezone.now()
+        apply_movements(profile, StockMovement.KIND_CONSUMPTION, {product.pk: -50})
+
+        assert balance_at(product, before) == Decimal("100.00")
+        assert balance_at(product, middle) == Decimal("120.00")
+        assert balance_at(product, timezone.now()) == Decimal("70.00")
+
+
+@pytest.mark.django_db
+class TestStockMovementView:
+
+    def test_record_purchase_and_consumption(self, api_client, create_profile, product_supply):
+        """Tests recording movements and listing the ledger."""
+        profile = create_profile()
+        product = product_supply(profile)
+        api_client.force_authenticate(user=profile.user)
+
+        response = api_client.post(
+            MOVEMENTS_URL.format(product.id), {"kind": "purchase", "quantity": "25.00"}
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["balance_after"] == "125.00"
+
+        response = api_client.post(
+            MOVEMENTS_URL.format(product.id),
+            {"kind": "consumption", "quantity": "5.00", "note": "Spilled"},
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["quantity"] == "-5.00"
+
+        response = api_client.get(MOVEMENTS_URL.format(product.id))
+        assert response.status_code == status.HTTP_200_OK
+        assert [m["balance_after"] for m in response.data["results"]] == ["125.00", "120.00"]
+
+    def test_consumption_beyond_stock_is_rejected(
+        self, api_client, create_profile, product_supply
+    ):
+        """Tests that stock cannot go below zero."""
+        profile = create_profile()
+        product = product_supply(profile)
+        api_client.force_authenticate(user=profile.user)
+
+        response = api_client.post(
+            MOVEMENTS_URL.format(product.id), {"kind": "consumption", "quantity": "101"}
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["available"] == "100.00"
+
+    @pytest.mark.parametrize(
+        "kind, quantity", [("purchase", "-1"), ("consumption", "0"), ("adjustment", "0")]
+    )
+    def test_invalid_quantities_are_rejected(
+        self, api_client, create_profile, product_supply, kind, quantity
+    ):
+        """Tests the quantity rules of each movement kind."""
+        profile = create_profile()
+        product = product_supply(profile)
+        api_client.force_authenticate(user=profile.user)
+
+        response = api_client.post(
+            MOVEMENTS_URL.format(product.id), {"kind": kind, "quantity": quantity}
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "quantity" in response.data
+
+    def test_stock_control_disabled_is_rejected(
+        self, api_client, create_profile, product_supply
+    ):
+        """Tests that products without stock control have no ledger."""
+        profile = create_profile()
+        product = product_supply(profile)
+        product.stock_control_enabled = False
+        product.save()
+        api_client.force_authenticate(user=profile.user)
+
+        response = api_client.post(
+            MOVEMENTS_URL.format(product.id), {"kind": "adjustment", "quantity": "-3"}
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_stock_quantity_is_read_only_on_update(
+        self, api_client, create_profile, product_supply
+    ):
+        """Tests that stock cannot be overwritten through the product endpoint."""
+        profile = create_profile()
+        product = product_supply(profile)
+        api_client.force_authenticate(user=profile.user)
+
+        response = api_client.patch(f"/api/products/{product.id}/", {"stock_quantity": "1.00"})
+
+        assert response.status_code == status.HTTP_200_OK
+        product.refresh_from_db()
+        assert product.stock_quantity == Decimal("100.00")
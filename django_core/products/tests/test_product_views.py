@@ -1,4 +1,13 @@
+import json
 import pytest
+from asgiref.sync import async_to_sync
+from datetime import timedelta
+from django.core.cache import cache
+from django.db import connection
+from django.test import AsyncClient
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.utils.http import parse_http_date
 from rest_framework import status
 from products.models import Product
 
@@ -8,6 +17,24 @@ LIST_URL = "/api/products/"
 RETRIEVE_URL = "/api/products/{}/"
 UPDATE_URL = "/api/products/{}/"
 DELETE_URL = "/api/products/{}/"
+BULK_URL = "/api/products/bulk/"
+ASYNC_LIST_URL = "/api/async/products/"
+ASYNC_RETRIEVE_URL = "/api/async/products/{}/"
+
+
+def product_payload(**overrides):
+    data = {
+        "name": "Car Shampoo",
+        "description": "High foam automotive shampoo",
+        "unit_type": Product.UNIT_TYPE_ML,
+        "product_type": Product.PRODUCT_TYPE_SUPPLY,
+        "last_purchase_price": "50.00",
+        "sale_price": "80.00",
+        "stock_quantity": "100.00",
+        "stock_control_enabled": True,
+    }
+    data.update(overrides)
+    return data
 
 
 @pytest.mark.django_db
@@ -46,7 +73,29 @@ class TestProductView:
 
         response = api_client.get(LIST_URL)
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) > 0
+        assert len(response.data["results"]) > 0
+
+    def test_list_products_is_cursor_paginated(
+        self, api_client, create_profile, product_supply
+    ):
+        """Tests that the listing is paginated by cursor in creation order."""
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+
+        created = [product_supply(profile=profile) for _ in range(3)]
+
+        response = api_client.get(LIST_URL, {"page_size": 2})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["previous"] is None
+        assert response.data["next"] is not None
+        first_page = [item["id"] for item in response.data["results"]]
+
+        response = api_client.get(response.data["next"])
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["next"] is None
+        second_page = [item["id"] for item in response.data["results"]]
+
+        assert first_page + second_page == [str(obj.id) for obj in created]
 
     def test_retrieve_product(self, api_client, create_profile, product_supply):
         """Tests the retrieval of a specific product."""
@@ -99,6 +148,9 @@ class TestProductView:
         response = api_client.get(RETRIEVE_URL.format(product.id))
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
+        product.refresh_from_db()
+        assert product.is_deleted
+        assert product.deleted_at is not None
 
     def test_create_product_invalid_data(self, api_client, create_profile):
         """Tests the failure to create a product with invalid data."""
@@ -164,3 +216,422 @@ class TestProductView:
         data = {"name": "Should Not Work"}
         response = api_client.patch(UPDATE_URL.format(product.id), data)
         assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestProductBulkView:
+    def test_bulk_create_products(self, api_client, create_profile):
+        """Tests that a list of products is inserted with a single statement."""
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+
+        data = [product_payload(name=f"Product {i}") for i in range(20)]
+
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.post(BULK_URL, data, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert len(response.data) == 20
+        assert Product.objects.filter(user=profile).count() == 20
+        inserts = [
+            q["sql"] for q in context.captured_queries
+            if q["sql"].startswith('INSERT INTO "products_product"')
+        ]
+        assert len(inserts) == 1
+
+    def test_bulk_create_reports_errors_per_item(self, api_client, create_profile):
+        """Tests that invalid items are reported by position and nothing is created."""
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+
+        data = [
+            product_payload(),
+            product_payload(sale_price="-1.00"),
+            product_payload(unit_type="liters"),
+        ]
+
+        response = api_client.post(BULK_URL, data, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data[0] == {}
+        assert "sale_price" in response.data[1]
+        assert "unit_type" in response.data[2]
+        assert not Product.objects.exists()
+
+    def test_bulk_update_products(self, api_client, create_profile, product_supply):
+        """Tests the partial update of several products in one request; stock is read-only."""
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+        first = product_supply(profile=profile)
+        second = product_supply(profile=profile)
+
+        data = [
+            {"id": str(first.id), "sale_price": "90.00"},
+            {"id": str(second.id), "name": "Wax", "stock_quantity": "10.00"},
+        ]
+
+        response = api_client.patch(BULK_URL, data, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        first.refresh_from_db()
+        second.refresh_from_db()
+        assert first.sale_price == 90
+        assert first.name == "Car Shampoo"
+        assert second.name == "Wax"
+        assert second.stock_quantity == 100
+        assert second.updated_at > second.created_at
+
+    def test_bulk_update_rejects_unknown_products(
+        self, api_client, create_user, create_profile, product_supply
+    ):
+        """Tests that products of other users cannot be updated in bulk."""
+        owner = create_profile(user=create_user(username="owner"))
+        other = create_profile(user=create_user(username="other"))
+        product = product_supply(profile=owner)
+        mine = product_supply(profile=other)
+        api_client.force_authenticate(user=other.user)
+
+        data = [
+            {"id": str(mine.id), "name": "Mine"},
+            {"id": str(product.id), "name": "Not Mine"},
+            {"name": "No Id"},
+        ]
+
+        response = api_client.patch(BULK_URL, data, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data[0] == {}
+        assert "id" in response.data[1]
+        assert "id" in response.data[2]
+        product.refresh_from_db()
+        mine.refresh_from_db()
+        assert product.name == "Car Shampoo"
+        assert mine.name == "Car Shampoo"
+
+    def test_bulk_delete_products(self, api_client, create_profile, product_supply):
+        """Tests that products are soft deleted in bulk."""
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+        deleted = [product_supply(profile=profile) for _ in range(3)]
+        kept = product_supply(profile=profile)
+
+        response = api_client.delete(
+            BULK_URL, {"ids": [str(p.id) for p in deleted]}, format="json"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {"deleted": 3}
+        assert list(Product.objects.filter(is_deleted=False)) == [kept]
+        assert not Product.objects.filter(is_deleted=True, deleted_at__isnull=True).exists()
+
+    def test_bulk_delete_requires_ids(self, api_client, create_profile):
+        """Tests that an empty bulk delete payload is rejected."""
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+
+        response = api_client.delete(BULK_URL, {"ids": []}, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "ids" in response.data
+
+
+@pytest.mark.django_db
+class TestProductExportView:
+    def test_export_csv(self, api_client, create_user, create_profile, product_supply):
+        """Tests that the products are streamed as CSV, oldest first."""
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+        first = product_supply(profile=profile)
+        second = product_supply(profile=profile)
+        product_supply(profile=create_profile(user=create_user(username="other")))
+
+        response = api_client.get("/api/products/export/csv/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        assert response["Content-Disposition"] == 'attachment; filename="products.csv"'
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        assert lines[0].split(",")[0] == "id"
+        assert [line.split(",")[0] for line in lines[1:]] == [str(first.id), str(second.id)]
+
+    def test_export_ndjson(self, api_client, create_profile, product_supply):
+        """Tests that the products are streamed as one JSON object per line."""
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+        obj = product_supply(profile=profile)
+
+        response = api_client.get("/api/products/export/ndjson/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/x-ndjson"
+        rows = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+        assert len(rows) == 1
+        assert rows[0]["id"] == str(obj.id)
+        assert rows[0]["name"] == "Car Shampoo"
+
+    def test_export_requires_authentication(self, api_client):
+        """Tests that anonymous users cannot export."""
+        response = api_client.get("/api/products/export/csv/")
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_export_streams_asynchronously_under_asgi(self, create_profile, product_supply):
+        """Tests that ASGI requests get an async stream rather than a buffered one."""
+        profile = create_profile()
+        first = product_supply(profile=profile)
+        second = product_supply(profile=profile)
+        client = AsyncClient()
+        client.force_login(profile.user)
+
+        async def export():
+            response = await client.get("/api/products/export/csv/")
+            assert response.is_async
+            return b"".join([chunk async for chunk in response.streaming_content])
+
+        lines = async_to_sync(export)().decode().splitlines()
+        assert [line.split(",")[0] for line in lines[1:]] == [str(first.id), str(second.id)]
+
+
+@pytest.mark.django_db
+class TestProductCatalogCache:
+
+    def list_ids(self, api_client):
+        return [item["id"] for item in api_client.get(LIST_URL).data["results"]]
+
+    def test_repeated_list_skips_database(
+        self, api_client, create_profile, product_supply, django_assert_num_queries
+    ):
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+        product_supply(profile=profile)
+        first = api_client.get(LIST_URL)
+
+        with django_assert_num_queries(0):
+            second = api_client.get(LIST_URL)
+
+        assert second.status_code == status.HTTP_200_OK
+        assert second.data == first.data
+
+    def test_disabled_cache_reads_database(
+        self, api_client, create_profile, product_supply, settings
+    ):
+        settings.CATALOG_CACHE_ENABLED = False
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+        product = product_supply(profile=profile)
+        api_client.get(LIST_URL)
+        Product.objects.filter(pk=product.pk).update(name="Renamed")
+
+        response = api_client.get(LIST_URL)
+
+        assert response.data["results"][0]["name"] == "Renamed"
+
+    def test_pages_are_cached_per_query_string(self, api_client, create_profile, product_supply):
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+        for _ in range(3):
+            product_supply(profile=profile)
+
+        assert len(api_client.get(LIST_URL).data["results"]) == 3
+        assert len(api_client.get(LIST_URL, {"page_size": 2}).data["results"]) == 2
+
+    def test_cache_is_per_profile(self, api_client, create_user, create_profile, product_supply):
+        profile = create_profile()
+        other = create_profile(user=create_user(username="other"))
+        product = product_supply(profile=profile)
+        api_client.force_authenticate(user=profile.user)
+        assert self.list_ids(api_client) == [str(product.id)]
+
+        api_client.force_authenticate(user=other.user)
+
+        assert self.list_ids(api_client) == []
+
+    def test_create_update_and_destroy_invalidate(self, api_client, create_profile):
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+        assert self.list_ids(api_client) == []
+
+        product_id = api_client.post(CREATE_URL, product_payload(), format="json").data["id"]
+        assert self.list_ids(api_client) == [product_id]
+
+        api_client.patch(UPDATE_URL.format(product_id), {"name": "Wax"}, format="json")
+        assert api_client.get(LIST_URL).data["results"][0]["name"] == "Wax"
+
+        api_client.delete(DELETE_URL.format(product_id))
+        assert self.list_ids(api_client) == []
+
+    def test_bulk_operations_invalidate(self, api_client, create_profile):
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+        assert self.list_ids(api_client) == []
+
+        created = api_client.post(BULK_URL, [product_payload(), product_payload()], format="json")
+        ids = [item["id"] for item in created.data]
+        assert sorted(self.list_ids(api_client)) == sorted(ids)
+
+        api_client.patch(BULK_URL, [{"id": ids[0], "name": "Wax"}], format="json")
+        assert "Wax" in [item["name"] for item in api_client.get(LIST_URL).data["results"]]
+
+        api_client.delete(BULK_URL, {"ids": ids}, format="json")
+        assert self.list_ids(api_client) == []
+
+    def test_stock_movement_invalidates(self, api_client, create_profile, product_supply):
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+        product = product_supply(profile=profile)
+        stock = api_client.get(LIST_URL).data["results"][0]["stock_quantity"]
+
+        api_client.post(
+            f"/api/products/{product.id}/movements/",
+            {"kind": "purchase", "quantity": "10"},
+            format="json",
+        )
+
+        assert api_client.get(LIST_URL).data["results"][0]["stock_quantity"] != stock
+
+
+@pytest.mark.django_db
+class TestProductConditionalGet:
+
+    def test_cached_list_answers_not_modified_without_queries(
+        self, api_client, create_profile, product_supply, django_assert_num_queries
+    ):
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+        product_supply(profile=profile)
+        etag = api_client.get(LIST_URL)["ETag"]
+
+        with django_assert_num_queries(0):
+            response = api_client.get(LIST_URL, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == etag
+
+    def test_uncached_list_answers_not_modified(
+        self, api_client, create_profile, product_supply, django_assert_num_queries
+    ):
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+        product_supply(profile=profile)
+        etag = api_client.get(LIST_URL)["ETag"]
+        cache.clear()
+
+        with django_assert_num_queries(1):
+            response = api_client.get(LIST_URL, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_delete_moves_last_modified_forward(self, api_client, create_profile):
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+        older = Product.objects.create(user=profile, **product_payload(name="Car Shampoo"))
+        newer = Product.objects.create(user=profile, **product_payload(name="Carnauba Wax"))
+        # Back-date the rows so the delete lands in a later second.
+        Product.objects.filter(pk=older.pk).update(updated_at=timezone.now() - timedelta(seconds=20))
+        Product.objects.filter(pk=newer.pk).update(updated_at=timezone.now() - timedelta(seconds=10))
+        last_modified = api_client.get(LIST_URL)["Last-Modified"]
+
+        api_client.delete(DELETE_URL.format(newer.id))
+        response = api_client.get(LIST_URL, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["name"] for item in response.data["results"]] == ["Car Shampoo"]
+        assert parse_http_date(response["Last-Modified"]) > parse_http_date(last_modified)
+
+    def test_stock_movement_changes_etag(self, api_client, create_profile, product_supply):
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+        product = product_supply(profile=profile)
+        etag = api_client.get(RETRIEVE_URL.format(product.id))["ETag"]
+
+        api_client.post(
+            f"/api/products/{product.id}/movements/",
+            {"kind": "purchase", "quantity": "10"},
+            format="json",
+        )
+        response = api_client.get(RETRIEVE_URL.format(product.id), HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+class TestProductSearch:
+
+    def test_search_by_name_or_description(self, api_client, create_profile):
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+        shampoo = Product.objects.create(user=profile, **product_payload(name="Car Shampoo"))
+        wax = Product.objects.create(
+            user=profile, **product_payload(name="Carnauba Wax", description="Paste for paint protection")
+        )
+
+        def search(term):
+            return [item["id"] for item in api_client.get(LIST_URL, {"search": term}).data["results"]]
+
+        assert search("shamp") == [str(shampoo.id)]
+        assert search("PAINT") == [str(wax.id)]
+        assert search("car") == [str(shampoo.id), str(wax.id)]
+
+
+@pytest.mark.django_db
+class TestProductAsyncView:
+
+    def test_list_matches_sync_endpoint(self, api_client, create_profile):
+        profile = create_profile()
+        for name in ("Car Shampoo", "Carnauba Wax", "Tire Shine"):
+            Product.objects.create(user=profile, **product_payload(name=name))
+        api_client.force_login(profile.user)
+
+        response = api_client.get(ASYNC_LIST_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["next"] is None
+        assert response.json()["results"] == json.loads(json.dumps(api_client.get(LIST_URL).data["results"]))
+
+    def test_list_follows_cursor(self, api_client, create_profile):
+        profile = create_profile()
+        products = [Product.objects.create(user=profile, **product_payload(name=f"P{i}")) for i in range(3)]
+        api_client.force_login(profile.user)
+
+        ids = []
+        url = ASYNC_LIST_URL + "?page_size=2"
+        while url:
+            body = api_client.get(url).json()
+            ids += [item["id"] for item in body["results"]]
+            url = body["next"]
+
+        assert ids == [str(product.id) for product in products]
+
+    def test_list_skips_deleted_and_other_profiles(self, api_client, create_profile, create_user):
+        profile = create_profile()
+        other = create_profile(user=create_user(username="other"))
+        Product.objects.create(user=other, **product_payload())
+        Product.objects.create(user=profile, is_deleted=True, **product_payload())
+        api_client.force_login(profile.user)
+
+        assert api_client.get(ASYNC_LIST_URL).json()["results"] == []
+
+    def test_retrieve(self, api_client, product_supply, create_profile, create_user):
+        product = product_supply()
+        api_client.force_login(product.user.user)
+
+        response = api_client.get(ASYNC_RETRIEVE_URL.format(product.id))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["name"] == "Car Shampoo"
+        assert response.json()["last_purchase_price"] == "50.00"
+
+        other = create_profile(user=create_user(username="other"))
+        api_client.force_login(other.user)
+        assert api_client.get(ASYNC_RETRIEVE_URL.format(product.id)).status_code == status.HTTP_404_NOT_FOUND
+
+    def test_invalid_cursor_and_page_size(self, api_client, create_profile):
+        profile = create_profile()
+        api_client.force_login(profile.user)
+
+        assert api_client.get(ASYNC_LIST_URL, {"cursor": "bogus"}).status_code == status.HTTP_404_NOT_FOUND
+        assert api_client.get(ASYNC_LIST_URL, {"page_size": "x"}).status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_requires_authentication(self, api_client):
+        response = api_client.get(ASYNC_LIST_URL)
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -1,30 +1,154 @@
+from uuid import UUID
+
+from django.utils import timezone
 from rest_framework import viewsets, status
+from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
+from auto_care import catalog_cache
+from auto_care.async_views import AsyncReadView
+from auto_care.catalog_cache import CatalogCacheMixin
+from auto_care.conditional import ConditionalGetMixin
+from auto_care.exports import ExportMixin
 from products.models import Product
-from products.serializers import ProductSerializer
-from authentication.models import Profile
+from products.serializers import (
+    BULK_MAX_ITEMS,
+    ProductBulkDeleteSerializer,
+    ProductSerializer,
+    StockMovementSerializer,
+)
+from products.stock import InsufficientStock, apply_movements
 from rest_framework.response import Response
 
 
-class ProductViewSet(viewsets.ModelViewSet):
+class ProductViewSet(CatalogCacheMixin, ConditionalGetMixin, ExportMixin, viewsets.ModelViewSet):
     """Handles CRUD operations for Products."""
+    catalog_namespace = catalog_cache.PRODUCTS
+    search_fields = ("name", "description")
     queryset = Product.objects.all()
     serializer_class = ProductSerializer
     permission_classes = [IsAuthenticated]
+    export_filename = "products"
+    export_fields = (
+        "id",
+        "name",
+        "description",
+        "unit_type",
+        "product_type",
+        "last_purchase_price",
+        "sale_price",
+        "stock_quantity",
+        "stock_control_enabled",
+        "created_at",
+        "updated_at",
+    )
 
     def perform_create(self, serializer):
-        profile = Profile.objects.get(user=self.request.user)
-        serializer.save(user=profile)
+        serializer.save(user=self.request.user.profile)
 
     def get_queryset(self):
         return Product.objects.filter(is_deleted=False, user=self.request.user.profile)
 
     def perform_update(self, serializer):
-        profile = Profile.objects.get(user=self.request.user)
-        serializer.save(user=profile)
+        serializer.save(user=self.request.user.profile)
 
     def destroy(self, request, *args, **kwargs):
         product = self.get_object()
         product.is_deleted = True
+        product.deleted_at = timezone.now()
         product.save()
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk(self, request):
+        """Creates a list of products. Errors are reported per item."""
+        serializer = self.get_serializer(
+            data=request.data, many=True, max_length=BULK_MAX_ITEMS
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save(user=request.user.profile)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    @bulk.mapping.patch
+    def bulk_update(self, request):
+        """Partially updates a list of products, each identified by its ``id``."""
+        ids = []
+        if isinstance(request.data, list):
+            for item in request.data[: BULK_MAX_ITEMS]:
+                try:
+                    ids.append(UUID(str(item["id"])))
+                except (KeyError, TypeError, ValueError):
+                    continue
+
+        products = self.get_queryset().in_bulk(ids)
+        serializer = self.get_serializer(
+            products,
+            data=request.data,
+            many=True,
+            partial=True,
+            max_length=BULK_MAX_ITEMS,
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+    @bulk.mapping.delete
+    def bulk_destroy(self, request):
+        """Soft deletes every product listed in ``ids`` with a single UPDATE."""
+        serializer = ProductBulkDeleteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        now = timezone.now()
+        deleted = self.get_queryset().filter(
+            id__in=serializer.validated_data["ids"]
+        ).update(is_deleted=True, deleted_at=now, updated_at=now)
+        catalog_cache.bump(request.user.profile.pk, catalog_cache.PRODUCTS, catalog_cache.SERVICES)
+        return Response({"deleted": deleted}, status=status.HTTP_200_OK)
+
+    @action(detail=True, methods=["get"])
+    def movements(self, request, pk=None):
+        """Lists the product's stock ledger."""
+        product = self.get_object()
+        page = self.paginate_queryset(product.stock_movements.all())
+        serializer = StockMovementSerializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @movements.mapping.post
+    def add_movement(self, request, pk=None):
+        """Records a purchase, consumption or adjustment of the product's stock."""
+        product = self.get_object()
+        if not product.stock_control_enabled:
+            return Response(
+                {"message": "Stock control is disabled for this product."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        serializer = StockMovementSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        try:
+            (movement,) = apply_movements(
+                request.user.profile,
+                data["kind"],
+                {product.pk: data["quantity"]},
+                note=data.get("note", ""),
+            )
+        except InsufficientStock as exc:
+            return Response(
+                {
+                    "message": str(exc),
+                    "available": str(exc.shortages[product.pk]),
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response(
+            StockMovementSerializer(movement).data, status=status.HTTP_201_CREATED
+        )
+
+
+class ProductAsyncView(AsyncReadView):
+    """Async list and retrieve of the profile's products."""
+
+    serializer_class = ProductSerializer
+
+    def get_queryset(self, profile):
+        return Product.objects.filter(is_deleted=False, user=profile)
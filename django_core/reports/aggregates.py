@@ -0,0 +1,94 @@
+from datetime import datetime, time, timedelta
+
+from django.db.models import DateField, DecimalField, F, Sum, Value
+from django.db.models.functions import Coalesce, Trunc
+from django.utils import timezone
+
+from executions.models import ServiceExecution
+from reports.models import DailyServiceRevenue
+
+PERIOD_DAY = "day"
+PERIOD_WEEK = "week"
+PERIOD_MONTH = "month"
+PERIODS = (PERIOD_DAY, PERIOD_WEEK, PERIOD_MONTH)
+
+MONEY = DecimalField(max_digits=14, decimal_places=2)
+ZERO = Value(0, output_field=MONEY)
+
+
+def day_start(day):
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def completed_executions(profile=None, start=None, end=None):
+    """
+    Completed executions, optionally of ``profile`` only and between the
+    ``start`` and ``end`` dates, both inclusive, in the current time zone.
+
+    The range is expressed on ``completed_at`` itself so the partial index
+    ``execution_user_completed_idx`` can be used.
+    """
+    queryset = ServiceExecution.objects.filter(status=ServiceExecution.STATUS_COMPLETED)
+    if profile is not None:
+        queryset = queryset.filter(user=profile)
+    if start is not None:
+        queryset = queryset.filter(completed_at__gte=day_start(start))
+    if end is not None:
+        queryset = queryset.filter(completed_at__lt=day_start(end + timedelta(days=1)))
+    return queryset
+
+
+def daily_revenue(profile, start, end, service=None):
+    """
+    Daily rollup rows of ``profile`` between the ``start`` and ``end``
+    dates, both inclusive. A year of a busy shop is a few thousand rows at
+    most, whatever the number of executions behind them.
+    """
+    queryset = DailyServiceRevenue.objects.filter(user=profile, day__range=(start, end))
+    if service is not None:
+        queryset = queryset.filter(service=service)
+    return queryset
+
+
+def _money_totals():
+    return {
+        "revenue": Coalesce(Sum("total_revenue"), ZERO, output_field=MONEY),
+        "cost": Coalesce(Sum("total_cost"), ZERO, output_field=MONEY),
+        "executions": Coalesce(Sum("execution_count"), 0),
+    }
+
+
+def totals(rows):
+    """Revenue, material cost, profit and count of executions of ``rows``."""
+    result = rows.aggregate(**_money_totals())
+    result["profit"] = result["revenue"] - result["cost"]
+    return result
+
+
+def revenue_by_period(rows, period=PERIOD_DAY):
+    """
+    Revenue, material cost, profit and count of executions of ``rows``
+    grouped by day, week or month, computed in a single ``GROUP BY`` query.
+    """
+    return (
+        rows.annotate(period=Trunc("day", period, output_field=DateField()))
+        .order_by()
+        .values("period")
+        .annotate(**_money_totals())
+        .annotate(profit=F("revenue") - F("cost"))
+        .order_by("period")
+    )
+
+
+def revenue_by_service(rows):
+    """
+    Revenue, material cost, profit and count of executions of ``rows`` per
+    service, most profitable first, computed in a single ``GROUP BY`` query.
+    """
+    return (
+        rows.order_by()
+        .values("service", service_name=F("service__name"))
+        .annotate(**_money_totals())
+        .annotate(profit=F("revenue") - F("cost"))
+        .order_by("-profit", "service_name")
+    )
@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from authentication.models import Profile
+from reports.rollup import rebuild
+
+
+def _date(value):
+    day = parse_date(value)
+    if day is None:
+        raise ValueError(value)
+    return day
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the daily revenue rollup from the completed service executions."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--username", help="Only rebuild the rows of this user.")
+        parser.add_argument("--start", type=_date, help="First day to rebuild (YYYY-MM-DD).")
+        parser.add_argument("--end", type=_date, help="Last day to rebuild (YYYY-MM-DD).")
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        profile = None
+        if options["username"]:
+            try:
+                profile = Profile.objects.get(user__username=options["username"])
+            except Profile.DoesNotExist:
+                raise CommandError(f"No profile found for user '{options['username']}'.")
+
+        if options["start"] and options["end"] and options["start"] > options["end"]:
+            raise CommandError("--start must not be after --end.")
+
+        written = rebuild(
+            profile,
+            options["start"],
+            options["end"],
+            batch_size=options["batch_size"],
+        )
+        self.stdout.write(self.style.SUCCESS(f"{written} daily revenue rows rebuilt."))
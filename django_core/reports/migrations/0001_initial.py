@@ -0,0 +1,68 @@
+# Generated by Django 5.1.15 on 2026-10-18 08:43
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+
+
+def backfill_daily_revenue(apps, schema_editor):
+    ServiceExecution = apps.get_model("executions", "ServiceExecution")
+    DailyServiceRevenue = apps.get_model("reports", "DailyServiceRevenue")
+
+    grouped = (
+        ServiceExecution.objects.filter(status="completed")
+        .annotate(day=TruncDate("completed_at"))
+        .order_by()
+        .values("user", "service", "day")
+        .annotate(
+            total_revenue=Sum("price"),
+            total_cost=Sum("material_cost"),
+            execution_count=Count("id"),
+        )
+    )
+    DailyServiceRevenue.objects.bulk_create(
+        (
+            DailyServiceRevenue(
+                user_id=values["user"],
+                service_id=values["service"],
+                day=values["day"],
+                total_revenue=values["total_revenue"],
+                total_cost=values["total_cost"],
+                execution_count=values["execution_count"],
+            )
+            for values in grouped.iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('authentication', '0001_initial'),
+        ('executions', '0001_initial'),
+        ('services', '0004_service_material_cost'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyServiceRevenue',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('total_revenue', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('total_cost', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('execution_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('service', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='services.service')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='authentication.profile')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('user', 'day', 'service'), name='daily_revenue_unique_day')],
+            },
+        ),
+        migrations.RunPython(backfill_daily_revenue, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+from django.db import models
+
+
+class DailyServiceRevenue(models.Model):
+    """
+    Completed executions of a service summed per day, in the project time
+    zone. Kept current by ``reports.rollup.record_execution`` and rebuilt by
+    the ``rebuild_revenue_rollup`` command.
+    """
+
+    user = models.ForeignKey('authentication.Profile', on_delete=models.CASCADE)
+    service = models.ForeignKey('services.Service', on_delete=models.CASCADE)
+    day = models.DateField()
+    total_revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    total_cost = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    execution_count = models.PositiveIntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "day", "service"], name="daily_revenue_unique_day"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.day} {self.service_id}"
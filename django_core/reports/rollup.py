@@ -0,0 +1,97 @@
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from reports.aggregates import completed_executions
+from reports.models import DailyServiceRevenue
+
+
+def record_execution(execution):
+    """
+    Adds a completed ``execution`` to the rollup row of its day.
+
+    Meant to run inside the transaction that completes the execution: the
+    row is incremented in place by one UPDATE and only created, in a
+    savepoint, the first time the service is performed that day. When a
+    concurrent transaction creates the same row first, the insert fails on
+    the unique constraint and the increment is applied to that row instead.
+    """
+    rows = DailyServiceRevenue.objects.filter(
+        user_id=execution.user_id,
+        service_id=execution.service_id,
+        day=timezone.localdate(execution.completed_at),
+    )
+    increments = {
+        "total_revenue": F("total_revenue") + execution.price,
+        "total_cost": F("total_cost") + execution.material_cost,
+        "execution_count": F("execution_count") + 1,
+        "updated_at": timezone.now(),
+    }
+    if rows.update(**increments):
+        return
+    try:
+        with transaction.atomic():
+            DailyServiceRevenue.objects.create(
+                user_id=execution.user_id,
+                service_id=execution.service_id,
+                day=timezone.localdate(execution.completed_at),
+                total_revenue=execution.price,
+                total_cost=execution.material_cost,
+                execution_count=1,
+            )
+    except IntegrityError:
+        rows.update(**increments)
+
+
+def rebuild(profile=None, start=None, end=None, batch_size=1000):
+    """
+    Recomputes the rollup rows between the ``start`` and ``end`` dates,
+    both inclusive and both optional, from the completed executions,
+    optionally of ``profile`` only. Returns the number of rows written.
+
+    The executions are grouped by the database and the rows replaced in a
+    single transaction, so reports never see a half-built range.
+    """
+    rows = DailyServiceRevenue.objects.all()
+    if profile is not None:
+        rows = rows.filter(user=profile)
+    if start is not None:
+        rows = rows.filter(day__gte=start)
+    if end is not None:
+        rows = rows.filter(day__lte=end)
+
+    grouped = (
+        completed_executions(profile, start, end)
+        .annotate(day=TruncDate("completed_at"))
+        .order_by()
+        .values("user", "service", "day")
+        .annotate(
+            total_revenue=Sum("price"),
+            total_cost=Sum("material_cost"),
+            execution_count=Count("id"),
+        )
+    )
+
+    written = 0
+    with transaction.atomic():
+        rows.delete()
+        batch = []
+        for values in grouped.iterator(chunk_size=batch_size):
+            batch.append(
+                DailyServiceRevenue(
+                    user_id=values["user"],
+                    service_id=values["service"],
+                    day=values["day"],
+                    total_revenue=values["total_revenue"],
+                    total_cost=values["total_cost"],
+                    execution_count=values["execution_count"],
+                )
+            )
+            if len(batch) >= batch_size:
+                DailyServiceRevenue.objects.bulk_create(batch)
+                written += len(batch)
+                batch = []
+        DailyServiceRevenue.objects.bulk_create(batch)
+        written += len(batch)
+    return written
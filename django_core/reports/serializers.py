@@ -0,0 +1,59 @@
+from datetime import timedelta
+
+from django.utils import timezone
+from rest_framework import serializers
+
+from reports.aggregates import PERIOD_DAY, PERIODS
+from services.models import Service
+
+DEFAULT_RANGE_DAYS = 30
+MAX_RANGE_DAYS = 3 * 366
+
+
+class ReportQuerySerializer(serializers.Serializer):
+    """Validates the query parameters shared by the report endpoints."""
+
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+    period = serializers.ChoiceField(choices=PERIODS, default=PERIOD_DAY)
+    service = serializers.PrimaryKeyRelatedField(
+        queryset=Service.objects.none(), required=False
+    )
+
+    def get_fields(self):
+        fields = super().get_fields()
+        request = self.context.get("request")
+        if request is not None:
+            fields["service"].queryset = Service.objects.filter(
+                user=request.user.profile
+            )
+        return fields
+
+    def validate(self, data):
+        end = data.get("end") or timezone.localdate()
+        start = data.get("start") or end - timedelta(days=DEFAULT_RANGE_DAYS - 1)
+        if start > end:
+            raise serializers.ValidationError("start must not be after end.")
+        if (end - start).days >= MAX_RANGE_DAYS:
+            raise serializers.ValidationError(
+                f"The range cannot be longer than {MAX_RANGE_DAYS} days."
+            )
+        data["start"] = start
+        data["end"] = end
+        return data
+
+
+class ReportRowSerializer(serializers.Serializer):
+    revenue = serializers.DecimalField(max_digits=14, decimal_places=2)
+    cost = serializers.DecimalField(max_digits=14, decimal_places=2)
+    profit = serializers.DecimalField(max_digits=14, decimal_places=2)
+    executions = serializers.IntegerField()
+
+
+class PeriodRowSerializer(ReportRowSerializer):
+    period = serializers.DateField()
+
+
+class ServiceRowSerializer(ReportRowSerializer):
+    service = serializers.UUIDField()
+    service_name = serializers.CharField()
@@ -0,0 +1,120 @@
+import pytest
+from datetime import date, datetime
+from decimal import Decimal
+from io import StringIO
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.utils import timezone
+from executions.models import ServiceExecution
+from products.stock import InsufficientStock
+from reports.models import DailyServiceRevenue
+from reports.rollup import rebuild
+
+
+def local(*args):
+    return timezone.make_aware(datetime(*args))
+
+
+def rollup_rows():
+    return list(
+        DailyServiceRevenue.objects.order_by("day").values_list(
+            "day", "total_revenue", "total_cost", "execution_count"
+        )
+    )
+
+
+@pytest.mark.django_db
+class TestRecordExecution:
+
+    def test_executions_of_the_same_day_share_a_row(
+        self, create_service, create_completed_execution
+    ):
+        service = create_service()
+        create_completed_execution(service, local(2024, 3, 5, 8))
+        create_completed_execution(service, local(2024, 3, 5, 23, 59), price="100.00")
+        create_completed_execution(service, local(2024, 3, 6, 0, 1))
+
+        assert rollup_rows() == [
+            (date(2024, 3, 5), Decimal("250.00"), Decimal("100.00"), 2),
+            (date(2024, 3, 6), Decimal("150.00"), Decimal("50.00"), 1),
+        ]
+
+    def test_complete_updates_rollup(
+        self, create_service, create_product, add_product_to_service, create_execution
+    ):
+        service = create_service()
+        add_product_to_service(service, create_product(profile=service.user), quantity=2)
+        execution = create_execution(service, price="180.00")
+
+        execution.complete()
+
+        row = DailyServiceRevenue.objects.get()
+        assert row.day == timezone.localdate(execution.completed_at)
+        assert row.total_revenue == Decimal("180.00")
+        assert row.total_cost == Decimal("100.00")
+        assert row.execution_count == 1
+
+    def test_failed_completion_leaves_rollup_untouched(
+        self, create_service, create_product, add_product_to_service, create_execution
+    ):
+        service = create_service()
+        add_product_to_service(service, create_product(profile=service.user), quantity=500)
+
+        with pytest.raises(InsufficientStock):
+            create_execution(service).complete()
+
+        assert not DailyServiceRevenue.objects.exists()
+
+
+@pytest.mark.django_db
+class TestRebuild:
+
+    def test_rebuild_matches_incremental_rollup(
+        self, create_service, create_completed_execution
+    ):
+        service = create_service()
+        create_completed_execution(service, local(2024, 3, 5, 8))
+        create_completed_execution(service, local(2024, 3, 5, 23, 30))
+        create_completed_execution(service, local(2024, 4, 1, 10), price="90.00")
+        expected = rollup_rows()
+        DailyServiceRevenue.objects.update(total_revenue=0, execution_count=0)
+
+        written = rebuild()
+
+        assert written == 2
+        assert rollup_rows() == expected
+
+    def test_rebuild_only_touches_the_range(
+        self, create_service, create_completed_execution
+    ):
+        service = create_service()
+        create_completed_execution(service, local(2024, 3, 5, 8))
+        create_completed_execution(service, local(2024, 4, 1, 10))
+        DailyServiceRevenue.objects.update(execution_count=7)
+
+        rebuild(start=date(2024, 4, 1), end=date(2024, 4, 30))
+
+        assert [row[3] for row in rollup_rows()] == [7, 1]
+
+    def test_rebuild_ignores_pending_executions(self, create_service, create_execution):
+        create_execution(create_service())
+
+        assert rebuild() == 0
+        assert ServiceExecution.objects.count() == 1
+
+    def test_command(self, create_service, create_completed_execution):
+        service = create_service()
+        create_completed_execution(service, local(2024, 3, 5, 8))
+        DailyServiceRevenue.objects.all().delete()
+        out = StringIO()
+
+        call_command(
+            "rebuild_revenue_rollup", "--username", "john_doe", "--start", "2024-03-01", stdout=out
+        )
+
+        assert "1 daily revenue rows rebuilt." in out.getvalue()
+        assert DailyServiceRevenue.objects.count() == 1
+
+    def test_command_unknown_user(self):
+        with pytest.raises(CommandError):
+            call_command("rebuild_revenue_rollup", "--username", "nobody")
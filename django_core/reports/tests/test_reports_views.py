@@ -0,0 +1,156 @@
+import pytest
+from datetime import date, datetime
+from django.utils import timezone
+from rest_framework import status
+from services.models import Service
+
+REVENUE_URL = "/api/reports/revenue/"
+SERVICES_URL = "/api/reports/services/"
+
+
+def local(*args):
+    return timezone.make_aware(datetime(*args))
+
+
+@pytest.fixture
+def executions(create_profile, create_service, create_completed_execution):
+    """Three executions of two services spread over two months."""
+    profile = create_profile()
+    wash = create_service(profile=profile)
+    polish = Service.objects.create(
+        user=profile,
+        name="Polish",
+        pricing_type=Service.PRICING_TYPE_FIXED,
+        base_price=300,
+        estimated_time=120,
+    )
+    create_completed_execution(wash, local(2024, 1, 10, 9), price="150.00", material_cost="40.00")
+    create_completed_execution(wash, local(2024, 1, 10, 23, 30), price="150.00", material_cost="40.00")
+    create_completed_execution(polish, local(2024, 2, 3, 14), price="300.00", material_cost="120.00")
+    return profile, wash, polish
+
+
+@pytest.mark.django_db
+class TestRevenueReportView:
+
+    def test_revenue_per_day(self, api_client, executions):
+        profile, _, _ = executions
+        api_client.force_authenticate(user=profile.user)
+
+        response = api_client.get(REVENUE_URL, {"start": "2024-01-01", "end": "2024-02-29"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["period"] == "day"
+        assert response.data["totals"] == {
+            "revenue": "600.00", "cost": "200.00", "profit": "400.00", "executions": 3,
+        }
+        assert [dict(row) for row in response.data["results"]] == [
+            {"revenue": "300.00", "cost": "80.00", "profit": "220.00", "executions": 2,
+             "period": "2024-01-10"},
+            {"revenue": "300.00", "cost": "120.00", "profit": "180.00", "executions": 1,
+             "period": "2024-02-03"},
+        ]
+
+    def test_revenue_per_month(self, api_client, executions):
+        profile, _, _ = executions
+        api_client.force_authenticate(user=profile.user)
+
+        response = api_client.get(
+            REVENUE_URL, {"start": "2024-01-01", "end": "2024-12-31", "period": "month"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [row["period"] for row in response.data["results"]] == ["2024-01-01", "2024-02-01"]
+
+    def test_revenue_per_week(self, api_client, executions):
+        profile, _, _ = executions
+        api_client.force_authenticate(user=profile.user)
+
+        response = api_client.get(
+            REVENUE_URL, {"start": "2024-01-01", "end": "2024-12-31", "period": "week"}
+        )
+
+        assert [row["period"] for row in response.data["results"]] == ["2024-01-08", "2024-01-29"]
+
+    def test_range_limits_results(self, api_client, executions):
+        profile, _, _ = executions
+        api_client.force_authenticate(user=profile.user)
+
+        response = api_client.get(REVENUE_URL, {"start": "2024-01-11", "end": "2024-02-03"})
+
+        assert response.data["totals"]["executions"] == 1
+
+    def test_filter_by_service(self, api_client, executions):
+        profile, wash, _ = executions
+        api_client.force_authenticate(user=profile.user)
+
+        response = api_client.get(
+            REVENUE_URL, {"start": "2024-01-01", "end": "2024-12-31", "service": str(wash.id)}
+        )
+
+        assert response.data["totals"]["revenue"] == "300.00"
+
+    def test_ignores_pending_executions_and_other_profiles(
+        self, api_client, executions, create_user, create_profile, create_service,
+        create_completed_execution
+    ):
+        profile, wash, _ = executions
+        wash.serviceexecution_set.create(user=profile, price="999.00")
+        other = create_profile(user=create_user(username="other"))
+        create_completed_execution(create_service(profile=other), local(2024, 1, 10, 9))
+        api_client.force_authenticate(user=profile.user)
+
+        response = api_client.get(REVENUE_URL, {"start": "2024-01-01", "end": "2024-12-31"})
+
+        assert response.data["totals"]["executions"] == 3
+
+    def test_empty_range(self, api_client, create_profile):
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+
+        response = api_client.get(REVENUE_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["end"] == timezone.localdate()
+        assert response.data["totals"]["revenue"] == "0.00"
+        assert response.data["results"] == []
+
+    def test_invalid_range(self, api_client, create_profile):
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+
+        response = api_client.get(REVENUE_URL, {"start": "2024-02-01", "end": "2024-01-01"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_report_costs_fixed_number_of_queries(
+        self, api_client, executions, django_assert_max_num_queries
+    ):
+        profile, _, _ = executions
+        api_client.force_authenticate(user=profile.user)
+
+        with django_assert_max_num_queries(4):
+            api_client.get(REVENUE_URL, {"start": "2024-01-01", "end": "2024-12-31"})
+
+    def test_requires_authentication(self, api_client):
+        response = api_client.get(REVENUE_URL)
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+class TestServiceReportView:
+
+    def test_revenue_per_service(self, api_client, executions):
+        profile, wash, polish = executions
+        api_client.force_authenticate(user=profile.user)
+
+        response = api_client.get(SERVICES_URL, {"start": "2024-01-01", "end": "2024-12-31"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "period" not in response.data
+        assert response.data["start"] == date(2024, 1, 1)
+        assert [(row["service"], row["profit"], row["executions"]) for row in response.data["results"]] == [
+            (str(wash.id), "220.00", 2),
+            (str(polish.id), "180.00", 1),
+        ]
@@ -0,0 +1,7 @@
+from django.urls import path
+from reports.views import RevenueReportView, ServiceReportView
+
+urlpatterns = [
+    path("revenue/", RevenueReportView.as_view(), name="report-revenue"),
+    path("services/", ServiceReportView.as_view(), name="report-services"),
+]
@@ -0,0 +1,69 @@
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from reports import aggregates
+from reports.serializers import (
+    PeriodRowSerializer,
+    ReportQuerySerializer,
+    ReportRowSerializer,
+    ServiceRowSerializer,
+)
+
+
+class ReportView(APIView):
+    """
+    Base class of the financial reports. Every figure is aggregated by the
+    database over the daily revenue rollup of the requesting profile.
+    """
+
+    permission_classes = [IsAuthenticated]
+    row_serializer_class = None
+
+    def get_rows(self, rows, params):
+        raise NotImplementedError
+
+    def get_extra(self, params):
+        return {}
+
+    def get(self, request):
+        query = ReportQuerySerializer(data=request.query_params, context={"request": request})
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+
+        rows = aggregates.daily_revenue(
+            request.user.profile,
+            params["start"],
+            params["end"],
+            service=params.get("service"),
+        )
+        return Response({
+            "start": params["start"],
+            "end": params["end"],
+            **self.get_extra(params),
+            "totals": ReportRowSerializer(aggregates.totals(rows)).data,
+            "results": self.row_serializer_class(
+                self.get_rows(rows, params), many=True
+            ).data,
+        })
+
+
+class RevenueReportView(ReportView):
+    """Revenue, material cost and profit per day, week or month."""
+
+    row_serializer_class = PeriodRowSerializer
+
+    def get_rows(self, rows, params):
+        return aggregates.revenue_by_period(rows, params["period"])
+
+    def get_extra(self, params):
+        return {"period": params["period"]}
+
+
+class ServiceReportView(ReportView):
+    """Revenue, material cost and profit per service."""
+
+    row_serializer_class = ServiceRowSerializer
+
+    def get_rows(self, rows, params):
+        return aggregates.revenue_by_service(rows)
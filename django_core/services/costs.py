@@ -0,0 +1,105 @@
+"""
+Cost engine for services.
+
+The material cost of a service is the sum, over the products it uses, of
+``ServiceProduct.quantity * Product.last_purchase_price``; the purchase
+price is taken as the price of one ``unit_type`` (one ml or one unit).
+
+The cost is stored on ``Service.material_cost``. It is written when the
+service's usages are saved and refreshed in bulk, for the affected
+services only, when a product's purchase price changes. Listings read the
+stored column and derive price and margin from it in SQL.
+"""
+from decimal import Decimal
+
+from django.db.models import (
+    Case,
+    DecimalField,
+    ExpressionWrapper,
+    F,
+    OuterRef,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from services.models import Service, ServiceProduct
+
+MONEY = DecimalField(max_digits=12, decimal_places=2)
+ZERO = Value(Decimal("0.00"), output_field=MONEY)
+
+
+def usage_cost():
+    """Cost of one usage row: quantity times the product's last purchase price."""
+    return ExpressionWrapper(
+        F("quantity") * F("product__last_purchase_price"), output_field=MONEY
+    )
+
+
+def material_cost_expression():
+    """Correlated subquery with the material cost of the outer service."""
+    costs = (
+        ServiceProduct.objects.filter(service=OuterRef("pk"))
+        .values("service")
+        .annotate(total=Sum(usage_cost()))
+        .values("total")
+    )
+    return Coalesce(Subquery(costs, output_field=MONEY), ZERO, output_field=MONEY)
+
+
+def estimated_price_expression():
+    """Price of one execution: ``base_price``, per hour for hourly services."""
+    return Case(
+        When(
+            pricing_type=Service.PRICING_TYPE_HOURLY,
+            then=ExpressionWrapper(
+                F("base_price") * F("estimated_time") / Value(Decimal("60")),
+                output_field=MONEY,
+            ),
+        ),
+        default=F("base_price"),
+        output_field=MONEY,
+    )
+
+
+def cost_annotations():
+    """Annotations exposing ``estimated_price`` and ``margin``."""
+    return {
+        "estimated_price": estimated_price_expression(),
+        "margin": ExpressionWrapper(
+            F("estimated_price") - F("material_cost"), output_field=MONEY
+        ),
+    }
+
+
+def calculate_costs(service):
+    """Sets ``estimated_price`` and ``margin`` on a single service."""
+    cent = Decimal("0.01")
+    estimated_price = Decimal(service.base_price)
+    if service.pricing_type == Service.PRICING_TYPE_HOURLY:
+        estimated_price = estimated_price * service.estimated_time / 60
+
+    service.estimated_price = estimated_price.quantize(cent)
+    service.margin = service.estimated_price - Decimal(service.material_cost)
+    return service
+
+
+def refresh_material_costs(services):
+    """Recomputes the stored material cost of ``services`` with one UPDATE."""
+    return services.update(
+        material_cost=material_cost_expression(), updated_at=timezone.now()
+    )
+
+
+def refresh_material_costs_for_products(product_ids):
+    """Recomputes the material cost of the services using any of ``product_ids``."""
+    return refresh_material_costs(
+        Service.objects.filter(
+            pk__in=ServiceProduct.objects.filter(product_id__in=product_ids).values(
+                "service_id"
+            )
+        )
+    )
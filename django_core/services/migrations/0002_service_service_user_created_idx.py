@@ -0,0 +1,18 @@
+# Generated by Django 5.1.15 on 2026-10-18 08:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0001_initial'),
+        ('services', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='service',
+            index=models.Index(fields=['user', 'created_at', 'id'], name='service_user_created_idx'),
+        ),
+    ]
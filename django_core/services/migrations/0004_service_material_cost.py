@@ -0,0 +1,47 @@
+# Generated by Django 5.1.15 on 2026-10-18 08:27
+
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import F, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_material_cost(apps, schema_editor):
+    Service = apps.get_model("services", "Service")
+    ServiceProduct = apps.get_model("services", "ServiceProduct")
+    money = models.DecimalField(max_digits=12, decimal_places=2)
+
+    costs = (
+        ServiceProduct.objects.filter(service=OuterRef("pk"))
+        .values("service")
+        .annotate(
+            total=Sum(
+                F("quantity") * F("product__last_purchase_price"), output_field=money
+            )
+        )
+        .values("total")
+    )
+    Service.objects.update(
+        material_cost=Coalesce(
+            Subquery(costs, output_field=money),
+            Value(Decimal("0.00"), output_field=money),
+            output_field=money,
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('services', '0003_remove_service_service_user_created_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='service',
+            name='material_cost',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=12),
+        ),
+        migrations.RunPython(backfill_material_cost, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.1.15 on 2026-10-18 09:06
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_deleted_at(apps, schema_editor):
+    # Rows soft-deleted before destroy() set deleted_at get their last
+    # update time as the deletion time.
+    Service = apps.get_model("services", "Service")
+    Service.objects.filter(is_deleted=True, deleted_at__isnull=True).update(
+        deleted_at=F("updated_at")
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0001_initial'),
+        ('services', '0004_service_material_cost'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='service',
+            index=models.Index(fields=['user', 'updated_at', 'id'], name='service_user_changes_idx'),
+        ),
+        migrations.RunPython(backfill_deleted_at, migrations.RunPython.noop),
+    ]
@@ -1,7 +1,21 @@
-from django.db import models
+from django.db import models, transaction
 from uuid import uuid4
 from django.core.exceptions import ValidationError
 
+from auto_care import catalog_cache
+
+
+class ServiceQuerySet(models.QuerySet):
+    def with_products(self):
+        """Loads every service's product usages, and their products, in one extra query."""
+        return self.prefetch_related(product_usages_prefetch())
+
+    def with_costs(self):
+        """Annotates estimated price and margin, computed in SQL."""
+        from services.costs import cost_annotations
+
+        return self.annotate(**cost_annotations())
+
 
 class Service(models.Model):
     PRICING_TYPE_FIXED = 'fixed'
@@ -23,12 +37,29 @@ class Service(models.Model):
     )
     base_price = models.DecimalField(max_digits=10, decimal_places=2)
     estimated_time = models.IntegerField()
+    material_cost = models.DecimalField(max_digits=12, decimal_places=2, default=0)
     is_deleted = models.BooleanField(default=False)
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     deleted_at = models.DateTimeField(null=True, blank=True)
 
+    objects = ServiceQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["user", "created_at", "id"],
+                condition=models.Q(is_deleted=False),
+                name="service_user_live_idx",
+            ),
+            models.Index(fields=["user", "updated_at", "id"], name="service_user_changes_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        catalog_cache.bump(self.user_id, catalog_cache.SERVICES)
+
     def clean(self):
         if self.name is None or self.name.strip() == "":
             raise ValidationError("Name cannot be null or empty.")
@@ -55,3 +86,27 @@ class ServiceProduct(models.Model):
             raise ValidationError("Product cannot be null.")
         if self.quantity is None or self.quantity <= 0:
             raise ValidationError("Quantity must be greater than zero.")
+
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            self._refresh_service_cost()
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            self._refresh_service_cost()
+        return result
+
+    def _refresh_service_cost(self):
+        from services.costs import refresh_material_costs
+
+        refresh_material_costs(Service.objects.filter(pk=self.service_id))
+        catalog_cache.bump(self.user_id, catalog_cache.SERVICES)
+
+
+def product_usages_prefetch():
+    return models.Prefetch(
+        "serviceproduct_set",
+        queryset=ServiceProduct.objects.select_related("product"),
+    )
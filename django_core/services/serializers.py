@@ -1,10 +1,23 @@
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import prefetch_related_objects
 from rest_framework import serializers
-from services.models import Service, ServiceProduct
+from services.costs import calculate_costs
+from services.models import Service, ServiceProduct, product_usages_prefetch
 from products.models import Product
 
 
 class ServiceProductUsageSerializer(serializers.Serializer):
-    product = serializers.UUIDField()
+    product = serializers.UUIDField(source="product_id")
+    product_name = serializers.CharField(source="product.name", read_only=True)
+    unit_type = serializers.CharField(source="product.unit_type", read_only=True)
+    unit_cost = serializers.DecimalField(
+        source="product.last_purchase_price",
+        max_digits=10,
+        decimal_places=2,
+        read_only=True,
+    )
     quantity = serializers.DecimalField(
         max_digits=10, decimal_places=2, allow_null=True
     )
@@ -12,11 +25,16 @@ class ServiceProductUsageSerializer(serializers.Serializer):
     def validate_quantity(self, value):
         if value is None or value <= 0:
             raise serializers.ValidationError("Quantity must be greater than 0.")
-        return float(value)
+        return value
 
 
 class ServiceSerializer(serializers.ModelSerializer):
-    products = ServiceProductUsageSerializer(many=True, required=False)
+    products = ServiceProductUsageSerializer(
+        many=True, required=False, source="serviceproduct_set"
+    )
+    material_cost = serializers.DecimalField(max_digits=12, decimal_places=2, read_only=True)
+    estimated_price = serializers.DecimalField(max_digits=12, decimal_places=2, read_only=True)
+    margin = serializers.DecimalField(max_digits=12, decimal_places=2, read_only=True)
 
     class Meta:
         model = Service
@@ -29,6 +47,9 @@ class ServiceSerializer(serializers.ModelSerializer):
             "base_price",
             "estimated_time",
             "products",
+            "material_cost",
+            "estimated_price",
+            "margin",
         ]
         read_only_fields = ["id", "created_at", "updated_at", "deleted_at"]
         extra_kwargs = {
@@ -40,28 +61,105 @@ class ServiceSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Base price must be greater than 0.")
         return value
 
-    def create(self, validated_data):
-        products_data = validated_data.pop("products", [])
-        user = validated_data["user"]
+    def validate_products(self, value):
+        product_ids = [p["product_id"] for p in value]
+        if len(product_ids) != len(set(product_ids)):
+            raise serializers.ValidationError("Each product can only be listed once.")
+        return value
 
-        product_ids = [p["product"] for p in products_data]
-        existing_products = Product.objects.filter(id__in=product_ids).values_list(
-            "id", flat=True
+    def _material_cost(self, products_data, user):
+        """
+        Checks that every listed product belongs to ``user`` and returns the
+        material cost of the usages, priced with the same query.
+        """
+        product_ids = [p["product_id"] for p in products_data]
+        prices = dict(
+            Product.objects.filter(id__in=product_ids, user=user).values_list(
+                "id", "last_purchase_price"
+            )
         )
 
-        missing_products = set(product_ids) - set(existing_products)
+        missing_products = set(product_ids) - set(prices)
         if missing_products:
             raise serializers.ValidationError(
                 {"message": "One or more products do not exist."}
             )
 
-        service = Service.objects.create(**validated_data)
+        material_cost = sum(
+            (p["quantity"] * prices[p["product_id"]] for p in products_data),
+            Decimal("0"),
+        )
+        return material_cost.quantize(Decimal("0.01"))
+
+    def _sync_products(self, service, products_data):
+        """
+        Brings the service's product usages in line with ``products_data``.
 
-        for product_data in products_data:
-            ServiceProduct.objects.create(
+        Only the differences are written: new products are inserted with a
+        single ``bulk_create``, changed quantities with a single
+        ``bulk_update`` and dropped products with a single ``DELETE``.
+        """
+        quantities = {p["product_id"]: p["quantity"] for p in products_data}
+        current = {usage.product_id: usage for usage in service.serviceproduct_set.all()}
+
+        to_create = [
+            ServiceProduct(
                 service=service,
-                product_id=product_data["product"],
-                quantity=product_data["quantity"],
-                user=user,
+                product_id=product_id,
+                quantity=quantity,
+                user=service.user,
             )
-        return service
+            for product_id, quantity in quantities.items()
+            if product_id not in current
+        ]
+        to_update = []
+        to_delete = []
+        for product_id, usage in current.items():
+            if product_id not in quantities:
+                to_delete.append(usage.pk)
+            elif usage.quantity != quantities[product_id]:
+                usage.quantity = quantities[product_id]
+                to_update.append(usage)
+
+        if to_delete:
+            ServiceProduct.objects.filter(pk__in=to_delete).delete()
+        if to_update:
+            ServiceProduct.objects.bulk_update(to_update, ["quantity"])
+        if to_create:
+            ServiceProduct.objects.bulk_create(to_create)
+
+    def create(self, validated_data):
+        products_data = validated_data.pop("serviceproduct_set", [])
+        user = validated_data["user"]
+
+        validated_data["material_cost"] = self._material_cost(products_data, user)
+
+        with transaction.atomic():
+            service = Service.objects.create(**validated_data)
+            ServiceProduct.objects.bulk_create(
+                ServiceProduct(
+                    service=service,
+                    product_id=product_data["product_id"],
+                    quantity=product_data["quantity"],
+                    user=user,
+                )
+                for product_data in products_data
+            )
+
+        prefetch_related_objects([service], product_usages_prefetch())
+        return calculate_costs(service)
+
+    def update(self, instance, validated_data):
+        products_data = validated_data.pop("serviceproduct_set", None)
+
+        if products_data is not None:
+            validated_data["material_cost"] = self._material_cost(
+                products_data, instance.user
+            )
+
+        with transaction.atomic():
+            service = super().update(instance, validated_data)
+            if products_data is not None:
+                self._sync_products(service, products_data)
+
+        return calculate_costs(service)
@@ -0,0 +1,155 @@
+import pytest
+from decimal import Decimal
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from services.costs import calculate_costs
+from services.models import Service
+from products.serializers import ProductSerializer
+
+
+@pytest.mark.django_db
+class TestServiceCosts:
+
+    def test_with_costs_annotates_every_service_in_one_query(
+        self,
+        create_profile,
+        create_service,
+        create_product,
+        add_product_to_service,
+        django_assert_num_queries,
+    ):
+        profile = create_profile()
+        shampoo = create_product(profile, name="Shampoo", last_purchase_price="0.05")
+        wax = create_product(profile, name="Wax", last_purchase_price="0.20")
+        washed = create_service(profile)
+        add_product_to_service(washed, shampoo, quantity=100)
+        add_product_to_service(washed, wax, quantity="12.5")
+        bare = create_service(profile)
+
+        with django_assert_num_queries(1):
+            services = {s.pk: s for s in Service.objects.filter(user=profile).with_costs()}
+
+        assert services[washed.pk].material_cost == Decimal("7.50")
+        assert services[washed.pk].estimated_price == Decimal("150.00")
+        assert services[washed.pk].margin == Decimal("142.50")
+        assert services[bare.pk].material_cost == Decimal("0.00")
+        assert services[bare.pk].margin == Decimal("150.00")
+
+    def test_hourly_services_are_priced_by_estimated_time(self, create_profile):
+        profile = create_profile()
+        service = Service.objects.create(
+            user=profile,
+            name="Polishing",
+            description="Paint polishing",
+            pricing_type=Service.PRICING_TYPE_HOURLY,
+            base_price="80.00",
+            estimated_time=90,
+        )
+
+        annotated = Service.objects.with_costs().get(pk=service.pk)
+
+        assert annotated.estimated_price == Decimal("120.00")
+        assert annotated.margin == Decimal("120.00")
+
+    def test_calculate_costs_matches_annotations(
+        self, create_profile, create_service, create_product, add_product_to_service
+    ):
+        profile = create_profile()
+        service = create_service(profile)
+        add_product_to_service(
+            service, create_product(profile, last_purchase_price="3.33"), quantity=3
+        )
+
+        service.refresh_from_db()
+        calculate_costs(service)
+        annotated = Service.objects.with_costs().get(pk=service.pk)
+
+        assert service.material_cost == annotated.material_cost == Decimal("9.99")
+        assert service.estimated_price == annotated.estimated_price
+        assert service.margin == annotated.margin
+
+
+def service_updates(context):
+    return [
+        q["sql"] for q in context.captured_queries
+        if q["sql"].startswith('UPDATE "services_service"')
+    ]
+
+
+@pytest.mark.django_db
+class TestMaterialCostRefresh:
+
+    def test_usage_changes_refresh_the_stored_cost(
+        self, create_profile, create_service, create_product, add_product_to_service
+    ):
+        profile = create_profile()
+        service = create_service(profile)
+        product = create_product(profile, last_purchase_price="2.00")
+
+        add_product_to_service(service, product, quantity=3)
+        service.refresh_from_db()
+        assert service.material_cost == Decimal("6.00")
+
+        service.serviceproduct_set.get().delete()
+        service.refresh_from_db()
+        assert service.material_cost == Decimal("0.00")
+
+    def test_price_change_refreshes_only_linked_services_in_one_update(
+        self, create_profile, create_service, create_product, add_product_to_service
+    ):
+        profile = create_profile()
+        product = create_product(profile, last_purchase_price="2.00")
+        other_product = create_product(profile, last_purchase_price="5.00")
+        linked = [create_service(profile) for _ in range(3)]
+        for service in linked:
+            add_product_to_service(service, product, quantity=2)
+        unrelated = create_service(profile)
+        add_product_to_service(unrelated, other_product, quantity=1)
+        unrelated.refresh_from_db()
+
+        product.last_purchase_price = Decimal("3.50")
+        with CaptureQueriesContext(connection) as context:
+            product.save()
+
+        assert len(service_updates(context)) == 1
+        for service in linked:
+            service.refresh_from_db()
+            assert service.material_cost == Decimal("7.00")
+        previous_updated_at = unrelated.updated_at
+        unrelated.refresh_from_db()
+        assert unrelated.material_cost == Decimal("5.00")
+        assert unrelated.updated_at == previous_updated_at
+
+    def test_saving_product_without_price_change_skips_refresh(
+        self, create_profile, create_service, create_product, add_product_to_service
+    ):
+        profile = create_profile()
+        product = create_product(profile)
+        add_product_to_service(create_service(profile), product, quantity=1)
+        product.refresh_from_db()
+
+        product.name = "Renamed"
+        with CaptureQueriesContext(connection) as context:
+            product.save()
+
+        assert service_updates(context) == []
+
+    def test_bulk_price_update_refreshes_linked_services(
+        self, create_profile, create_service, create_product, add_product_to_service
+    ):
+        profile = create_profile()
+        product = create_product(profile, last_purchase_price="1.00")
+        service = create_service(profile)
+        add_product_to_service(service, product, quantity=10)
+
+        serializer = ProductSerializer(
+            {product.id: product},
+            data=[{"id": str(product.id), "last_purchase_price": "1.25"}],
+            many=True,
+            partial=True,
+        )
+        assert serializer.is_valid(), serializer.errors
+        serializer.save()
+
+        service.refresh_from_db()
+        assert service.material_cost == Decimal("12.50")
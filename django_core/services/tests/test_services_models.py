@@ -1,4 +1,5 @@
 import pytest
+from django.db import connection
 from django.core.exceptions import ValidationError
 from services.models import Service, ServiceProduct
 from django.db.utils import IntegrityError
@@ -148,3 +149,38 @@ class TestServiceProductModel:
             ServiceProduct.objects.create(
                 user=profile, service=service, product=None, quantity=2
             ).full_clean()
+
+
+@pytest.mark.django_db
+class TestServiceIndexes:
+
+    @pytest.fixture(autouse=True)
+    def require_sqlite(self):
+        if connection.vendor != "sqlite":
+            pytest.skip("Query plan assertions are written for SQLite.")
+
+    def test_live_services_listing_uses_partial_index(self, create_profile, create_service):
+        profile = create_profile()
+        live = create_service(profile)
+        deleted = create_service(profile)
+        deleted.is_deleted = True
+        deleted.save()
+
+        queryset = Service.objects.filter(is_deleted=False, user=profile).order_by(
+            "created_at", "id"
+        )
+        plan = queryset.explain()
+
+        assert "service_user_live_idx" in plan
+        assert "TEMP B-TREE" not in plan
+        assert list(queryset) == [live]
+
+    def test_service_cursor_page_uses_partial_index(self, create_profile, create_service):
+        profile = create_profile()
+        service = create_service(profile)
+
+        queryset = Service.objects.filter(
+            is_deleted=False, user=profile, created_at__gt=service.created_at
+        ).order_by("created_at", "id")
+
+        assert "service_user_live_idx" in queryset.explain()
@@ -1,5 +1,8 @@
+from unittest import mock
 from rest_framework import serializers
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from uuid import UUID
 from services.serializers import ServiceSerializer
 from services.models import Service, ServiceProduct
@@ -158,3 +161,126 @@ class TestServiceSerializer:
         assert not serializer.is_valid()
         assert "products" in serializer.errors
         assert "Quantity must be greater than 0." in str(serializer.errors["products"])
+
+    def test_products_are_inserted_with_a_single_query(self, create_profile, create_product):
+        profile = create_profile()
+        products = [create_product(profile, name=f"Product {i}") for i in range(5)]
+
+        data = {
+            "name": "Full Detailing",
+            "description": "Everything",
+            "pricing_type": Service.PRICING_TYPE_FIXED,
+            "base_price": "500.00",
+            "estimated_time": 240,
+            "products": [{"product": str(p.id), "quantity": "1.5"} for p in products],
+        }
+        serializer = ServiceSerializer(data=data)
+        assert serializer.is_valid(), serializer.errors
+
+        with CaptureQueriesContext(connection) as context:
+            service = serializer.save(user=profile)
+
+        inserts = [
+            q["sql"] for q in context.captured_queries
+            if q["sql"].startswith('INSERT INTO "services_serviceproduct"')
+        ]
+        assert len(inserts) == 1
+        assert service.serviceproduct_set.count() == 5
+
+    def test_failed_product_insert_rolls_back_service(self, create_profile, create_product):
+        profile = create_profile()
+        product = create_product(profile)
+
+        data = {
+            "name": "Interior Cleaning",
+            "description": "Full interior clean",
+            "pricing_type": Service.PRICING_TYPE_FIXED,
+            "base_price": "150.00",
+            "estimated_time": 90,
+            "products": [{"product": str(product.id), "quantity": "1.0"}],
+        }
+        serializer = ServiceSerializer(data=data)
+        assert serializer.is_valid(), serializer.errors
+
+        with mock.patch.object(
+            ServiceProduct.objects, "bulk_create", side_effect=RuntimeError("boom")
+        ):
+            with pytest.raises(RuntimeError):
+                serializer.save(user=profile)
+
+        assert not Service.objects.exists()
+
+    def test_duplicated_products_should_fail(self):
+        product_id = "00000000-0000-0000-0000-000000000000"
+        data = {
+            "name": "Wheel Cleaning",
+            "description": "Clean wheels thoroughly",
+            "pricing_type": Service.PRICING_TYPE_FIXED,
+            "base_price": "100.00",
+            "estimated_time": 45,
+            "products": [
+                {"product": product_id, "quantity": "1.0"},
+                {"product": product_id, "quantity": "2.0"},
+            ],
+        }
+
+        serializer = ServiceSerializer(data=data)
+        assert not serializer.is_valid()
+        assert "Each product can only be listed once." in str(serializer.errors["products"])
+
+    def test_products_of_another_profile_should_fail_on_save(
+        self, create_user, create_profile, create_product
+    ):
+        owner = create_profile(create_user(username="owner"))
+        other = create_profile(create_user(username="other"))
+        product = create_product(owner)
+
+        data = {
+            "name": "Interior Cleaning",
+            "description": "Full interior clean",
+            "pricing_type": Service.PRICING_TYPE_FIXED,
+            "base_price": "150.00",
+            "estimated_time": 90,
+            "products": [{"product": str(product.id), "quantity": "1.0"}],
+        }
+        serializer = ServiceSerializer(data=data)
+        assert serializer.is_valid(), serializer.errors
+
+        with pytest.raises(serializers.ValidationError):
+            serializer.save(user=other)
+
+    def test_update_only_writes_changed_products(
+        self, create_profile, create_service, create_product, add_product_to_service
+    ):
+        profile = create_profile()
+        service = create_service(profile)
+        kept = create_product(profile, name="Kept")
+        changed = create_product(profile, name="Changed")
+        removed = create_product(profile, name="Removed")
+        added = create_product(profile, name="Added")
+        for product in (kept, changed, removed):
+            add_product_to_service(service, product, quantity=1)
+
+        data = {
+            "products": [
+                {"product": str(kept.id), "quantity": "1.00"},
+                {"product": str(changed.id), "quantity": "3.00"},
+                {"product": str(added.id), "quantity": "2.00"},
+            ],
+        }
+        serializer = ServiceSerializer(service, data=data, partial=True)
+        assert serializer.is_valid(), serializer.errors
+
+        with CaptureQueriesContext(connection) as context:
+            serializer.save(user=profile)
+
+        usage_writes = [
+            q["sql"].split(" ")[0] for q in context.captured_queries
+            if '"services_serviceproduct"' in q["sql"] and not q["sql"].startswith("SELECT")
+        ]
+        assert sorted(usage_writes) == ["DELETE", "INSERT", "UPDATE"]
+
+        quantities = {
+            usage.product_id: usage.quantity for usage in service.serviceproduct_set.all()
+        }
+        assert quantities == {kept.id: 1, changed.id: 3, added.id: 2}
@@ -1,4 +1,6 @@
+import json
 import pytest
+from django.core.cache import cache
 from decimal import Decimal
 from rest_framework import status
 from services.models import Service, ServiceProduct
@@ -8,6 +10,8 @@ LIST_URL = "/api/services/"
 RETRIEVE_URL = "/api/services/{}/"
 UPDATE_URL = "/api/services/{}/"
 DELETE_URL = "/api/services/{}/"
+ASYNC_LIST_URL = "/api/async/services/"
+ASYNC_RETRIEVE_URL = "/api/async/services/{}/"
 
 
 @pytest.mark.django_db
@@ -43,8 +47,11 @@ class TestServiceView:
         assert response.status_code == status.HTTP_201_CREATED
         assert Service.objects.count() == 1
         assert ServiceProduct.objects.count() == 2
+        assert response.data["material_cost"] == "65.00"
+        assert response.data["margin"] == "185.00"
 
         service = Service.objects.first()
+        assert service.material_cost == Decimal("65.00")
         service_product1 = service.serviceproduct_set.get(product=product1)
         service_product2 = service.serviceproduct_set.get(product=product2)
 
@@ -66,7 +73,116 @@ class TestServiceView:
 
         response = api_client.get(LIST_URL)
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) > 0
+        assert len(response.data["results"]) > 0
+
+    def test_list_services_is_cursor_paginated(
+        self, api_client, create_profile, create_service
+    ):
+        """Tests that the listing is paginated by cursor in creation order."""
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+
+        created = [create_service(profile=profile) for _ in range(3)]
+
+        response = api_client.get(LIST_URL, {"page_size": 2})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["previous"] is None
+        assert response.data["next"] is not None
+        first_page = [item["id"] for item in response.data["results"]]
+
+        response = api_client.get(response.data["next"])
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["next"] is None
+        second_page = [item["id"] for item in response.data["results"]]
+
+        assert first_page + second_page == [str(obj.id) for obj in created]
+
+    def test_list_services_with_products_uses_fixed_number_of_queries(
+        self,
+        api_client,
+        create_profile,
+        create_service,
+        create_product,
+        add_product_to_service,
+        django_assert_num_queries,
+    ):
+        """
+        Tests that nested product usages are prefetched instead of loaded per
+        service. Two more queries compute the ETag and Last-Modified.
+        """
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+
+        foam = create_product(profile=profile, name="Foam Cleaner", last_purchase_price="25.00")
+        wax = create_product(profile=profile, name="Wax", last_purchase_price="40.00")
+        for _ in range(4):
+            service = create_service(profile=profile)
+            add_product_to_service(service=service, product=foam, quantity=2)
+            add_product_to_service(service=service, product=wax, quantity=1)
+
+        with django_assert_num_queries(4):
+            response = api_client.get(LIST_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["results"]) == 4
+        usages = response.data["results"][0]["products"]
+        assert {usage["product_name"] for usage in usages} == {"Foam Cleaner", "Wax"}
+        assert {usage["unit_cost"] for usage in usages} == {"25.00", "40.00"}
+
+    def test_retrieve_service_with_products_uses_fixed_number_of_queries(
+        self,
+        api_client,
+        create_profile,
+        create_service,
+        create_product,
+        add_product_to_service,
+        django_assert_num_queries,
+    ):
+        """
+        Tests that retrieving a service loads its product usages in one query.
+        Two more queries compute the ETag and Last-Modified.
+        """
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+
+        service = create_service(profile=profile)
+        for name in ("Foam Cleaner", "Wax", "Tire Shine"):
+            add_product_to_service(
+                service=service, product=create_product(profile=profile, name=name)
+            )
+
+        with django_assert_num_queries(4):
+            response = api_client.get(RETRIEVE_URL.format(service.id))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["products"]) == 3
+        assert response.data["products"][0]["quantity"] == "1.00"
+
+    def test_list_services_exposes_costs(
+        self,
+        api_client,
+        create_profile,
+        create_service,
+        create_product,
+        add_product_to_service,
+    ):
+        """Tests that the listing carries material cost, price and margin."""
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+        service = create_service(profile=profile)
+        add_product_to_service(
+            service=service,
+            product=create_product(profile=profile, last_purchase_price="2.50"),
+            quantity=4,
+        )
+
+        response = api_client.get(LIST_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        result = response.data["results"][0]
+        assert result["material_cost"] == "10.00"
+        assert result["estimated_price"] == "150.00"
+        assert result["margin"] == "140.00"
 
     def test_retrieve_service(self, api_client, create_profile, create_service):
         """Tests the retrieval of a specific service."""
@@ -184,6 +300,9 @@ class TestServiceView:
 
         response = api_client.get(RETRIEVE_URL.format(service.id))
         assert response.status_code == status.HTTP_404_NOT_FOUND
+        service.refresh_from_db()
+        assert service.is_deleted
+        assert service.deleted_at is not None
 
     def test_create_service_with_invalid_data(
         self, api_client, create_profile, create_product
@@ -258,3 +377,154 @@ class TestServiceView:
         data = {"name": "Should Not Work"}
         response = api_client.patch(UPDATE_URL.format(service.id), data)
         assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestServiceExportView:
+    def test_export_csv(self, api_client, create_user, create_profile, create_service):
+        """Tests that the services are streamed as CSV, oldest first."""
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+        first = create_service(profile=profile)
+        second = create_service(profile=profile)
+        create_service(profile=create_profile(user=create_user(username="other")))
+
+        response = api_client.get("/api/services/export/csv/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        assert response["Content-Disposition"] == 'attachment; filename="services.csv"'
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        assert lines[0].split(",")[0] == "id"
+        assert [line.split(",")[0] for line in lines[1:]] == [str(first.id), str(second.id)]
+
+    def test_export_ndjson(self, api_client, create_profile, create_service):
+        """Tests that the services are streamed as one JSON object per line."""
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+        obj = create_service(profile=profile)
+
+        response = api_client.get("/api/services/export/ndjson/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/x-ndjson"
+        rows = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+        assert len(rows) == 1
+        assert rows[0]["id"] == str(obj.id)
+        assert rows[0]["name"] == "Interior Cleaning"
+
+    def test_export_requires_authentication(self, api_client):
+        """Tests that anonymous users cannot export."""
+        response = api_client.get("/api/services/export/csv/")
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+class TestServiceCatalogCache:
+
+    def test_repeated_list_skips_database(
+        self, api_client, create_service, django_assert_num_queries
+    ):
+        service = create_service()
+        api_client.force_authenticate(user=service.user.user)
+        first = api_client.get(LIST_URL)
+
+        with django_assert_num_queries(0):
+            second = api_client.get(LIST_URL)
+
+        assert second.data == first.data
+
+    def test_service_changes_invalidate(self, api_client, create_service):
+        service = create_service()
+        api_client.force_authenticate(user=service.user.user)
+        api_client.get(LIST_URL)
+
+        api_client.patch(UPDATE_URL.format(service.id), {"name": "Polish"}, format="json")
+        assert api_client.get(LIST_URL).data["results"][0]["name"] == "Polish"
+
+        api_client.delete(DELETE_URL.format(service.id))
+        assert api_client.get(LIST_URL).data["results"] == []
+
+    def test_product_changes_invalidate(
+        self, api_client, create_service, create_product, add_product_to_service
+    ):
+        service = create_service()
+        product = create_product(profile=service.user)
+        add_product_to_service(service, product, quantity=2)
+        api_client.force_authenticate(user=service.user.user)
+        assert api_client.get(LIST_URL).data["results"][0]["material_cost"] == "100.00"
+
+        product.last_purchase_price = Decimal("60.00")
+        product.save()
+
+        result = api_client.get(LIST_URL).data["results"][0]
+        assert result["material_cost"] == "120.00"
+        assert result["products"][0]["unit_cost"] == "60.00"
+
+
+@pytest.mark.django_db
+class TestServiceConditionalGet:
+
+    def test_unchanged_service_is_not_modified(self, api_client, create_service):
+        service = create_service()
+        api_client.force_authenticate(user=service.user.user)
+        etag = api_client.get(RETRIEVE_URL.format(service.id))["ETag"]
+
+        response = api_client.get(RETRIEVE_URL.format(service.id), HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_product_rename_changes_etag(
+        self, api_client, create_service, create_product, add_product_to_service
+    ):
+        service = create_service()
+        product = create_product(profile=service.user)
+        add_product_to_service(service, product)
+        api_client.force_authenticate(user=service.user.user)
+        etag = api_client.get(LIST_URL)["ETag"]
+        cache.clear()
+
+        product.name = "Premium Shampoo"
+        product.save()
+        response = api_client.get(LIST_URL, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["results"][0]["products"][0]["product_name"] == "Premium Shampoo"
+
+
+@pytest.mark.django_db
+class TestServiceSearch:
+
+    def test_search_by_name_or_description(self, api_client, create_service):
+        service = create_service()
+        api_client.force_authenticate(user=service.user.user)
+
+        def search(term):
+            return [item["id"] for item in api_client.get(LIST_URL, {"search": term}).data["results"]]
+
+        assert search("interior") == [str(service.id)]
+        assert search("full interior") == [str(service.id)]
+        assert search("polish") == []
+
+
+@pytest.mark.django_db
+class TestServiceAsyncView:
+
+    def test_list_and_retrieve_match_sync_endpoint(self, api_client, create_service, create_product):
+        service = create_service()
+        product = create_product(profile=service.user, name="Premium Shampoo")
+        ServiceProduct.objects.create(
+            user=service.user, service=service, product=product, quantity=Decimal("2.00")
+        )
+        api_client.force_login(service.user.user)
+
+        sync_item = json.loads(json.dumps(api_client.get(RETRIEVE_URL.format(service.id)).data))
+        response = api_client.get(ASYNC_LIST_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["results"] == [sync_item]
+        assert api_client.get(ASYNC_RETRIEVE_URL.format(service.id)).json() == sync_item
+        assert sync_item["products"][0]["product_name"] == "Premium Shampoo"
+
+    def test_requires_authentication(self, api_client):
+        assert api_client.get(ASYNC_LIST_URL).status_code == status.HTTP_403_FORBIDDEN
@@ -1,33 +1,65 @@
+from django.utils import timezone
 from rest_framework import viewsets, status
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 
-from authentication.models import Profile
-
+from auto_care import catalog_cache
+from auto_care.async_views import AsyncReadView
+from auto_care.catalog_cache import CatalogCacheMixin
+from auto_care.conditional import ConditionalGetMixin
+from auto_care.exports import ExportMixin
+from products.models import Product
 from services.models import Service
 from services.serializers import ServiceSerializer
 
 
-class ServiceViewSet(viewsets.ModelViewSet):
+class ServiceViewSet(CatalogCacheMixin, ConditionalGetMixin, ExportMixin, viewsets.ModelViewSet):
     """Handles CRUD operations for Services."""
 
+    catalog_namespace = catalog_cache.SERVICES
+    search_fields = ("name", "description")
     queryset = Service.objects.all()
     serializer_class = ServiceSerializer
     permission_classes = [IsAuthenticated]
+    export_filename = "services"
+    export_fields = (
+        "id",
+        "name",
+        "description",
+        "pricing_type",
+        "base_price",
+        "estimated_time",
+        "created_at",
+        "updated_at",
+    )
 
     def perform_create(self, serializer):
-        profile = Profile.objects.get(user=self.request.user)
-        serializer.save(user=profile)
+        serializer.save(user=self.request.user.profile)
 
     def perform_update(self, serializer):
-        profile = Profile.objects.get(user=self.request.user)
-        serializer.save(user=profile)
+        serializer.save(user=self.request.user.profile)
 
     def get_queryset(self):
-        return Service.objects.filter(is_deleted=False, user=self.request.user.profile)
+        return Service.objects.filter(
+            is_deleted=False, user=self.request.user.profile
+        ).with_products().with_costs()
+
+    def get_conditional_dependencies(self):
+        # The payload embeds product names and costs.
+        return [Product.objects.filter(user=self.request.user.profile)]
 
     def destroy(self, request, *args, **kwargs):
         service = self.get_object()
         service.is_deleted = True
+        service.deleted_at = timezone.now()
         service.save()
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class ServiceAsyncView(AsyncReadView):
+    """Async list and retrieve of the profile's services."""
+
+    serializer_class = ServiceSerializer
+
+    def get_queryset(self, profile):
+        return Service.objects.filter(is_deleted=False, user=profile).with_products().with_costs()
@@ -0,0 +1,127 @@
+"""
+Delta sync of the catalogs.
+
+Each resource is read in ``(updated_at, id)`` order from the position
+reached by the previous sync, on the ``(user, updated_at, id)`` indexes, so
+the work done by a sync is proportional to what changed since then rather
+than to the size of the catalogs. Soft-deleted rows are returned as
+tombstones carrying their deletion time.
+
+Rows updated during the last ``SYNC_SETTLE_SECONDS`` are left for the next
+sync: ``updated_at`` is set before the writing transaction commits, so a
+recent row may still be invisible and skipping past its position would
+lose it.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.core import signing
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework import serializers
+
+from clients.models import Client
+from clients.serializers import ClientSerializer
+from products.models import Product
+from products.serializers import ProductSerializer
+from services.models import Service
+from services.serializers import ServiceSerializer
+
+CURSOR_SALT = "sync.cursor"
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+def _products(profile):
+    return Product.objects.filter(user=profile)
+
+
+def _services(profile):
+    return Service.objects.filter(user=profile).with_products().with_costs()
+
+
+def _clients(profile):
+    return Client.objects.filter(user=profile)
+
+
+RESOURCES = {
+    "products": (_products, ProductSerializer),
+    "services": (_services, ServiceSerializer),
+    "clients": (_clients, ClientSerializer),
+}
+
+
+def encode_cursor(positions):
+    return signing.dumps(positions, salt=CURSOR_SALT, compress=True)
+
+
+def decode_cursor(value):
+    """
+    Returns the ``{resource: [updated_at, id]}`` positions of a cursor. A
+    plain ISO 8601 timestamp is accepted as well and starts every resource
+    right after that moment.
+    """
+    if not value:
+        return {}
+    try:
+        moment = parse_datetime(value.replace(" ", "+"))
+    except ValueError:
+        raise InvalidCursor("Invalid sync timestamp.")
+    if moment is not None:
+        if timezone.is_naive(moment):
+            moment = timezone.make_aware(moment)
+        return {name: [moment.isoformat(), None] for name in RESOURCES}
+    try:
+        return signing.loads(value, salt=CURSOR_SALT)
+    except signing.BadSignature:
+        raise InvalidCursor("Invalid sync cursor.")
+
+
+def _after(position):
+    updated_at, pk = position
+    updated_at = parse_datetime(updated_at)
+    if pk is None:
+        return Q(updated_at__gt=updated_at)
+    return Q(updated_at__gt=updated_at) | Q(updated_at=updated_at, id__gt=pk)
+
+
+def _tombstone(row, datetime_field=serializers.DateTimeField()):
+    return {
+        "id": str(row.pk),
+        "deleted_at": datetime_field.to_representation(row.deleted_at or row.updated_at),
+    }
+
+
+def collect_changes(profile, positions, limit, context=None):
+    """
+    Returns ``(payload, positions, has_more)``: up to ``limit`` changed rows
+    of every resource after ``positions``, the positions reached, and
+    whether any resource has more changes waiting.
+    """
+    horizon = timezone.now() - timedelta(seconds=settings.SYNC_SETTLE_SECONDS)
+    payload = {}
+    reached = dict(positions)
+    has_more = False
+
+    for name, (get_queryset, serializer_class) in RESOURCES.items():
+        queryset = get_queryset(profile).filter(updated_at__lte=horizon)
+        if positions.get(name):
+            queryset = queryset.filter(_after(positions[name]))
+        rows = list(queryset.order_by("updated_at", "id")[:limit + 1])
+        if len(rows) > limit:
+            has_more = True
+            rows = rows[:limit]
+
+        payload[name] = {
+            "updated": serializer_class(
+                [row for row in rows if not row.is_deleted], many=True, context=context
+            ).data,
+            "deleted": [_tombstone(row) for row in rows if row.is_deleted],
+        }
+        if rows:
+            reached[name] = [rows[-1].updated_at.isoformat(), str(rows[-1].pk)]
+
+    return payload, reached, has_more
@@ -0,0 +1,13 @@
+from rest_framework import serializers
+
+DEFAULT_LIMIT = 500
+MAX_LIMIT = 2000
+
+
+class SyncQuerySerializer(serializers.Serializer):
+    """Validates the query parameters of the sync endpoint."""
+
+    since = serializers.CharField(required=False, allow_blank=True)
+    limit = serializers.IntegerField(
+        required=False, default=DEFAULT_LIMIT, min_value=1, max_value=MAX_LIMIT
+    )
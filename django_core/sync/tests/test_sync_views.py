@@ -0,0 +1,170 @@
+import pytest
+from datetime import timedelta
+from django.db import connection
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.fields import DateTimeField
+from clients.models import Client
+from products.models import Product
+from sync.changes import _after, _products
+
+SYNC_URL = "/api/sync/"
+
+
+def ids(payload, resource, kind="updated"):
+    return [item["id"] for item in payload[resource][kind]]
+
+
+@pytest.mark.django_db
+class TestSyncView:
+
+    def test_first_sync_returns_everything(
+        self, api_client, create_profile, create_product, create_service, create_client
+    ):
+        profile = create_profile()
+        product = create_product(profile=profile)
+        service = create_service(profile=profile)
+        client = create_client(profile=profile)
+        api_client.force_authenticate(user=profile.user)
+
+        response = api_client.get(SYNC_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["has_more"] is False
+        assert ids(response.data, "products") == [str(product.id)]
+        assert ids(response.data, "services") == [str(service.id)]
+        assert ids(response.data, "clients") == [str(client.id)]
+        assert response.data["services"]["updated"][0]["margin"] is not None
+
+    def test_sync_returns_only_changes_since_cursor(
+        self, api_client, create_profile, create_product, create_client
+    ):
+        profile = create_profile()
+        create_product(profile=profile)
+        client = create_client(profile=profile)
+        api_client.force_authenticate(user=profile.user)
+        cursor = api_client.get(SYNC_URL).data["cursor"]
+
+        new_product = create_product(profile=profile, name="Wax")
+        client.full_name = "Jane Doe"
+        client.save()
+        response = api_client.get(SYNC_URL, {"since": cursor})
+
+        assert ids(response.data, "products") == [str(new_product.id)]
+        assert ids(response.data, "clients") == [str(client.id)]
+        assert response.data["services"] == {"updated": [], "deleted": []}
+
+        response = api_client.get(SYNC_URL, {"since": response.data["cursor"]})
+        assert ids(response.data, "products") == []
+        assert ids(response.data, "clients") == []
+
+    def test_deletions_are_tombstones(self, api_client, create_profile, create_client):
+        profile = create_profile()
+        client = create_client(profile=profile)
+        api_client.force_authenticate(user=profile.user)
+        cursor = api_client.get(SYNC_URL).data["cursor"]
+
+        api_client.delete(f"/api/clients/{client.id}/")
+        response = api_client.get(SYNC_URL, {"since": cursor})
+
+        client.refresh_from_db()
+        assert response.data["clients"]["updated"] == []
+        assert response.data["clients"]["deleted"] == [
+            {"id": str(client.id), "deleted_at": DateTimeField().to_representation(client.deleted_at)}
+        ]
+
+    def test_changes_are_paged_by_limit(self, api_client, create_profile, create_product):
+        profile = create_profile()
+        products = [create_product(profile=profile, name=f"P{index}") for index in range(5)]
+        api_client.force_authenticate(user=profile.user)
+
+        seen = []
+        cursor = ""
+        has_more = True
+        while has_more:
+            response = api_client.get(SYNC_URL, {"since": cursor, "limit": 2})
+            seen += ids(response.data, "products")
+            cursor, has_more = response.data["cursor"], response.data["has_more"]
+
+        assert seen == [str(product.id) for product in products]
+
+    def test_rows_sharing_a_timestamp_are_not_skipped(
+        self, api_client, create_profile, create_product
+    ):
+        profile = create_profile()
+        products = [create_product(profile=profile, name=f"P{index}") for index in range(3)]
+        Product.objects.update(updated_at=timezone.now() - timedelta(minutes=1))
+        api_client.force_authenticate(user=profile.user)
+
+        first = api_client.get(SYNC_URL, {"limit": 2})
+        second = api_client.get(SYNC_URL, {"since": first.data["cursor"], "limit": 2})
+
+        assert sorted(ids(first.data, "products") + ids(second.data, "products")) == sorted(
+            str(product.id) for product in products
+        )
+
+    def test_since_accepts_timestamp(self, api_client, create_profile, create_client):
+        profile = create_profile()
+        old = create_client(profile=profile)
+        Client.objects.filter(pk=old.pk).update(updated_at=timezone.now() - timedelta(days=2))
+        recent = create_client(profile=profile)
+        api_client.force_authenticate(user=profile.user)
+
+        response = api_client.get(
+            SYNC_URL, {"since": (timezone.now() - timedelta(days=1)).isoformat()}
+        )
+
+        assert ids(response.data, "clients") == [str(recent.id)]
+
+    def test_recent_rows_wait_for_the_settle_delay(
+        self, api_client, settings, create_profile, create_client
+    ):
+        settings.SYNC_SETTLE_SECONDS = 60
+        profile = create_profile()
+        create_client(profile=profile)
+        api_client.force_authenticate(user=profile.user)
+
+        response = api_client.get(SYNC_URL)
+
+        assert ids(response.data, "clients") == []
+
+    def test_other_profiles_are_not_synced(
+        self, api_client, create_user, create_profile, create_client
+    ):
+        create_client(profile=create_profile(user=create_user(username="other")))
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+
+        assert ids(api_client.get(SYNC_URL).data, "clients") == []
+
+    def test_invalid_cursor(self, api_client, create_profile):
+        profile = create_profile()
+        api_client.force_authenticate(user=profile.user)
+
+        response = api_client.get(SYNC_URL, {"since": "garbage"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_requires_authentication(self, api_client):
+        assert api_client.get(SYNC_URL).status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+class TestSyncIndexes:
+
+    @pytest.fixture(autouse=True)
+    def require_sqlite(self):
+        if connection.vendor != "sqlite":
+            pytest.skip("Query plan assertions are written for SQLite.")
+
+    def test_changes_query_uses_index(self, create_profile, create_product):
+        profile = create_profile()
+        product = create_product(profile=profile)
+
+        queryset = _products(profile).filter(
+            _after([product.updated_at.isoformat(), str(product.pk)])
+        ).order_by("updated_at", "id")[:10]
+        plan = queryset.explain()
+
+        assert "product_user_changes_idx" in plan
+        assert "TEMP B-TREE" not in plan
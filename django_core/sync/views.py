@@ -0,0 +1,39 @@
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from sync.changes import InvalidCursor, collect_changes, decode_cursor, encode_cursor
+from sync.serializers import SyncQuerySerializer
+
+
+class SyncView(APIView):
+    """
+    Returns the products, services and clients created, updated or deleted
+    since ``since``, a cursor returned by a previous sync or an ISO 8601
+    timestamp, and a new ``cursor``. Without ``since`` everything is
+    returned. While ``has_more`` is true the client should call again with
+    the new cursor right away.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        query = SyncQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        try:
+            positions = decode_cursor(query.validated_data.get("since"))
+        except InvalidCursor as exc:
+            return Response({"since": [str(exc)]}, status=status.HTTP_400_BAD_REQUEST)
+
+        payload, positions, has_more = collect_changes(
+            request.user.profile,
+            positions,
+            query.validated_data["limit"],
+            context={"request": request},
+        )
+        return Response({
+            "cursor": encode_cursor(positions),
+            "has_more": has_more,
+            **payload,
+        })
@@ -16,4 +16,29 @@ echo "✅ PostgreSQL disponível em $POSTGRES_HOST:$POSTGRES_PORT"
 python manage.py collectstatic --noinput
 python manage.py makemigrations --noinput
 python manage.py migrate --noinput
-python manage.py runserver 0.0.0.0:8000
+
+# SERVER_MODE selects how the API is served:
+#   dev  - Django development server (default)
+#   wsgi - gunicorn with sync or gthread workers on auto_care.wsgi
+#   asgi - gunicorn with uvicorn workers on auto_care.asgi
+# Worker count, threads and keep-alive are read by gunicorn.conf.py.
+SERVER_MODE=${SERVER_MODE:-dev}
+
+case "$SERVER_MODE" in
+  wsgi)
+    echo "🚀 Iniciando gunicorn (WSGI, ${GUNICORN_WORKER_CLASS:-gthread})"
+    exec gunicorn auto_care.wsgi:application -c gunicorn.conf.py
+    ;;
+  asgi)
+    echo "🚀 Iniciando gunicorn (ASGI, uvicorn)"
+    # Persistent connections default to off under ASGI, see DB_POOL.
+    exec env GUNICORN_WORKER_CLASS=uvicorn SERVER_MODE=asgi gunicorn auto_care.asgi:application -c gunicorn.conf.py
+    ;;
+  dev)
+    exec python manage.py runserver 0.0.0.0:8000
+    ;;
+  *)
+    echo "❌ SERVER_MODE inválido: $SERVER_MODE (use dev, wsgi ou asgi)"
+    exit 1
+    ;;
+esac
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Small HTTP load generator for comparing serving modes (SERVER_MODE=dev,
+wsgi or asgi in scripts/commands.sh). Standard library only.
+
+Each of --concurrency threads logs in once, then requests the given paths
+in turn over its own keep-alive connection for --duration seconds. The
+throughput and latency percentiles are printed at the end, e.g.:
+
+    # SERVER_MODE="dev" in dotenv_files/.env, docker-compose up, then:
+    python scripts/loadtest.py --username john --password secret --label dev
+    # SERVER_MODE="wsgi" in dotenv_files/.env, recreate the container, then:
+    python scripts/loadtest.py --username john --password secret --label wsgi
+"""
+import argparse
+import http.client
+import json
+import statistics
+import threading
+import time
+from http.cookies import SimpleCookie
+from urllib.parse import urlsplit
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument(
+        "--path",
+        action="append",
+        dest="paths",
+        help="Path to request, may be repeated (default: the catalog endpoints).",
+    )
+    parser.add_argument("--username", help="Log in as this user before requesting.")
+    parser.add_argument("--password")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=30, help="Seconds.")
+    parser.add_argument("--label", default="", help="Printed with the results.")
+    return parser.parse_args()
+
+
+class Worker(threading.Thread):
+
+    def __init__(self, options, deadline):
+        super().__init__(daemon=True)
+        self.options = options
+        self.deadline = deadline
+        self.latencies = []
+        self.errors = 0
+        self.cookie = ""
+        url = urlsplit(options.base_url)
+        connection_class = (
+            http.client.HTTPSConnection if url.scheme == "https" else http.client.HTTPConnection
+        )
+        self.connection = connection_class(url.hostname, url.port, timeout=30)
+
+    def request(self, method, path, body=None):
+        headers = {"Accept": "application/json", "Connection": "keep-alive"}
+        if self.cookie:
+            headers["Cookie"] = self.cookie
+        if body is not None:
+            body = json.dumps(body)
+            headers["Content-Type"] = "application/json"
+        # A second attempt covers keep-alive connections closed by the server.
+        for _ in range(2):
+            try:
+                self.connection.request(method, path, body=body, headers=headers)
+                response = self.connection.getresponse()
+                response.read()
+                return response
+            except (OSError, http.client.HTTPException):
+                self.connection.close()
+        return None
+
+    def login(self):
+        response = self.request(
+            "POST",
+            "/api/auth/login",
+            {"username": self.options.username, "password": self.options.password},
+        )
+        if response is None or response.status != 200:
+            raise SystemExit("Login failed, check --username and --password.")
+        cookie = SimpleCookie()
+        for header in response.headers.get_all("Set-Cookie") or []:
+            cookie.load(header)
+        self.cookie = "; ".join(f"{key}={morsel.value}" for key, morsel in cookie.items())
+
+    def run(self):
+        index = 0
+        while time.monotonic() < self.deadline:
+            path = self.options.paths[index % len(self.options.paths)]
+            index += 1
+            started = time.perf_counter()
+            response = self.request("GET", path)
+            elapsed = time.perf_counter() - started
+            if response is None or response.status >= 400:
+                self.errors += 1
+            else:
+                self.latencies.append(elapsed)
+
+
+def percentile(values, fraction):
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def main():
+    options = parse_args()
+    options.paths = options.paths or ["/api/products/", "/api/services/", "/api/clients/"]
+
+    workers = [Worker(options, 0) for _ in range(options.concurrency)]
+    if options.username:
+        for worker in workers:
+            worker.login()
+
+    started = time.monotonic()
+    for worker in workers:
+        worker.deadline = started + options.duration
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.monotonic() - started
+
+    latencies = sorted(latency for worker in workers for latency in worker.latencies)
+    errors = sum(worker.errors for worker in workers)
+    label = f" [{options.label}]" if options.label else ""
+    print(f"{options.base_url}{label}: {options.concurrency} clients for {elapsed:.1f}s")
+    print(f"  requests  {len(latencies)} ok, {errors} failed")
+    print(f"  throughput {len(latencies) / elapsed:.1f} req/s")
+    if latencies:
+        print(
+            "  latency   "
+            f"p50 {percentile(latencies, 0.50) * 1000:.1f} ms, "
+            f"p95 {percentile(latencies, 0.95) * 1000:.1f} ms, "
+            f"p99 {percentile(latencies, 0.99) * 1000:.1f} ms, "
+            f"mean {statistics.mean(latencies) * 1000:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()